@@ -1,9 +1,79 @@
+import hashlib
 import os
+import re
+import threading
+import zlib
+from collections import OrderedDict, deque
+import numpy as np
+import pandas as pd
 import streamlit as st
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from langchain_groq import ChatGroq
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
+from .llm_cache import LLMResponseCache
+from .single_flight import SingleFlight
+
+GROQ_MODEL_NAME = "llama-3.3-70b-versatile"
+
+# Completions shared across sessions and processes; identical prompts skip the LLM
+llm_cache = LLMResponseCache()
+
+# Identical prompts sent concurrently (e.g. a trending ticker) share one Groq request
+llm_flight = SingleFlight("groq")
+
+_llm_chains = {}
+_llm_chains_lock = threading.Lock()
+
+# Maximum number of article scores remembered by the sentiment memo
+SENTIMENT_MEMO_SIZE = 20000
+
+_sentiment_analyzer = None
+_sentiment_memo = OrderedDict()
+_sentiment_lock = threading.Lock()
+
+def _get_sentiment_analyzer():
+    """Returns the process-wide VADER analyzer, loading its lexicon only once."""
+    global _sentiment_analyzer
+    if _sentiment_analyzer is None:
+        with _sentiment_lock:
+            if _sentiment_analyzer is None:
+                _sentiment_analyzer = SentimentIntensityAnalyzer()
+    return _sentiment_analyzer
+
+def score_articles(articles):
+    """
+    Score many news articles at once with VADER, reusing memoized scores.
+
+    Scores are memoized in a bounded LRU keyed by a hash of the article text, so
+    the same article seen again (e.g. on another page) is not scored twice.
+
+    Args:
+        articles (list): List of news article dictionaries containing title and description
+
+    Returns:
+        list: Compound score per article, or None where the article has no title/description
+    """
+    analyzer = _get_sentiment_analyzer()
+    scores = []
+    for article in articles or []:
+        if not (article and article.get('title') and article.get('description')):
+            scores.append(None)
+            continue
+        text = article['title'] + ". " + article['description']
+        key = hashlib.sha1(text.encode('utf-8')).digest()
+        with _sentiment_lock:
+            score = _sentiment_memo.get(key)
+            if score is not None:
+                _sentiment_memo.move_to_end(key)
+        if score is None:
+            score = analyzer.polarity_scores(text)['compound']
+            with _sentiment_lock:
+                _sentiment_memo[key] = score
+                if len(_sentiment_memo) > SENTIMENT_MEMO_SIZE:
+                    _sentiment_memo.popitem(last=False)
+        scores.append(score)
+    return scores
 
 def analyze_sentiment(articles):
     """
@@ -15,65 +85,358 @@ def analyze_sentiment(articles):
     Returns:
         float: Compound sentiment score between -1 (negative) and 1 (positive)
     """
-    analyzer = SentimentIntensityAnalyzer()
-    sentiment_scores = []
     if not articles:
         return 0.0
-    for article in articles:
-        if article and article.get('title') and article.get('description'):
-            text = article['title'] + ". " + article['description']
-            score = analyzer.polarity_scores(text)
-            sentiment_scores.append(score['compound'])
+    sentiment_scores = [score for score in score_articles(articles) if score is not None]
 
     if not sentiment_scores:
         return 0.0
     return sum(sentiment_scores) / len(sentiment_scores)
 
-def get_ai_summary(articles, ticker, investor_level="Beginner"):
+# --- News compaction before prompt rendering ---
+
+# Approximate token budget for the news section of a summary prompt
+NEWS_TOKEN_BUDGET = 1200
+# Estimated Jaccard similarity above which two articles count as the same story
+DUPLICATE_SIMILARITY = 0.6
+MINHASH_PERMUTATIONS = 64
+
+_MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = np.random.default_rng(1)
+# Multipliers stay below 2**31 so (a * crc32 + b) fits in uint64 without overflow
+_MINHASH_A = _minhash_rng.integers(1, 1 << 31, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_MINHASH_B = _minhash_rng.integers(0, _MINHASH_PRIME, MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+# Running totals of token savings across all prompt builds in this process
+compaction_stats = {'calls': 0, 'tokens_before': 0, 'tokens_after': 0, 'duplicates_removed': 0}
+# Per-call savings of the most recent prompt builds, newest last
+recent_compactions = deque(maxlen=100)
+_compaction_lock = threading.Lock()
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token for English text)."""
+    return max(1, len(text) // 4) if text else 0
+
+def _article_text(article):
+    return f"{article['title']}. {article['description']}"
+
+def _minhash_signature(text, shingle_size=3):
+    """MinHash signature over word shingles, used to estimate Jaccard similarity."""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    shingles = {" ".join(words[i:i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))}
+    hashes = np.array([zlib.crc32(sh.encode('utf-8')) for sh in shingles], dtype=np.uint64)
+    # (a*h + b) mod p for every permutation/shingle pair in one array operation
+    permuted = (_MINHASH_A[:, None] * hashes[None, :] + _MINHASH_B[:, None]) % _MINHASH_PRIME
+    return permuted.min(axis=1)
+
+def compact_articles(articles, ticker, token_budget=NEWS_TOKEN_BUDGET):
     """
-    Generate an AI-powered summary of news articles for a stock.
+    Deduplicate, rank and trim news articles so they fit a prompt token budget.
+
+    Near-duplicate (e.g. syndicated) stories are clustered with MinHash over word
+    shingles and only the best-ranked copy is kept. Articles are ranked by how
+    directly they mention the ticker and by recency relative to the newest
+    article, then packed greedily until the budget is used up.
 
     Args:
         articles (list): List of news article dictionaries
         ticker (str): Stock ticker symbol
-        investor_level (str): Experience level of the investor ("Beginner" or "Advanced")
+        token_budget (int): Approximate number of tokens available for the news text
 
     Returns:
-        str: AI-generated summary of the news articles
+        tuple: (kept articles (list), stats (dict) with token counts before/after)
     """
-    if not articles:
-        return "No news available to generate a summary."
-    news_text = " ".join([f"{article['title']}. {article['description']}" for article in articles if article and article.get('title') and article.get('description')])
-    if not news_text:
-        return "Not enough news content to generate a summary."
+    usable = [a for a in articles or [] if a and a.get('title') and a.get('description')]
+    tokens_before = sum(estimate_tokens(_article_text(a)) for a in usable)
+
+    published = pd.to_datetime([a.get('publishedAt') for a in usable], errors='coerce', utc=True)
+    newest = published.max() if len(usable) else None
+    ticker_pattern = re.compile(rf"\b{re.escape(ticker.lower())}\b") if ticker else None
+
+    def score(i):
+        article = usable[i]
+        relevance = 0.0
+        if ticker_pattern:
+            relevance += 1.0 if ticker_pattern.search(article['title'].lower()) else 0.0
+            relevance += 0.5 if ticker_pattern.search(article['description'].lower()) else 0.0
+        recency = 0.0
+        if newest is not None and not pd.isna(published[i]):
+            age_days = (newest - published[i]).total_seconds() / 86400
+            recency = float(np.exp(-age_days / 3))
+        # Earlier positions in NewsAPI's relevancy ordering break ties
+        return relevance + recency - i * 1e-3
+
+    kept, signatures, duplicates, used_tokens = [], [], 0, 0
+    for i in sorted(range(len(usable)), key=score, reverse=True):
+        article = usable[i]
+        signature = _minhash_signature(_article_text(article))
+        if any(np.mean(signature == other) >= DUPLICATE_SIMILARITY for other in signatures):
+            duplicates += 1
+            continue
+        signatures.append(signature)
+        tokens = estimate_tokens(_article_text(article))
+        if used_tokens + tokens > token_budget and kept:
+            continue
+        kept.append(article)
+        used_tokens += tokens
+
+    return kept, _compaction_summary(len(usable), len(kept), duplicates, tokens_before, used_tokens)
+
+def _compaction_summary(articles_in, articles_kept, duplicates, tokens_before, tokens_after):
+    return {
+        'articles_in': articles_in,
+        'articles_kept': articles_kept,
+        'duplicates_removed': duplicates,
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'tokens_saved': tokens_before - tokens_after,
+    }
+
+def distinct_headlines(articles, limit=5):
+    """
+    Picks up to `limit` article titles in their original order, skipping near-duplicate headlines.
+
+    Only titles are compared, so articles without a description still count.
+
+    Returns:
+        tuple: (headlines (list), stats (dict) with token counts of all titles before and the kept ones after)
+    """
+    titles = [article['title'] for article in articles or [] if article and article.get('title')]
+    headlines, signatures, duplicates = [], [], 0
+    for title in titles:
+        if len(headlines) == limit:
+            break
+        signature = _minhash_signature(title)
+        if any(np.mean(signature == other) >= DUPLICATE_SIMILARITY for other in signatures):
+            duplicates += 1
+            continue
+        signatures.append(signature)
+        headlines.append(title)
+    tokens_before = sum(estimate_tokens(title) for title in titles)
+    tokens_after = sum(estimate_tokens(title) for title in headlines)
+    return headlines, _compaction_summary(len(titles), len(headlines), duplicates, tokens_before, tokens_after)
+
+def _record_compaction(prompt, subject, stats):
+    """Adds one prompt build's savings to the running totals and the recent per-call list."""
+    with _compaction_lock:
+        compaction_stats['calls'] += 1
+        compaction_stats['tokens_before'] += stats['tokens_before']
+        compaction_stats['tokens_after'] += stats['tokens_after']
+        compaction_stats['duplicates_removed'] += stats['duplicates_removed']
+        recent_compactions.append({'prompt': prompt, 'subject': subject, **stats})
+
+def get_compaction_stats():
+    """
+    Returns news-compaction token savings.
+
+    Returns:
+        dict: Running totals ('calls', 'tokens_before', 'tokens_after', 'duplicates_removed')
+            plus 'recent', the per-call stats of the latest prompt builds (newest last)
+    """
+    with _compaction_lock:
+        return {**compaction_stats, 'recent': list(recent_compactions)}
+
+def _get_llm_chain(template, input_variables, temperature, api_key):
+    """Returns a reusable LLMChain for a prompt template, creating the ChatGroq client once."""
+    key = (template, temperature, api_key)
+    with _llm_chains_lock:
+        if key not in _llm_chains:
+            llm = ChatGroq(temperature=temperature, model_name=GROQ_MODEL_NAME, api_key=api_key)
+            prompt = PromptTemplate(template=template, input_variables=input_variables)
+            _llm_chains[key] = LLMChain(prompt=prompt, llm=llm)
+        return _llm_chains[key]
+
+def _run_llm_chain(template, variables, temperature, api_key):
+    """
+    Renders a prompt and returns the LLM's completion, using the response cache.
+
+    Returns:
+        str: Completion text, or None if the model returned nothing
+    """
+    rendered_prompt = PromptTemplate(template=template, input_variables=list(variables)).format(**variables)
+    cached = llm_cache.get(GROQ_MODEL_NAME, temperature, rendered_prompt)
+    if cached is not None:
+        return cached
+    key = llm_cache.make_key(GROQ_MODEL_NAME, temperature, rendered_prompt)
+    return llm_flight.do(key, _invoke_and_cache, template, variables, temperature, api_key, rendered_prompt)
+
+def _invoke_and_cache(template, variables, temperature, api_key, rendered_prompt):
+    chain = _get_llm_chain(template, list(variables), temperature, api_key)
+    text = chain.invoke(variables).get('text')
+    if text:
+        llm_cache.set(GROQ_MODEL_NAME, temperature, rendered_prompt, text)
+    return text
+
+def _model_id(llm):
+    """Name a chat model is cached under: its model name if it has one, else its class name."""
+    return getattr(llm, 'model_name', None) or getattr(llm, 'model', None) or type(llm).__name__
+
+def _stream_llm_chain(template, variables, temperature, api_key, llm=None, cache=None):
+    """
+    Renders a prompt and yields the completion chunk by chunk.
+
+    A cached completion is yielded in one piece; a fresh one is written to the
+    cache once the stream finishes, under the same key _run_llm_chain uses.
+    Entries are keyed by model, so an injected `llm` (e.g. a fake chat model in
+    a test) reads and writes its own entries and never GROQ_MODEL_NAME's.
 
-    # Get API key from environment
+    Args:
+        llm: Chat model to stream from; defaults to the shared ChatGroq client
+        cache (LLMResponseCache): Defaults to the shared llm_cache
+    """
+    cache = cache or llm_cache
+    model = GROQ_MODEL_NAME if llm is None else _model_id(llm)
+    rendered_prompt = PromptTemplate(template=template, input_variables=list(variables)).format(**variables)
+    cached = cache.get(model, temperature, rendered_prompt)
+    if cached is not None:
+        yield cached
+        return
+
+    if llm is None:
+        key = cache.make_key(model, temperature, rendered_prompt)
+        if cache is llm_cache and llm_flight.in_flight(key):
+            # A blocking request for the same prompt is already running; share its result
+            yield llm_flight.do(key, _invoke_and_cache, template, variables, temperature, api_key, rendered_prompt)
+            return
+        llm = _get_llm_chain(template, list(variables), temperature, api_key).llm
+    parts = []
+    for chunk in llm.stream(rendered_prompt):
+        if chunk.content:
+            parts.append(chunk.content)
+            yield chunk.content
+    if parts:
+        cache.set(model, temperature, rendered_prompt, "".join(parts))
+
+def _get_groq_api_key():
+    """Returns the Groq API key from Streamlit secrets or the environment."""
     if 'GROQ_API_KEY' in st.secrets:
-        api_key = st.secrets['GROQ_API_KEY']
-    else:
-        api_key = os.getenv("GROQ_API_KEY")
+        return st.secrets['GROQ_API_KEY']
+    return os.getenv("GROQ_API_KEY")
+
+def run_llm_prompt(template, variables, temperature=0):
+    """
+    Runs a prompt template through the shared Groq client, response cache and single-flight group.
+
+    Args:
+        template (str): Prompt template with {placeholders}
+        variables (dict): Values for the placeholders
+        temperature (float): Sampling temperature
+
+    Returns:
+        str: Completion text, or None if the model returned nothing
 
+    Raises:
+        RuntimeError: If no Groq API key is configured
+    """
+    api_key = _get_groq_api_key()
     if not api_key:
-        return "Error: GROQ_API_KEY not found. Please configure your secrets."
+        raise RuntimeError("GROQ_API_KEY not found. Please configure your secrets.")
+    return _run_llm_chain(template, variables, temperature, api_key)
+
+def _build_summary_prompt(articles, ticker, investor_level):
+    """
+    Builds the news summary prompt and records how many tokens compaction saved.
 
-    # CORRECTED: Updated to the current model name
-    llm = ChatGroq(temperature=0, model_name="llama-3.3-70b-versatile", api_key=api_key)
+    Returns:
+        tuple: (template, variables, compaction stats), or (None, message, None) if there is no usable news
+    """
+    if not articles:
+        return None, "No news available to generate a summary.", None
+    articles, stats = compact_articles(articles, ticker)
+    _record_compaction("summary", ticker, stats)
+    news_text = " ".join([_article_text(article) for article in articles])
+    if not news_text:
+        return None, "Not enough news content to generate a summary.", None
 
     # Customize prompt based on investor experience level
     if investor_level == "Beginner":
         template = """You are a friendly financial assistant. Based on the following news about {ticker}, provide a simple, easy-to-understand summary for a complete beginner. Explain if the news sounds generally positive or negative and why, avoiding complex jargon. News Articles: "{news_text}" Your simple summary:"""
     else:
         template = """You are an expert financial analyst. Analyze the following news articles for {ticker}. Provide a concise, data-driven summary highlighting key market-moving information. Present a brief "Bull Case" (reasons to be optimistic) and "Bear Case" (reasons to be cautious). News Articles: "{news_text}" Your expert analysis:"""
+    return template, {"ticker": ticker, "news_text": news_text}, stats
+
+def _build_comparison_prompt(data1, data2, investor_level):
+    """
+    Builds the two-stock comparison prompt and records how many tokens headline deduplication saved.
+
+    Returns:
+        tuple: (template, variables, compaction stats), or (None, message, None) if there is no usable news
+    """
+    ticker1, news1 = data1['ticker'], data1['news']
+    ticker2, news2 = data2['ticker'], data2['news']
+    # Skip syndicated copies so the five headlines per stock are distinct stories
+    headlines1, stats1 = distinct_headlines(news1)
+    headlines2, stats2 = distinct_headlines(news2)
+    stats = {key: stats1[key] + stats2[key] for key in stats1}
+    _record_compaction("comparison", f"{ticker1} vs {ticker2}", stats)
+    news_text1 = " ".join(headlines1)
+    news_text2 = " ".join(headlines2)
 
-    prompt = PromptTemplate(template=template, input_variables=["ticker", "news_text"])
-    llm_chain = LLMChain(prompt=prompt, llm=llm)
+    if not news_text1 and not news_text2:
+        return None, "Not enough news content for either stock to generate a comparison.", None
+
+    # Customize prompt based on investor experience level
+    if investor_level == "Beginner":
+        template = """You are a helpful financial guide. Compare two stocks, {ticker1} and {ticker2}, for a beginner. Based on their latest news, explain which one seems to have more positive news and why. Keep it simple. News for {ticker1}: "{news_text1}" News for {ticker2}: "{news_text2}" Your simple comparison:"""
+    else:
+        template = """You are a professional financial analyst. Conduct a comparative analysis of {ticker1} versus {ticker2}. Based on the news headlines, identify key themes affecting each company. Conclude with which stock appears to have stronger short-term sentiment and present a potential risk for each. Recent News for {ticker1}: "{news_text1}" Recent News for {ticker2}: "{news_text2}" Your expert comparison:"""
+    return template, {"ticker1": ticker1, "ticker2": ticker2, "news_text1": news_text1, "news_text2": news_text2}, stats
+
+def get_ai_summary(articles, ticker, investor_level="Beginner"):
+    """
+    Generate an AI-powered summary of news articles for a stock.
+
+    Args:
+        articles (list): List of news article dictionaries
+        ticker (str): Stock ticker symbol
+        investor_level (str): Experience level of the investor ("Beginner" or "Advanced")
+
+    Returns:
+        str: AI-generated summary of the news articles
+    """
+    template, variables, _ = _build_summary_prompt(articles, ticker, investor_level)
+    if template is None:
+        return variables
+
+    api_key = _get_groq_api_key()
+    if not api_key:
+        return "Error: GROQ_API_KEY not found. Please configure your secrets."
 
     try:
-        response = llm_chain.invoke({"ticker": ticker, "news_text": news_text})
-        return response.get('text', "AI summary could not be generated.")
+        text = _run_llm_chain(template, variables, 0, api_key)
+        return text or "AI summary could not be generated."
     except Exception as e:
         return f"Error generating AI summary: {e}"
 
+def stream_ai_summary(articles, ticker, investor_level="Beginner", llm=None, cache=None):
+    """
+    Streaming variant of get_ai_summary that yields the summary as it is generated.
+
+    Args:
+        articles (list): List of news article dictionaries
+        ticker (str): Stock ticker symbol
+        investor_level (str): Experience level of the investor ("Beginner" or "Advanced")
+        llm: Optional chat model to use instead of ChatGroq (e.g. a fake model in tests); cached under its own model name
+        cache (LLMResponseCache): Optional response cache to use instead of the shared one
+
+    Yields:
+        str: Chunks of the AI-generated summary
+    """
+    template, variables, _ = _build_summary_prompt(articles, ticker, investor_level)
+    if template is None:
+        yield variables
+        return
+
+    api_key = _get_groq_api_key() if llm is None else None
+    if llm is None and not api_key:
+        yield "Error: GROQ_API_KEY not found. Please configure your secrets."
+        return
+
+    try:
+        yield from _stream_llm_chain(template, variables, 0, api_key, llm, cache)
+    except Exception as e:
+        yield f"Error generating AI summary: {e}"
+
 def get_ai_comparison(data1, data2, investor_level="Beginner"):
     """
     Generate a comparative analysis of two stocks based on their news.
@@ -86,40 +449,48 @@ def get_ai_comparison(data1, data2, investor_level="Beginner"):
     Returns:
         str: AI-generated comparison of the two stocks
     """
-    ticker1, news1 = data1['ticker'], data1['news']
-    ticker2, news2 = data2['ticker'], data2['news']
-    news_text1 = " ".join([f"{a['title']}" for a in news1[:5] if a and a.get('title')])
-    news_text2 = " ".join([f"{a['title']}" for a in news2[:5] if a and a.get('title')])
-
-    if not news_text1 and not news_text2:
-        return "Not enough news content for either stock to generate a comparison."
-
-    # Get API key from environment
-    if 'GROQ_API_KEY' in st.secrets:
-        api_key = st.secrets['GROQ_API_KEY']
-    else:
-        api_key = os.getenv("GROQ_API_KEY")
+    template, variables, _ = _build_comparison_prompt(data1, data2, investor_level)
+    if template is None:
+        return variables
 
+    api_key = _get_groq_api_key()
     if not api_key:
         return "Error: GROQ_API_KEY not found. Please configure your secrets."
 
-    # CORRECTED: Updated to the current model name
-    llm = ChatGroq(temperature=0.1, model_name="llama-3.3-70b-versatile", api_key=api_key)
+    try:
+        text = _run_llm_chain(template, variables, 0.1, api_key)
+        return text or "AI comparison could not be generated."
+    except Exception as e:
+        return f"Error generating AI comparison: {e}"
 
-    # Customize prompt based on investor experience level
-    if investor_level == "Beginner":
-        template = """You are a helpful financial guide. Compare two stocks, {ticker1} and {ticker2}, for a beginner. Based on their latest news, explain which one seems to have more positive news and why. Keep it simple. News for {ticker1}: "{news_text1}" News for {ticker2}: "{news_text2}" Your simple comparison:"""
-    else:
-        template = """You are a professional financial analyst. Conduct a comparative analysis of {ticker1} versus {ticker2}. Based on the news headlines, identify key themes affecting each company. Conclude with which stock appears to have stronger short-term sentiment and present a potential risk for each. Recent News for {ticker1}: "{news_text1}" Recent News for {ticker2}: "{news_text2}" Your expert comparison:"""
+def stream_ai_comparison(data1, data2, investor_level="Beginner", llm=None, cache=None):
+    """
+    Streaming variant of get_ai_comparison that yields the comparison as it is generated.
+
+    Args:
+        data1 (dict): First stock's data containing ticker and news
+        data2 (dict): Second stock's data containing ticker and news
+        investor_level (str): Experience level of the investor ("Beginner" or "Advanced")
+        llm: Optional chat model to use instead of ChatGroq (e.g. a fake model in tests); cached under its own model name
+        cache (LLMResponseCache): Optional response cache to use instead of the shared one
 
-    prompt = PromptTemplate(template=template, input_variables=["ticker1", "ticker2", "news_text1", "news_text2"])
-    llm_chain = LLMChain(prompt=prompt, llm=llm)
+    Yields:
+        str: Chunks of the AI-generated comparison
+    """
+    template, variables, _ = _build_comparison_prompt(data1, data2, investor_level)
+    if template is None:
+        yield variables
+        return
+
+    api_key = _get_groq_api_key() if llm is None else None
+    if llm is None and not api_key:
+        yield "Error: GROQ_API_KEY not found. Please configure your secrets."
+        return
 
     try:
-        response = llm_chain.invoke({"ticker1": ticker1, "ticker2": ticker2, "news_text1": news_text1, "news_text2": news_text2})
-        return response.get('text', "AI comparison could not be generated.")
+        yield from _stream_llm_chain(template, variables, 0.1, api_key, llm, cache)
     except Exception as e:
-        return f"Error generating AI comparison: {e}"
+        yield f"Error generating AI comparison: {e}"
 
 def get_ai_portfolio_analysis(report_data_string):
     """
@@ -131,17 +502,10 @@ def get_ai_portfolio_analysis(report_data_string):
     Returns:
         str: Markdown-formatted analysis with recommendations
     """
-    if 'GROQ_API_KEY' in st.secrets:
-        api_key = st.secrets['GROQ_API_KEY']
-    else:
-        api_key = os.getenv("GROQ_API_KEY")
-
+    api_key = _get_groq_api_key()
     if not api_key:
         return "Error: GROQ_API_KEY not found."
 
-    # CORRECTED: Updated to the current model name
-    llm = ChatGroq(temperature=0.2, model_name="llama-3.3-70b-versatile", api_key=api_key)
-
     template = """
     You are an encouraging and insightful financial analyst reviewing a user's virtual stock portfolio.
     Your tone should be positive and educational.
@@ -158,11 +522,8 @@ def get_ai_portfolio_analysis(report_data_string):
     Your AI-Generated Report:
     """
 
-    prompt = PromptTemplate(template=template, input_variables=["report_data"])
-    llm_chain = LLMChain(prompt=prompt, llm=llm)
-
     try:
-        response = llm_chain.invoke({"report_data": report_data_string})
-        return response.get('text', "AI analysis could not be generated.")
+        text = _run_llm_chain(template, {"report_data": report_data_string}, 0.2, api_key)
+        return text or "AI analysis could not be generated."
     except Exception as e:
         return f"Error generating AI analysis: {e}"
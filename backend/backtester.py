@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from .predictor import get_price_prediction
+
+def synthetic_price_series(seed, days=730, start="2022-01-03"):
+    """
+    Business-day closes from a drifting geometric random walk with weekly/yearly cycles.
+
+    Args:
+        seed (int): Random seed; the same seed always gives the same series
+        days (int): Number of trading days
+        start (str): First trading day
+
+    Returns:
+        pd.DataFrame: Close prices indexed by Date
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=days, name="Date")
+    t = np.arange(days)
+    log_returns = rng.normal(rng.uniform(-0.0005, 0.001), rng.uniform(0.008, 0.025), days)
+    seasonal = 0.02 * np.sin(2 * np.pi * t / 252) + 0.005 * np.sin(2 * np.pi * t / 5)
+    close = 100 * np.exp(np.cumsum(log_returns) + seasonal)
+    return pd.DataFrame({'Close': close}, index=dates)
+
+def _evaluate_window(train, test, engine):
+    """Fits one window and scores its forecast against the following bars (runs in a worker)."""
+    # Forecasts are in calendar days; cover every test bar, weekends and holidays included
+    periods = (test.index[-1] - train.index[-1]).days
+    started = time.perf_counter()
+    forecast = get_price_prediction(train, engine=engine, periods=periods)
+    fit_seconds = time.perf_counter() - started
+    if forecast is None:
+        return {'fit_seconds': fit_seconds, 'mape': np.nan, 'coverage': np.nan, 'points': 0}
+
+    actual = test['Close'].copy()
+    actual.index = pd.DatetimeIndex(actual.index).tz_localize(None) if actual.index.tz is not None else actual.index
+    merged = forecast.set_index('ds')[['yhat', 'yhat_lower', 'yhat_upper']].join(actual, how='inner')
+    if merged.empty:
+        return {'fit_seconds': fit_seconds, 'mape': np.nan, 'coverage': np.nan, 'points': 0}
+    inside = (merged['Close'] >= merged['yhat_lower']) & (merged['Close'] <= merged['yhat_upper'])
+    return {
+        'fit_seconds': fit_seconds,
+        'mape': float(np.mean(np.abs(merged['yhat'] / merged['Close'] - 1)) * 100),
+        'coverage': float(inside.mean() * 100),
+        'points': len(merged),
+    }
+
+def walk_forward_backtest(hist_df, engine="prophet", train_window=500, step=30, horizon=30, max_workers=None):
+    """
+    Slides a training window over a price series and scores a forecast at each step.
+
+    Every window is fitted independently on `train_window` bars and compared with
+    the next `horizon` bars (the forecast spans as many calendar days as those
+    bars do, so each one is scored), so windows run in parallel across CPU cores. No
+    network access is needed: pass synthetic series or history read from the
+    local price store (`PriceStore.read_cached`).
+
+    Args:
+        hist_df (pd.DataFrame): Historical prices indexed by Date with a Close column
+        engine (str): Forecast engine passed to get_price_prediction ("prophet" or "fast")
+        train_window (int): Bars used to fit each window
+        step (int): Bars the window advances between evaluations
+        horizon (int): Bars after each window that are scored
+        max_workers (int): Worker processes (defaults to the CPU count; 1 runs inline)
+
+    Returns:
+        pd.DataFrame: One row per window with train_start, train_end, fit_seconds, mape (%), coverage (%),
+            points (test bars scored)
+    """
+    windows = []
+    for end in range(train_window, len(hist_df) - horizon + 1, step):
+        windows.append((hist_df.iloc[end - train_window:end], hist_df.iloc[end:end + horizon]))
+    if not windows:
+        return pd.DataFrame(columns=['train_start', 'train_end', 'fit_seconds', 'mape', 'coverage', 'points'])
+
+    workers = min(max_workers or os.cpu_count() or 1, len(windows))
+    if workers == 1:
+        scores = [_evaluate_window(train, test, engine) for train, test in windows]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            scores = list(executor.map(_evaluate_window, *zip(*windows), [engine] * len(windows)))
+
+    results = pd.DataFrame(scores)
+    results.insert(0, 'train_start', [train.index[0] for train, _ in windows])
+    results.insert(1, 'train_end', [train.index[-1] for train, _ in windows])
+    return results
+
+def summarize_backtest(results):
+    """
+    Aggregates walk-forward results into headline numbers.
+
+    Returns:
+        dict: windows, scored bars, mean/median MAPE (%), mean interval coverage (%), mean and total fit seconds
+    """
+    return {
+        'windows': len(results),
+        'scored_bars': int(results['points'].sum()),
+        'mean_mape': float(results['mape'].mean()),
+        'median_mape': float(results['mape'].median()),
+        'mean_coverage': float(results['coverage'].mean()),
+        'mean_fit_seconds': float(results['fit_seconds'].mean()),
+        'total_fit_seconds': float(results['fit_seconds'].sum()),
+    }
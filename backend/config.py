@@ -0,0 +1,15 @@
+import os
+
+# Root directory for on-disk caches (price history, metadata, LLM responses, ...).
+# Override with the QUANTVIEW_CACHE_DIR environment variable, e.g. to point
+# several app processes at the same shared volume.
+CACHE_DIR = os.getenv(
+    "QUANTVIEW_CACHE_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.cache'))
+)
+
+def cache_path(*parts):
+    """Returns a path inside the cache directory, creating parent folders as needed."""
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -1,21 +1,38 @@
 import yfinance as yf
-from newsapi import NewsApiClient
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from firebase_admin import firestore
 import streamlit as st
+from .price_store import PriceStore
+from .metadata_cache import get_ticker_info
+from .news_store import NewsStore
+from .single_flight import SingleFlight
+from .ai_analyzer import analyze_sentiment
 
 load_dotenv() 
 
 db = firestore.client()
 
+# Local OHLCV store; only date ranges not seen before are requested from yFinance
+price_store = PriceStore()
+
+# Per-ticker article store; repeat lookups within the TTL never reach NewsAPI
+news_store = NewsStore()
+
+# Concurrent sessions asking for the same history or news share one upstream call
+history_flight = SingleFlight("yfinance.history")
+news_flight = SingleFlight("newsapi")
+
 def get_stock_data(ticker, start_date, end_date):
-    """Fetches historical stock data from yFinance."""
+    """Fetches historical stock data, reading from the local price store where possible."""
     try:
-        stock = yf.Ticker(ticker)
-        if not stock.info or stock.info.get('regularMarketPrice') is None:
+        info = get_ticker_info(ticker)
+        if not info or info.get('regularMarketPrice') is None:
             return None, None
-        return stock, stock.history(start=start_date, end=end_date)
+        key = (ticker.upper(), str(start_date), str(end_date))
+        hist = history_flight.do(key, price_store.get_history, ticker, start_date, end_date)
+        return yf.Ticker(ticker), hist
     except Exception as e:
         print(f"Error fetching data for {ticker}: {e}")
         return None, None
@@ -32,14 +49,59 @@ def get_financial_news(ticker_symbol):
         print("Error: NEWS_API_KEY not found in secrets or .env file.")
         return []
     
-    # (The rest of the function remains the same)
     try:
-        newsapi = NewsApiClient(api_key=api_key)
-        return newsapi.get_everything(q=ticker_symbol, language='en', sort_by='relevancy', page_size=20).get('articles', [])
+        return news_flight.do(ticker_symbol.upper(), news_store.get, ticker_symbol, api_key)
     except Exception as e:
         print(f"Error fetching news for {ticker_symbol}: {e}")
         return []
 
+def get_analysis_data(tickers, start_date, end_date, max_workers=8):
+    """
+    Fetches price history, metadata and news for several tickers concurrently.
+
+    Price/metadata and news lookups for every ticker are submitted to one bounded
+    thread pool, so the total wait tracks the slowest ticker instead of the sum.
+
+    Args:
+        tickers (list): Stock symbols to fetch
+        start_date: Start of the price history range
+        end_date: End of the price history range
+        max_workers (int): Maximum number of requests in flight at once
+
+    Returns:
+        tuple: (results (list of dicts in input order), errors (dict of ticker -> message))
+    """
+    results, errors = [], {}
+    if not tickers:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        stock_futures = {t: executor.submit(get_stock_data, t, start_date, end_date) for t in tickers}
+        news_futures = {t: executor.submit(get_financial_news, t) for t in tickers}
+
+        for ticker in tickers:
+            try:
+                stock_info, stock_hist = stock_futures[ticker].result()
+            except Exception as e:
+                stock_info, stock_hist = None, None
+                print(f"Error fetching data for {ticker}: {e}")
+            if not stock_info:
+                news_futures[ticker].cancel()
+                errors[ticker] = f"Could not retrieve data for {ticker}."
+                continue
+            try:
+                news = news_futures[ticker].result()
+            except Exception as e:
+                print(f"Error fetching news for {ticker}: {e}")
+                news = []
+            results.append({
+                "ticker": ticker, "info": stock_info,
+                "hist": stock_hist,
+                "news": news,
+                "sentiment": analyze_sentiment(news)
+            })
+    return results, errors
+
 # --- Simplified Watchlist Functions for Callbacks ---
 
 def get_watchlist(uid):
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# Candidate smoothing parameters; every combination is fitted at once as a NumPy array
+ALPHAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9, 0.99])
+BETAS = np.array([0.0, 0.01, 0.05, 0.1, 0.2])
+PHIS = np.array([0.8, 0.9, 0.95, 0.98])
+# z-score matching Prophet's default 80% uncertainty interval
+INTERVAL_Z = 1.2816
+
+def future_trading_steps(last_date, periods):
+    """
+    Calendar days after `last_date` and the trading-day step each one falls on.
+
+    Weekend days repeat the previous trading day's step, so a model stepping in
+    trading days can fill Prophet-style daily forecast frames.
+
+    Returns:
+        tuple: (pd.DatetimeIndex of `periods` days, np.ndarray of steps >= 1)
+    """
+    last_day = pd.Timestamp(last_date).normalize()
+    future_ds = pd.date_range(last_day + pd.Timedelta(days=1), periods=periods, freq='D')
+    steps = np.busday_count(
+        (last_day + pd.Timedelta(days=1)).date(),
+        (future_ds + pd.Timedelta(days=1)).values.astype('datetime64[D]')
+    ).clip(min=1)
+    return future_ds, steps
+
+def _fit_damped_holt(y):
+    """
+    Fits damped-trend Holt exponential smoothing over the whole parameter grid.
+
+    The recursion runs once over time with every (alpha, beta, phi) candidate
+    carried along as a vector, and the combination with the lowest one-step
+    squared error wins.
+
+    Returns:
+        tuple: (one-step fitted values, final level, final trend, (alpha, beta, phi), residual std)
+    """
+    alpha, beta, phi = (grid.ravel() for grid in np.meshgrid(ALPHAS, BETAS, PHIS, indexing='ij'))
+    level = np.full(alpha.shape, y[0])
+    trend = np.full(alpha.shape, y[1] - y[0] if len(y) > 1 else 0.0)
+    fitted = np.empty((len(y), alpha.size))
+    fitted[0] = y[0]
+    for t in range(1, len(y)):
+        prediction = level + phi * trend
+        fitted[t] = prediction
+        new_level = prediction + alpha * (y[t] - prediction)
+        trend = phi * trend + beta * (new_level - level - phi * trend)
+        level = new_level
+
+    errors = y[:, None] - fitted
+    best = np.argmin(np.sum(errors[1:] ** 2, axis=0))
+    sigma = np.std(errors[1:, best]) if len(y) > 2 else 0.0
+    return fitted[:, best], level[best], trend[best], (alpha[best], beta[best], phi[best]), sigma
+
+def fast_price_forecast(hist_df, periods=30):
+    """
+    Generates a price forecast with damped-trend exponential smoothing in milliseconds.
+
+    The model is fitted on log closing prices, so intervals widen multiplicatively.
+    Output matches the Prophet forecast columns the Analyser plots: history plus
+    `periods` calendar days, where weekend days carry the previous trading day's
+    forecast step.
+
+    Args:
+        hist_df (pd.DataFrame): Historical prices indexed by Date with a Close column
+        periods (int): Number of calendar days to forecast
+
+    Returns:
+        pd.DataFrame: Columns ds, yhat, yhat_lower, yhat_upper, or None if there is too little data
+    """
+    if hist_df.empty or len(hist_df) < 30:
+        return None
+
+    ds = pd.DatetimeIndex(hist_df.index)
+    if ds.tz is not None:
+        ds = ds.tz_localize(None)
+    y = np.log(hist_df['Close'].to_numpy(dtype='float64'))
+
+    fitted, level, trend, (alpha, beta, phi), sigma = _fit_damped_holt(y)
+
+    future_ds, steps = future_trading_steps(ds[-1], periods)
+    damping = np.cumsum(phi ** np.arange(1, steps.max() + 1))
+    future_mean = level + trend * damping[steps - 1]
+    # Standard h-step variance for simple smoothing; the small trend term is ignored
+    future_sigma = sigma * np.sqrt(1 + (steps - 1) * alpha ** 2)
+
+    in_sample_sigma = np.full(len(y), sigma)
+    mean = np.concatenate([fitted, future_mean])
+    spread = INTERVAL_Z * np.concatenate([in_sample_sigma, future_sigma])
+    return pd.DataFrame({
+        'ds': np.concatenate([ds.values, future_ds.values]),
+        'yhat': np.exp(mean),
+        'yhat_lower': np.exp(mean - spread),
+        'yhat_upper': np.exp(mean + spread),
+    })
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+from .screen_query import NUMERIC_SCREEN_COLUMNS, TEXT_SCREEN_COLUMNS
+
+# Text columns with few distinct values get one bitmap per value
+BITMAP_COLUMNS = ['Sector', 'Industry']
+
+class FundamentalsIndex:
+    """
+    Read-only index over a key-stats table for range and top-k screens.
+
+    Every numeric screen column is kept as a sorted array of its values plus
+    the row order that sorts it, so a range condition is two binary searches
+    and "top 20 by Revenue Growth" is a slice of the descending order. Sector
+    and Industry get one bitmap (boolean row mask) per lower-cased value, so
+    "Sector == Technology" or "Sector in [...]" is a lookup and an OR.
+    Conditions are combined by AND-ing bitmaps. Results match
+    `screen_query.apply_screen_spec` row for row, including its NaN handling
+    and stable tie order.
+
+    Build it once per table (e.g. per fundamentals snapshot version); it does
+    not track later changes to the DataFrame.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.size = len(df)
+        self._sorted = {}  # column -> (sorted values, ascending row order, descending row order, NaN rows)
+        for column in NUMERIC_SCREEN_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype='float64')
+            missing = np.isnan(values)
+            rows = np.flatnonzero(~missing)
+            ascending = rows[np.argsort(values[rows], kind='stable')]
+            descending = rows[np.argsort(-values[rows], kind='stable')]
+            self._sorted[column] = (values[ascending], ascending, descending, np.flatnonzero(missing))
+        self._bitmaps = {}  # column -> {lower-cased value: row mask}
+        for column in BITMAP_COLUMNS:
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column].astype(str).str.lower())
+            self._bitmaps[column] = {value: codes == code for code, value in enumerate(uniques)}
+
+    def _rows_to_mask(self, rows):
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def range_rows(self, column, op, value):
+        """
+        Rows of a numeric column satisfying `column op value`, found by binary search.
+
+        Returns:
+            np.ndarray: Row positions in ascending value order ('!=' returns them in row order); NaN rows never match
+        """
+        values, ascending, _, missing = self._sorted[column]
+        if op == 'between':
+            low, high = value
+            return ascending[np.searchsorted(values, low, 'left'):np.searchsorted(values, high, 'right')]
+        if op == '!=':
+            # Unknown (NaN) values match no condition, '!=' included
+            return np.sort(np.concatenate([ascending[:np.searchsorted(values, value, 'left')],
+                                           ascending[np.searchsorted(values, value, 'right'):]]))
+        left, right = np.searchsorted(values, value, 'left'), np.searchsorted(values, value, 'right')
+        return {
+            '<': ascending[:left], '<=': ascending[:right], '>': ascending[right:], '>=': ascending[left:],
+            '==': ascending[left:right],
+        }[op]
+
+    def _text_mask(self, column, op, value):
+        bitmaps = self._bitmaps.get(column)
+        if bitmaps is None:
+            # Symbol and Name are (nearly) unique, so a bitmap per value would not pay off
+            values = self.df[column].astype(str).str.lower()
+            if op == 'contains':
+                return values.str.contains(value.lower(), regex=False).to_numpy()
+            if op == 'in':
+                return values.isin([v.lower() for v in value]).to_numpy()
+            equal = (values == value.lower()).to_numpy()
+            return equal if op == '==' else ~equal
+        if op == 'contains':
+            keys = [key for key in bitmaps if value.lower() in key]
+        elif op == 'in':
+            keys = [v.lower() for v in value]
+        else:
+            keys = [value.lower()]
+        mask = np.zeros(self.size, dtype=bool)
+        for key in keys:
+            if key in bitmaps:
+                mask |= bitmaps[key]
+        return ~mask if op == '!=' else mask
+
+    def top_rows(self, column, k=None, descending=True, mask=None):
+        """Positions of the first `k` rows (optionally within a mask) ordered by a numeric column, NaN last."""
+        _, ascending, descending_order, missing = self._sorted[column]
+        order = np.concatenate([descending_order if descending else ascending, missing])
+        if mask is not None:
+            order = order[mask[order]]
+        return order[:k] if k else order
+
+    def query(self, spec):
+        """
+        Runs a validated screen spec (see screen_query.validate_screen_spec) using the index.
+
+        Returns:
+            pd.DataFrame: Matching rows, sorted and limited as the spec asks
+        """
+        mask = None
+        for condition in spec['filters']:
+            column, op, value = condition['column'], condition['op'], condition['value']
+            if column in self._sorted:
+                condition_mask = self._rows_to_mask(self.range_rows(column, op, value))
+            elif column in TEXT_SCREEN_COLUMNS:
+                condition_mask = self._text_mask(column, op, value)
+            else:
+                raise KeyError(column)
+            mask = condition_mask if mask is None else mask & condition_mask
+
+        sort, limit = spec['sort'], spec['limit']
+        if sort and sort['column'] in self._sorted:
+            rows = self.top_rows(sort['column'], limit, sort['descending'], mask)
+            return self.df.iloc[rows]
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(self.size)
+        result = self.df.iloc[rows]
+        if sort:
+            result = result.sort_values(sort['column'], ascending=not sort['descending'], kind='stable')
+        return result.head(limit) if limit else result
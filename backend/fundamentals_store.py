@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+from .config import cache_path
+from .fundamentals_index import FundamentalsIndex
+from .key_stats import KEY_STATS_COLUMNS, fetch_key_stats
+
+# Bump when the snapshot columns change; snapshots written with another schema are ignored
+SNAPSHOT_SCHEMA = 1
+# Snapshot versions kept on disk (older files are deleted after a successful refresh)
+SNAPSHOTS_KEPT = 3
+NUMERIC_COLUMNS = ['Market Cap', 'P/E Ratio', 'Debt/Equity', 'Profit Margin', 'Revenue Growth']
+FALLBACK_CONSTITUENTS = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA", "META", "BRK-B", "JPM", "JNJ"]
+
+def fetch_sp500_constituents():
+    """Reads the S&P 500 constituent symbols from Wikipedia."""
+    url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+    tables = pd.read_html(url)
+    return tables[0]['Symbol'].tolist()
+
+class FundamentalsStore:
+    """
+    Versioned on-disk snapshot of the screening universe and its key statistics.
+
+    Each refresh writes a new Parquet file (constituents joined with their key
+    stats) and then atomically points `manifest.json` at it, so readers always
+    see a complete snapshot and survive restarts. Both files are written to a
+    unique temporary name and renamed into place, and a snapshot's version is
+    a hash of its file contents, so several app processes sharing the cache
+    directory can refresh at the same time without clobbering each other.
+    Symbols whose stats could not be fetched keep their row from the previous
+    version. A daemon thread started by `start_background_refresh` (or the
+    first `request_refresh`) rebuilds the snapshot once it is older than
+    `max_age` seconds; nothing starts on import.
+    """
+
+    def __init__(self, cache_dir=None, max_age=24 * 3600, constituents_fn=None, info_fn=None, max_workers=16):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.constituents_fn = constituents_fn or fetch_sp500_constituents
+        self.info_fn = info_fn
+        self.max_workers = max_workers
+        self.last_error = None
+        self._loaded = (None, None, None)  # (version, manifest, frame)
+        self._index = (None, None)  # (version, FundamentalsIndex)
+        self._refresh_lock = threading.Lock()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._progress = None  # (done, total) while a refresh is fetching stats
+
+    def _path(self, filename):
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            return os.path.join(self.cache_dir, filename)
+        return cache_path('fundamentals', filename)
+
+    def _temp_path(self, suffix):
+        fd, path = tempfile.mkstemp(dir=os.path.dirname(self._path('manifest.json')), prefix='.tmp-', suffix=suffix)
+        os.close(fd)
+        return path
+
+    def _read_manifest(self):
+        try:
+            with open(self._path('manifest.json')) as f:
+                manifest = json.load(f)
+            return manifest if manifest.get('schema') == SNAPSHOT_SCHEMA else None
+        except (OSError, ValueError):
+            return None
+
+    def load(self):
+        """
+        Returns the latest snapshot without touching the network.
+
+        Returns:
+            tuple: (DataFrame with the KEY_STATS_COLUMNS, manifest dict), or (empty DataFrame, None) if no snapshot exists
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            return pd.DataFrame(columns=KEY_STATS_COLUMNS), None
+        version, _, frame = self._loaded
+        if version != manifest['version']:
+            try:
+                frame = pd.read_parquet(self._path(manifest['file']))
+            except Exception as e:
+                print(f"Could not read fundamentals snapshot {manifest['file']}: {e}")
+                return pd.DataFrame(columns=KEY_STATS_COLUMNS), None
+            self._loaded = (manifest['version'], manifest, frame)
+        return frame, manifest
+
+    def load_index(self):
+        """
+        Returns the latest snapshot wrapped in a FundamentalsIndex, rebuilt only when the version changes.
+
+        Returns:
+            tuple: (FundamentalsIndex whose `.df` is the snapshot, manifest dict), or (None, None) if no snapshot exists
+        """
+        frame, manifest = self.load()
+        if manifest is None:
+            return None, None
+        version, index = self._index
+        if version != manifest['version']:
+            index = FundamentalsIndex(frame)
+            self._index = (manifest['version'], index)
+        return index, manifest
+
+    def age(self):
+        """Seconds since the current snapshot was built, or None if there is none."""
+        manifest = self._read_manifest()
+        return time.time() - manifest['created_at'] if manifest else None
+
+    def status(self):
+        """Returns the snapshot version, creation time, age, size, and whether (and how far) a refresh is running."""
+        manifest = self._read_manifest() or {}
+        created_at = manifest.get('created_at')
+        return {
+            'version': manifest.get('version'),
+            'created_at': created_at,
+            'age_seconds': time.time() - created_at if created_at else None,
+            'symbols': manifest.get('symbols', 0),
+            'failed_symbols': manifest.get('failed_symbols', 0),
+            'refreshing': self._refresh_lock.locked(),
+            'progress': self._progress,
+            'last_error': self.last_error,
+        }
+
+    def refresh(self, progress_callback=None):
+        """
+        Rebuilds the snapshot from the network and publishes it as a new version.
+
+        Returns:
+            dict: The new manifest, or None if another refresh was already running or the rebuild failed
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return None
+        try:
+            previous, manifest = self.load()
+            try:
+                constituents = list(dict.fromkeys(self.constituents_fn()))
+            except Exception as e:
+                print(f"Error fetching S&P 500 constituents: {e}")
+                constituents = previous['Symbol'].tolist() if not previous.empty else FALLBACK_CONSTITUENTS
+
+            def report(done, total, symbol):
+                self._progress = (done, total)
+                if progress_callback:
+                    progress_callback(done, total, symbol)
+
+            stats, errors = fetch_key_stats(constituents, info_fn=self.info_fn, max_workers=self.max_workers,
+                                            progress_callback=report)
+            if errors and not previous.empty:
+                # Keep last version's row for symbols that failed this time
+                stats = pd.concat([stats, previous[previous['Symbol'].isin(list(errors))]], ignore_index=True)
+            order = {symbol: i for i, symbol in enumerate(constituents)}
+            frame = stats.sort_values('Symbol', key=lambda symbols: symbols.map(order)).reset_index(drop=True)
+            for column in NUMERIC_COLUMNS:
+                # Unknown values stay NaN so filters exclude them; only display code may fill them
+                frame[column] = pd.to_numeric(frame[column], errors='coerce').replace([np.inf, -np.inf], np.nan)
+            if frame.empty:
+                raise RuntimeError("No key statistics could be fetched")
+
+            # The version is derived from the file contents, so processes refreshing
+            # concurrently never reuse one version number for different data
+            temp_path = self._temp_path('.parquet')
+            frame.to_parquet(temp_path, index=False)
+            with open(temp_path, 'rb') as f:
+                version = hashlib.sha256(f.read()).hexdigest()[:16]
+            filename = f"snapshot-{version}.parquet"
+            os.replace(temp_path, self._path(filename))
+            new_manifest = {
+                'schema': SNAPSHOT_SCHEMA,
+                'version': version,
+                'file': filename,
+                'created_at': time.time(),
+                'symbols': len(frame),
+                'failed_symbols': len(errors),
+            }
+            temp_path = self._temp_path('.json')
+            with open(temp_path, 'w') as f:
+                json.dump(new_manifest, f)
+            os.replace(temp_path, self._path('manifest.json'))
+            self._prune(filename)
+            self.last_error = None
+            return new_manifest
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"Fundamentals snapshot refresh failed: {e}")
+            return None
+        finally:
+            self._progress = None
+            self._refresh_lock.release()
+
+    def _prune(self, current):
+        """Deletes all but the newest SNAPSHOTS_KEPT snapshot files, never the current one."""
+        directory = os.path.dirname(self._path('manifest.json'))
+        snapshots = []
+        for filename in os.listdir(directory):
+            if filename.startswith('snapshot-') and filename.endswith('.parquet') and filename != current:
+                try:
+                    snapshots.append((os.path.getmtime(os.path.join(directory, filename)), filename))
+                except OSError:
+                    continue  # Pruned by another process
+        for _, filename in sorted(snapshots, reverse=True)[SNAPSHOTS_KEPT - 1:]:
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass
+
+    def start_background_refresh(self, check_interval=600):
+        """Starts (once) a daemon thread that rebuilds the snapshot whenever it is missing or older than max_age."""
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            def run():
+                while True:
+                    age = self.age()
+                    if age is None or age > self.max_age:
+                        self.refresh()
+                    self._wake.wait(check_interval)
+                    self._wake.clear()
+            self._thread = threading.Thread(target=run, name="fundamentals-refresh", daemon=True)
+            self._thread.start()
+
+    def request_refresh(self):
+        """Asks the background thread to check the snapshot now, starting it if needed."""
+        self.start_background_refresh()
+        self._wake.set()
+
+# Shared by the screener pages in this process
+fundamentals_store = FundamentalsStore()
@@ -0,0 +1,192 @@
+import numpy as np
+
+# Largest decay ** -j scale allowed inside one smoothing block, per dtype
+SMOOTHING_SCALE_LIMIT = {np.dtype(np.float64): 1e150, np.dtype(np.float32): 1e15}
+MAX_SMOOTHING_BLOCK = 4096
+# Bars between exact recomputations in the rolling standard deviation
+STD_RESYNC_BARS = 128
+
+# Every kernel takes a contiguous array with time on axis 0: shape (bars,) for one
+# ticker or (bars, tickers) for a panel. Results have the input's shape and dtype,
+# with NaN where the indicator is still warming up.
+
+def as_array(values, dtype=None):
+    """Returns `values` as a contiguous float array (float64 unless it already is float32/64 or `dtype` is given)."""
+    array = np.asarray(values)
+    dtype = dtype or (array.dtype if array.dtype in (np.float32, np.float64) else np.float64)
+    return np.ascontiguousarray(array, dtype=dtype)
+
+def _smooth(x, decay, start, seed):
+    """
+    Runs y[t] = decay * y[t-1] + (1 - decay) * x[t] for t > start with y[start] = seed.
+
+    The recursion is solved in closed form inside blocks (a scaled cumulative
+    sum), so only one carry per block is propagated in Python. Blocks are as
+    long as the dtype allows without decay ** -j overflowing.
+    """
+    out = np.full(x.shape, np.nan, dtype=x.dtype)
+    if start >= len(x):
+        return out
+    out[start] = seed
+    inputs = x[start + 1:] * x.dtype.type(1 - decay)
+    steps = len(inputs)
+    if steps == 0:
+        return out
+
+    block = int(np.log(SMOOTHING_SCALE_LIMIT[x.dtype]) / -np.log(decay)) if decay < 1 else 1
+    block = max(1, min(block, MAX_SMOOTHING_BLOCK, steps))
+    blocks = -(-steps // block)
+    padded = np.zeros((blocks * block,) + x.shape[1:], dtype=x.dtype)
+    padded[:steps] = inputs
+    padded = padded.reshape((blocks, block) + x.shape[1:])
+
+    exponents = np.arange(block, dtype=x.dtype).reshape((1, block) + (1,) * (x.ndim - 1))
+    decay = x.dtype.type(decay)
+    # local[b, j] = sum_{k<=j} decay^(j-k) * input[b, k], i.e. the block started from zero
+    local = np.cumsum(padded * decay ** -exponents, axis=1) * decay ** exponents
+    carry_weights = (decay ** (exponents + 1))[0]
+
+    smoothed = np.empty_like(local)
+    carry = np.asarray(seed, dtype=x.dtype)
+    for b in range(blocks):
+        smoothed[b] = local[b] + carry_weights * carry
+        carry = smoothed[b, -1]
+    out[start + 1:] = smoothed.reshape((-1,) + x.shape[1:])[:steps]
+    return out
+
+def _rolling_mean64(values, length):
+    """Rolling mean in float64 for bars length-1 onwards, from one cumulative sum."""
+    totals = np.cumsum(values, axis=0, dtype=np.float64)
+    window_sums = totals[length - 1:].copy()
+    window_sums[1:] -= totals[:-length]
+    return window_sums / length
+
+def sma(close, length, dtype=None):
+    """Simple moving average over `length` bars (summed in float64)."""
+    close = as_array(close, dtype)
+    out = np.full(close.shape, np.nan, dtype=close.dtype)
+    if len(close) >= length:
+        out[length - 1:] = _rolling_mean64(close, length)
+    return out
+
+def rolling_std(close, length, ddof=0, dtype=None):
+    """
+    Rolling standard deviation over `length` bars (population by default, as Bollinger Bands use).
+
+    Uses the sliding-window Welford update, whose per-bar increments only
+    depend on the bars entering and leaving the window, so the series is a
+    cumulative sum in float64 instead of an O(bars * length) window scan. The
+    sum restarts from an exact window every STD_RESYNC_BARS to stop rounding
+    error from accumulating over long histories.
+    """
+    close = as_array(close, dtype)
+    out = np.full(close.shape, np.nan, dtype=close.dtype)
+    if len(close) < length:
+        return out
+    values = close.astype(np.float64, copy=False)
+    mean = _rolling_mean64(values, length)
+    entering, leaving = values[length:], values[:-length]
+    increments = np.empty_like(mean)
+    increments[0] = 0
+    increments[1:] = (entering - leaving) * (entering - mean[1:] + leaving - mean[:-1])
+    running = np.cumsum(increments, axis=0)
+
+    # Exact sum of squared deviations at the start of each resync segment
+    starts = np.arange(0, len(mean), STD_RESYNC_BARS)
+    windows = values[starts[:, None] + np.arange(length)]
+    exact = ((windows - mean[starts][:, None]) ** 2).sum(axis=1)
+    segment = np.arange(len(mean)) // STD_RESYNC_BARS
+    sum_squares = exact[segment] + running - running[starts][segment]
+    out[length - 1:] = np.sqrt(np.maximum(sum_squares, 0) / (length - ddof))
+    return out
+
+def ema(close, length, dtype=None):
+    """Exponential moving average seeded with the SMA of the first `length` bars, like pandas_ta."""
+    close = as_array(close, dtype)
+    if len(close) < length:
+        return np.full(close.shape, np.nan, dtype=close.dtype)
+    return _smooth(close, 1 - 2 / (length + 1), length - 1, close[:length].mean(axis=0))
+
+def rsi(close, length=14, dtype=None):
+    """Relative Strength Index using Wilder's smoothing (pandas_ta's default `rma`)."""
+    close = as_array(close, dtype)
+    out = np.full(close.shape, np.nan, dtype=close.dtype)
+    if len(close) < 2:
+        return out
+    change = np.diff(close, axis=0)
+    gains, losses = np.maximum(change, 0), np.abs(np.minimum(change, 0))
+    decay = 1 - 1 / length
+    average_gain = _smooth(gains, decay, 0, gains[0])
+    average_loss = _smooth(losses, decay, 0, losses[0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[1:] = 100 * average_gain / (average_gain + average_loss)
+    return out
+
+def macd(close, fast=12, slow=26, signal=9, dtype=None):
+    """
+    MACD line, histogram and signal line.
+
+    Returns:
+        tuple: (macd, histogram, signal) arrays
+    """
+    close = as_array(close, dtype)
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = np.full(close.shape, np.nan, dtype=close.dtype)
+    if len(close) >= slow:
+        # The signal EMA starts where the MACD line does
+        signal_line[slow - 1:] = ema(line[slow - 1:], signal)
+    return line, line - signal_line, signal_line
+
+def bollinger_bands(close, length=20, std=2.0, dtype=None):
+    """
+    Bollinger Bands around the SMA with a population standard deviation.
+
+    Returns:
+        tuple: (lower, mid, upper, bandwidth %, percent-b) arrays
+    """
+    close = as_array(close, dtype)
+    mid = sma(close, length)
+    deviation = close.dtype.type(std) * rolling_std(close, length)
+    lower, upper = mid - deviation, mid + deviation
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return lower, mid, upper, 100 * (upper - lower) / mid, (close - lower) / (upper - lower)
+
+def obv(close, volume, dtype=None):
+    """On-Balance Volume, counting the first bar as an up day (accumulated in float64)."""
+    close = as_array(close, dtype)
+    direction = np.ones(close.shape, dtype=np.float64)
+    direction[1:] = np.sign(np.diff(close, axis=0))
+    return np.cumsum(direction * np.asarray(volume, dtype=np.float64), axis=0).astype(close.dtype)
+
+def compute_indicators(close, volume=None, dtype=np.float64):
+    """
+    Computes every Analyser indicator on NumPy arrays without building pandas objects.
+
+    Args:
+        close (array-like): Closing prices, time on axis 0
+        volume (array-like): Volumes with the same shape (OBV is skipped if None)
+        dtype: np.float64, or np.float32 to halve memory
+
+    Returns:
+        dict: Column name (SMA_20, BBU_20_2.0, MACD_12_26_9, ...) -> array
+    """
+    close = as_array(close, dtype)
+    lower, mid, upper, bandwidth, percent = bollinger_bands(close, 20, 2.0)
+    line, histogram, signal_line = macd(close, 12, 26, 9)
+    columns = {
+        'SMA_20': mid,
+        'SMA_50': sma(close, 50),
+        'EMA_20': ema(close, 20),
+        'BBL_20_2.0': lower,
+        'BBM_20_2.0': mid,
+        'BBU_20_2.0': upper,
+        'BBB_20_2.0': bandwidth,
+        'BBP_20_2.0': percent,
+        'RSI_14': rsi(close, 14),
+        'MACD_12_26_9': line,
+        'MACDh_12_26_9': histogram,
+        'MACDs_12_26_9': signal_line,
+    }
+    if volume is not None:
+        columns['OBV'] = obv(close, volume)
+    return columns
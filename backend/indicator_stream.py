@@ -0,0 +1,187 @@
+import math
+from collections import deque
+import pandas as pd
+
+# Output columns, named like the pandas_ta columns the Analyser plots
+INDICATOR_COLUMNS = [
+    'SMA_20', 'SMA_50', 'EMA_20',
+    'BBL_20_2.0', 'BBM_20_2.0', 'BBU_20_2.0', 'BBB_20_2.0', 'BBP_20_2.0',
+    'RSI_14',
+    'MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9',
+    'OBV',
+]
+
+class _RollingWindow:
+    """Fixed-length window keeping its mean and sum of squared deviations (sliding Welford)."""
+
+    def __init__(self, length):
+        self.length = length
+        self.values = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, x):
+        if len(self.values) < self.length:
+            self.values.append(x)
+            delta = x - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (x - self.mean)
+        else:
+            old = self.values.popleft()
+            self.values.append(x)
+            old_mean = self.mean
+            self.mean += (x - old) / self.length
+            self.m2 += (x - old) * (x - self.mean + old - old_mean)
+
+    @property
+    def full(self):
+        return len(self.values) == self.length
+
+    def std(self, ddof=0):
+        """Standard deviation of the window; Bollinger Bands use the population form (ddof=0)."""
+        return math.sqrt(max(self.m2, 0.0) / (self.length - ddof))
+
+class _Ema:
+    """EMA seeded with the SMA of the first `length` values (pandas_ta's default `presma`)."""
+
+    def __init__(self, length):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value = math.nan
+
+    def push(self, x):
+        self.count += 1
+        if self.count < self.length:
+            self.seed_sum += x
+        elif self.count == self.length:
+            self.value = (self.seed_sum + x) / self.length
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+class _Rma:
+    """Wilder's moving average: ewm(alpha=1/length, adjust=False) starting at the first value."""
+
+    def __init__(self, length):
+        self.alpha = 1 / length
+        self.value = math.nan
+
+    def push(self, x):
+        self.value = x if math.isnan(self.value) else self.value + self.alpha * (x - self.value)
+        return self.value
+
+class StreamingIndicators:
+    """
+    Stateful technical indicator engine updated in O(1) per appended bar.
+
+    Produces the same columns and values as `add_technical_indicators` (SMA
+    20/50, EMA 20, Bollinger Bands 20/2 with the population standard deviation,
+    RSI 14, MACD 12/26/9 and OBV starting at +volume). Seed it from history
+    with `seed`, then feed each new bar to `update` instead of recomputing the
+    whole frame.
+    """
+
+    def __init__(self):
+        self.sma_20 = _RollingWindow(20)
+        self.sma_50 = _RollingWindow(50)
+        self.ema_20 = _Ema(20)
+        self.ema_12 = _Ema(12)
+        self.ema_26 = _Ema(26)
+        self.signal = _Ema(9)
+        self.gain = _Rma(14)
+        self.loss = _Rma(14)
+        self.prev_close = None
+        self.obv = 0.0
+        self.bars = 0
+
+    @classmethod
+    def from_history(cls, df):
+        """Creates an engine seeded from a price frame; returns (engine, indicator frame)."""
+        engine = cls()
+        return engine, engine.seed(df)
+
+    def seed(self, df):
+        """
+        Feeds every bar of a history frame through the engine.
+
+        Args:
+            df (pd.DataFrame): Price data with Close and Volume columns
+
+        Returns:
+            pd.DataFrame: Indicator columns for every row, indexed like `df`
+        """
+        closes = df['Close'].to_numpy(dtype='float64')
+        volumes = df['Volume'].to_numpy(dtype='float64')
+        rows = [self.update(c, v) for c, v in zip(closes, volumes)]
+        return pd.DataFrame(rows, index=df.index, columns=INDICATOR_COLUMNS)
+
+    def update(self, close, volume):
+        """
+        Appends one bar and returns the indicator values for it.
+
+        Args:
+            close (float): Closing price of the new bar
+            volume (float): Volume of the new bar
+
+        Returns:
+            dict: Indicator column -> value (NaN while an indicator is still warming up)
+        """
+        close, volume = float(close), float(volume)
+        nan = math.nan
+        out = dict.fromkeys(INDICATOR_COLUMNS, nan)
+        self.bars += 1
+
+        self.sma_20.push(close)
+        self.sma_50.push(close)
+        if self.sma_20.full:
+            mid, deviation = self.sma_20.mean, 2.0 * self.sma_20.std()
+            lower, upper = mid - deviation, mid + deviation
+            out['SMA_20'] = out['BBM_20_2.0'] = mid
+            out['BBL_20_2.0'], out['BBU_20_2.0'] = lower, upper
+            width = upper - lower
+            out['BBB_20_2.0'] = 100 * width / mid if mid else nan
+            out['BBP_20_2.0'] = (close - lower) / width if width else nan
+        if self.sma_50.full:
+            out['SMA_50'] = self.sma_50.mean
+        out['EMA_20'] = self.ema_20.push(close)
+
+        fast, slow = self.ema_12.push(close), self.ema_26.push(close)
+        if not math.isnan(slow):
+            macd = fast - slow
+            signal = self.signal.push(macd)
+            out['MACD_12_26_9'] = macd
+            out['MACDs_12_26_9'] = signal
+            out['MACDh_12_26_9'] = macd - signal
+
+        if self.prev_close is None:
+            self.obv = volume
+        else:
+            change = close - self.prev_close
+            gain = self.gain.push(max(change, 0.0))
+            loss = self.loss.push(min(change, 0.0))
+            total = gain + abs(loss)
+            out['RSI_14'] = 100 * gain / total if total else nan
+            self.obv += volume if change > 0 else -volume if change < 0 else 0.0
+        out['OBV'] = self.obv
+        self.prev_close = close
+        return out
+
+    def append(self, df, bar_index, close, volume, **columns):
+        """
+        Appends a bar to an indicator frame and returns the new frame.
+
+        Args:
+            df (pd.DataFrame): Frame previously returned by `seed` (optionally with price columns)
+            bar_index: Index label of the new bar
+            close (float): Closing price
+            volume (float): Volume
+            **columns: Any other columns of the new row (Open, High, Low, ...)
+
+        Returns:
+            pd.DataFrame: `df` with the new row
+        """
+        row = {'Close': close, 'Volume': volume, **columns, **self.update(close, volume)}
+        new_row = pd.DataFrame([row], index=pd.Index([bar_index], name=df.index.name))
+        return pd.concat([df, new_row.reindex(columns=df.columns)])
@@ -0,0 +1,159 @@
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import pandas as pd
+from .metadata_cache import get_ticker_info, refresh_ticker_info
+
+# Screener column -> (`.info` key, value used when the key is missing).
+# Missing numbers stay None (NaN in frames) so screens never mistake them for zero.
+KEY_STATS_FIELDS = {
+    'Name': ('longName', 'N/A'),
+    'Sector': ('sector', 'N/A'),
+    'Industry': ('industry', 'N/A'),
+    'Market Cap': ('marketCap', None),
+    'P/E Ratio': ('trailingPE', None),
+    'Debt/Equity': ('debtToEquity', None),
+    'Profit Margin': ('profitMargins', None),
+    'Revenue Growth': ('revenueGrowth', None),
+}
+KEY_STATS_COLUMNS = ['Symbol'] + list(KEY_STATS_FIELDS)
+
+def extract_key_stats(symbol, info):
+    """Selects the screener's key statistics from a `.info` dictionary."""
+    stats = {'Symbol': symbol}
+    for column, (key, default) in KEY_STATS_FIELDS.items():
+        stats[column] = info.get(key, default)
+    return stats
+
+class FakeInfoProvider:
+    """
+    Local stand-in for `yf.Ticker(symbol).info` with injectable latency and failures.
+
+    Every call is recorded in `calls`. `failures` maps a symbol to the number of
+    initial calls that raise, and `hangs` lists symbols whose first call sleeps
+    for `hang_seconds`, so retries and timeouts can be exercised offline.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.0, failures=None, hangs=(), hang_seconds=30.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failures = dict(failures or {})
+        self.hangs = set(hangs)
+        self.hang_seconds = hang_seconds
+        self.calls = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol):
+        with self._lock:
+            self.calls.append(symbol)
+            attempt = self.calls.count(symbol)
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+        if symbol in self.hangs and attempt == 1:
+            time.sleep(self.hang_seconds)
+        time.sleep(delay)
+        if attempt <= self.failures.get(symbol, 0):
+            raise ConnectionError(f"Injected failure for {symbol} (attempt {attempt})")
+        rng = random.Random(symbol)
+        return {
+            'longName': f"{symbol} Corporation",
+            'sector': rng.choice(["Technology", "Healthcare", "Financial Services", "Energy", "Industrials"]),
+            'industry': "Synthetic",
+            'marketCap': rng.randint(2, 3000) * 10 ** 9,
+            'trailingPE': round(rng.uniform(5, 60), 2),
+            'debtToEquity': round(rng.uniform(0, 250), 1),
+            'profitMargins': round(rng.uniform(-0.1, 0.4), 3),
+            'revenueGrowth': round(rng.uniform(-0.2, 0.5), 3),
+            'regularMarketPrice': round(rng.uniform(10, 500), 2),
+        }
+
+def fetch_key_stats(tickers, info_fn=None, max_workers=16, timeout=15.0, retries=2, backoff=0.5, progress_callback=None,
+                    retry_fn=None):
+    """
+    Fetches key statistics for many tickers concurrently.
+
+    At most `max_workers` lookups run at once. An attempt that fails, or that has
+    been running longer than `timeout` seconds, is retried up to `retries` times
+    after an exponential backoff (backoff, 2 x backoff, ...). A timed-out call
+    cannot be interrupted; its result is ignored and it no longer counts against
+    the timeout of the retry. Retries go through `retry_fn`; with the default
+    `info_fn` that is a fresh fetch which does not join the shared cache's
+    in-flight call for the symbol, since that call may be the one that hung.
+
+    Args:
+        tickers (list): Stock symbols
+        info_fn (callable): symbol -> `.info` dict (defaults to the shared metadata cache)
+        max_workers (int): Concurrent lookups
+        timeout (float): Seconds one attempt may run before it is abandoned
+        retries (int): Extra attempts per symbol
+        backoff (float): Delay before the first retry, doubled for each further one
+        progress_callback (callable): Called as progress_callback(done, total, symbol) after each symbol finishes
+        retry_fn (callable): symbol -> `.info` dict for retries (defaults to `info_fn`, or to
+            metadata_cache.refresh_ticker_info when `info_fn` is the shared metadata cache)
+
+    Returns:
+        tuple: (DataFrame of key stats in input order, dict of symbol -> error message)
+    """
+    if info_fn is None:
+        info_fn, retry_fn = get_ticker_info, retry_fn or refresh_ticker_info
+    retry_fn = retry_fn or info_fn
+    tickers = list(dict.fromkeys(tickers))
+    results, errors = {}, {}
+    # (ready_at, sequence, symbol, attempt): attempts waiting to be submitted
+    queue = [(0.0, i, symbol, 0) for i, symbol in enumerate(tickers)]
+    heapq.heapify(queue)
+    sequence = len(queue)
+    running = {}  # future -> [symbol, attempt, started_at or None]
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="key-stats")
+
+    def finish(symbol, stats=None, error=None):
+        if error is None:
+            results[symbol] = stats
+        else:
+            errors[symbol] = error
+            print(f"Could not fetch stats for {symbol}: {error}")
+        if progress_callback:
+            progress_callback(len(results) + len(errors), len(tickers), symbol)
+
+    def retry_or_fail(symbol, attempt, error):
+        nonlocal sequence
+        if attempt < retries:
+            heapq.heappush(queue, (time.monotonic() + backoff * 2 ** attempt, sequence, symbol, attempt + 1))
+            sequence += 1
+        else:
+            finish(symbol, error=error)
+
+    try:
+        while queue or running:
+            now = time.monotonic()
+            while queue and queue[0][0] <= now and len(running) < max_workers:
+                _, _, symbol, attempt = heapq.heappop(queue)
+                running[executor.submit(retry_fn if attempt else info_fn, symbol)] = [symbol, attempt, None]
+
+            next_event = [queue[0][0] - now] if queue and len(running) < max_workers else []
+            for state in running.values():
+                if state[2] is not None:
+                    next_event.append(state[2] + timeout - now)
+            done, _ = wait(running, timeout=max(0.0, min(next_event + [0.1])), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                symbol, attempt, _ = running.pop(future)
+                try:
+                    finish(symbol, extract_key_stats(symbol, future.result() or {}))
+                except Exception as e:
+                    retry_or_fail(symbol, attempt, str(e))
+
+            now = time.monotonic()
+            for future, state in list(running.items()):
+                if state[2] is None and future.running():
+                    state[2] = now  # The timeout starts once a worker picks the attempt up
+                elif state[2] is not None and now - state[2] > timeout:
+                    del running[future]
+                    retry_or_fail(state[0], state[1], f"Timed out after {timeout:g}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    rows = [results[symbol] for symbol in tickers if symbol in results]
+    return pd.DataFrame(rows, columns=KEY_STATS_COLUMNS), errors
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from .config import cache_path
+
+class LLMResponseCache:
+    """
+    Disk-backed cache of LLM completions shared by every session and process.
+
+    Entries are keyed by (model, temperature, hash of the rendered prompt) and
+    stored in a SQLite file, so separate Streamlit processes on the same host
+    (or a shared volume) reuse each other's responses. Entries expire after
+    `ttl` seconds; once the stored text exceeds `max_bytes` the least recently
+    used entries are evicted.
+    """
+
+    def __init__(self, path=None, ttl=6 * 3600, max_bytes=50 * 1024 * 1024):
+        self.path = path or cache_path('llm', 'responses.sqlite3')
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def _connect(self):
+        # sqlite3 connections cannot be shared across threads, so keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(model, temperature, prompt):
+        """Builds the cache key for a rendered prompt."""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return f"{model}:{float(temperature):.3f}:{prompt_hash}"
+
+    def get(self, model, temperature, prompt):
+        """Returns the cached completion for a prompt, or None."""
+        key = self.make_key(model, temperature, prompt)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row and now - row[1] < self.ttl:
+                    conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                    self.hits += 1
+                    return row[0]
+                if row:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            print(f"LLM cache read failed: {e}")
+        self.misses += 1
+        return None
+
+    def set(self, model, temperature, prompt, response):
+        """Stores a completion and evicts old entries if the cache is over its size limit."""
+        key = self.make_key(model, temperature, prompt)
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now))
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_bytes:
+                    self._evict(conn, total - self.max_bytes)
+        except sqlite3.Error as e:
+            print(f"LLM cache write failed: {e}")
+
+    @staticmethod
+    def _evict(conn, bytes_to_free):
+        freed = 0
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if freed >= bytes_to_free:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            freed += size
+
+    def stats(self):
+        """Returns hit/miss counters for this process plus the on-disk entry count and size."""
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': entries,
+            'bytes': size,
+        }
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
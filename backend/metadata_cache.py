@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import yfinance as yf
+from .single_flight import SingleFlight
+
+def yfinance_info_fetcher(symbol):
+    """Default metadata fetcher: the `.info` dictionary of a yFinance Ticker."""
+    return yf.Ticker(symbol).info
+
+class TickerInfoCache:
+    """
+    Process-wide cache for `yf.Ticker(symbol).info` with stale-while-revalidate.
+
+    - Entries younger than `ttl` seconds are served directly.
+    - Entries older than `ttl` but younger than `max_stale` are served immediately
+      while a background refresh brings them up to date.
+    - Missing (or too old) entries are fetched on the caller's thread; concurrent
+      callers asking for the same symbol wait on a single fetch.
+
+    `name`, if given, lists the cache's SingleFlight group in single_flight_stats.
+    """
+
+    def __init__(self, fetcher=None, ttl=900, max_stale=86400, refresh_workers=4, name=None):
+        self.fetcher = fetcher or yfinance_info_fetcher
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries = {}  # symbol -> (fetched_at, info)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight(name)
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="info-refresh")
+        self._stats = {
+            'hits': 0, 'stale_hits': 0, 'misses': 0,
+            'refreshes': 0, 'refresh_errors': 0, 'refresh_seconds': 0.0, 'max_refresh_seconds': 0.0,
+        }
+
+    def get(self, symbol):
+        """
+        Returns the metadata dictionary for a symbol.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            dict: yFinance `.info` data (raises if a cold fetch fails)
+        """
+        symbol = symbol.upper()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            age = now - entry[0] if entry else None
+            if entry and age < self.ttl:
+                self._stats['hits'] += 1
+                return entry[1]
+            if entry and age < self.max_stale:
+                self._stats['stale_hits'] += 1
+                start_refresh = symbol not in self._refreshing
+                self._refreshing.add(symbol)
+            else:
+                self._stats['misses'] += 1
+                entry = None
+        if entry is None:
+            return self._flight.do(symbol, self._fetch, symbol)
+        if start_refresh:
+            self._refresher.submit(self._background_refresh, symbol)
+        return entry[1]
+
+    def _fetch(self, symbol):
+        """Fetches a symbol from upstream and stores it, recording refresh latency."""
+        started = time.perf_counter()
+        try:
+            info = self.fetcher(symbol)
+        except Exception as e:
+            with self._lock:
+                self._stats['refresh_errors'] += 1
+            print(f"Error fetching info for {symbol}: {e}")
+            raise
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._entries[symbol] = (time.time(), info)
+            self._stats['refreshes'] += 1
+            self._stats['refresh_seconds'] += elapsed
+            self._stats['max_refresh_seconds'] = max(self._stats['max_refresh_seconds'], elapsed)
+        return info
+
+    def refresh(self, symbol):
+        """
+        Fetches a symbol from upstream now and stores it.
+
+        Unlike `get`, this does not join a fetch already in flight for the symbol,
+        so a retry is not stuck behind an earlier call that hung.
+        """
+        return self._fetch(symbol.upper())
+
+    def _background_refresh(self, symbol):
+        try:
+            self._flight.do(symbol, self._fetch, symbol)
+        except Exception:
+            pass  # Keep serving the stale entry; the error was already logged
+        finally:
+            with self._lock:
+                self._refreshing.discard(symbol)
+
+    def invalidate(self, symbol=None):
+        """Drops one symbol (or everything) from the cache."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol.upper(), None)
+
+    def stats(self):
+        """Returns hit-rate and refresh-latency statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_symbols'] = len(self._entries)
+        stats['coalesced'] = self._flight.stats()['coalesced']
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['stale_hits']) / lookups if lookups else 0.0
+        stats['avg_refresh_seconds'] = stats['refresh_seconds'] / stats['refreshes'] if stats['refreshes'] else 0.0
+        return stats
+
+# Shared by every page and backend module in this process
+info_cache = TickerInfoCache(name="yfinance.info")
+
+def get_ticker_info(symbol):
+    """Returns cached `.info` metadata for a stock symbol."""
+    return info_cache.get(symbol)
+
+def refresh_ticker_info(symbol):
+    """Fetches fresh `.info` metadata for a symbol, bypassing any in-flight fetch (used for retries)."""
+    return info_cache.refresh(symbol)
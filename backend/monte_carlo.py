@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from .fast_forecaster import future_trading_steps
+
+# Paths simulated per array operation; bounds memory at chunk_size x horizon floats
+DEFAULT_CHUNK_SIZE = 5000
+# Resolution of the log-price histograms used to merge percentiles across chunks
+HISTOGRAM_BINS = 4096
+
+def _simulate_log_returns(rng, method, returns, drift, volatility, n_paths, steps):
+    """Draws an (n_paths, steps) array of daily log returns."""
+    if method == "bootstrap":
+        return rng.choice(returns, size=(n_paths, steps), replace=True)
+    return rng.normal(drift - 0.5 * volatility ** 2, volatility, size=(n_paths, steps))
+
+def monte_carlo_forecast(hist_df, periods=30, n_paths=10000, method="gbm", lower=10, upper=90,
+                         chunk_size=DEFAULT_CHUNK_SIZE, lookback=252, seed=0):
+    """
+    Simulation-based price forecast from thousands of price paths.
+
+    Drift and volatility are estimated from the last `lookback` daily log returns.
+    Paths are generated either as geometric Brownian motion ("gbm") or by
+    resampling historical returns ("bootstrap"). When `n_paths` exceeds
+    `chunk_size` the paths are simulated chunk by chunk and merged through
+    fixed-bin histograms, so memory stays flat as the path count grows.
+
+    Args:
+        hist_df (pd.DataFrame): Historical prices indexed by Date with a Close column
+        periods (int): Number of calendar days to forecast
+        n_paths (int): Number of simulated price paths
+        method (str): "gbm" or "bootstrap"
+        lower (float): Percentile used for yhat_lower
+        upper (float): Percentile used for yhat_upper
+        chunk_size (int): Maximum paths simulated at once
+        lookback (int): Trading days of history used to estimate returns
+        seed (int): Random seed, so reruns draw the same bands
+
+    Returns:
+        pd.DataFrame: Columns ds, yhat (median path), yhat_lower, yhat_upper, or None if there is too little data
+    """
+    if hist_df.empty or len(hist_df) < 30:
+        return None
+
+    ds = pd.DatetimeIndex(hist_df.index)
+    if ds.tz is not None:
+        ds = ds.tz_localize(None)
+    close = hist_df['Close'].to_numpy(dtype='float64')
+    returns = np.diff(np.log(close))[-lookback:]
+    drift, volatility = returns.mean() + 0.5 * returns.var(), returns.std()
+
+    future_ds, steps = future_trading_steps(ds[-1], periods)
+    horizon = int(steps.max())
+    rng = np.random.default_rng(seed)
+    quantiles = np.array([lower, 50, upper]) / 100
+
+    if n_paths <= chunk_size:
+        log_paths = np.cumsum(_simulate_log_returns(rng, method, returns, drift, volatility, n_paths, horizon), axis=1)
+        bands = np.quantile(log_paths, quantiles, axis=0)
+    else:
+        # Bin edges wide enough to hold essentially every path at every step
+        spread = 8 * max(volatility, np.abs(returns).max() if method == "bootstrap" else 0) * np.sqrt(np.arange(1, horizon + 1))
+        centre = (drift - 0.5 * volatility ** 2) * np.arange(1, horizon + 1)
+        low_edge, bin_width = centre - spread, 2 * spread / HISTOGRAM_BINS
+        counts = np.zeros((horizon, HISTOGRAM_BINS), dtype=np.int64)
+        for start in range(0, n_paths, chunk_size):
+            size = min(chunk_size, n_paths - start)
+            log_paths = np.cumsum(_simulate_log_returns(rng, method, returns, drift, volatility, size, horizon), axis=1)
+            bins = np.clip(((log_paths - low_edge) / bin_width).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+            # Offset each step's bins so one bincount fills the whole (horizon, bins) table
+            flat = bins + np.arange(horizon) * HISTOGRAM_BINS
+            counts += np.bincount(flat.ravel(), minlength=horizon * HISTOGRAM_BINS).reshape(horizon, HISTOGRAM_BINS)
+        cumulative = np.cumsum(counts, axis=1) / n_paths
+        bands = np.empty((len(quantiles), horizon))
+        for i, q in enumerate(quantiles):
+            index = (cumulative < q).sum(axis=1)
+            bands[i] = low_edge + (index + 0.5) * bin_width
+
+    future = close[-1] * np.exp(bands[:, steps - 1])
+    return pd.DataFrame({
+        'ds': np.concatenate([ds.values, future_ds.values]),
+        'yhat': np.concatenate([close, future[1]]),
+        'yhat_lower': np.concatenate([close, future[0]]),
+        'yhat_upper': np.concatenate([close, future[2]]),
+    })
@@ -0,0 +1,129 @@
+import hashlib
+import threading
+import time
+from newsapi import NewsApiClient
+
+# Only the fields the pages and sentiment/summary code actually read
+ARTICLE_FIELDS = ('title', 'description', 'url', 'publishedAt')
+
+def _digest(text):
+    return hashlib.sha1(text.strip().lower().encode('utf-8')).hexdigest()
+
+def compact_article(article):
+    """Reduces a NewsAPI article to the compact record kept in the store."""
+    record = {field: article.get(field) for field in ARTICLE_FIELDS}
+    record['source'] = {'name': (article.get('source') or {}).get('name', 'Unknown Source')}
+    return record
+
+class FakeNewsApiClient:
+    """
+    Local stand-in for NewsApiClient used to exercise NewsStore offline.
+
+    Articles added with `add_article` are returned by `get_everything`, honouring
+    `q`, `from_param` and `page_size`. Each request is recorded in `requests`.
+    """
+
+    def __init__(self, articles=None):
+        self.articles = list(articles or [])
+        self.requests = []
+
+    def add_article(self, ticker, title, description, published_at, url=None, source="Fake Wire"):
+        self.articles.append({
+            'ticker': ticker, 'title': title, 'description': description,
+            'publishedAt': published_at, 'url': url or f"https://news.example/{_digest(title)[:12]}",
+            'source': {'id': None, 'name': source}, 'content': description,
+        })
+
+    def get_everything(self, q=None, language=None, sort_by=None, page_size=20, from_param=None, **kwargs):
+        self.requests.append({'q': q, 'from_param': from_param, 'page_size': page_size})
+        matches = [a for a in self.articles if a['ticker'] == q and (not from_param or a['publishedAt'] > from_param)]
+        matches.sort(key=lambda a: a['publishedAt'], reverse=True)
+        return {'status': 'ok', 'totalResults': len(matches), 'articles': matches[:page_size]}
+
+class NewsStore:
+    """
+    TTL'd, deduplicating article store keyed by ticker.
+
+    Within `ttl` seconds of the last fetch the stored articles are returned as-is.
+    After that only articles published since the newest one already stored are
+    requested, and anything whose URL or title was seen before is dropped.
+    """
+
+    def __init__(self, client_factory=None, ttl=900, page_size=20, max_articles=100):
+        self.client_factory = client_factory or (lambda api_key: NewsApiClient(api_key=api_key))
+        self.ttl = ttl
+        self.page_size = page_size
+        self.max_articles = max_articles
+        self.hits = 0
+        self.fetches = 0
+        self._clients = {}
+        self._tickers = {}  # ticker -> {'fetched_at', 'latest', 'articles', 'seen'}
+        self._lock = threading.Lock()
+        self._ticker_locks = {}
+
+    def _client(self, api_key):
+        with self._lock:
+            if api_key not in self._clients:
+                self._clients[api_key] = self.client_factory(api_key)
+            return self._clients[api_key]
+
+    def _ticker_lock(self, ticker):
+        with self._lock:
+            return self._ticker_locks.setdefault(ticker, threading.Lock())
+
+    def get(self, ticker, api_key):
+        """
+        Returns recent articles for a ticker, newest fetch first.
+
+        Args:
+            ticker (str): Stock symbol used as the NewsAPI query
+            api_key (str): NewsAPI key
+
+        Returns:
+            list: Compact article dictionaries (title, description, url, publishedAt, source)
+        """
+        ticker = ticker.upper()
+        with self._ticker_lock(ticker):
+            entry = self._tickers.get(ticker)
+            if entry and time.time() - entry['fetched_at'] < self.ttl:
+                self.hits += 1
+                return entry['articles'][:self.page_size]
+
+            params = dict(q=ticker, language='en', sort_by='relevancy', page_size=self.page_size)
+            if entry and entry['latest']:
+                params['from_param'] = entry['latest']
+            response = self._client(api_key).get_everything(**params)
+            self.fetches += 1
+
+            entry = entry or {'latest': None, 'articles': [], 'seen': set()}
+            new_articles = []
+            for article in response.get('articles', []):
+                if not article or not article.get('title'):
+                    continue
+                keys = {_digest(article['title'])}
+                if article.get('url'):
+                    keys.add(_digest(article['url']))
+                if keys & entry['seen']:
+                    continue
+                entry['seen'] |= keys
+                new_articles.append(compact_article(article))
+                published = article.get('publishedAt')
+                if published and (entry['latest'] is None or published > entry['latest']):
+                    entry['latest'] = published
+
+            entry['articles'] = (new_articles + entry['articles'])[:self.max_articles]
+            # Older articles than `latest` are never requested again, so only kept ones need remembering
+            entry['seen'] = {_digest(a[field]) for a in entry['articles'] for field in ('title', 'url') if a.get(field)}
+            entry['fetched_at'] = time.time()
+            self._tickers[ticker] = entry
+            return entry['articles'][:self.page_size]
+
+    def stats(self):
+        """Returns cache hits, upstream fetches and the number of stored articles."""
+        total = self.hits + self.fetches
+        return {
+            'hits': self.hits,
+            'fetches': self.fetches,
+            'hit_rate': self.hits / total if total else 0.0,
+            'stored_articles': sum(len(e['articles']) for e in self._tickers.values()),
+        }
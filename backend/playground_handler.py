@@ -1,8 +1,8 @@
 from firebase_admin import firestore
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 from .data_handler import get_financial_news
+from .metadata_cache import get_ticker_info
 from .ai_analyzer import analyze_sentiment, get_ai_portfolio_analysis
 
 # Initialize Firestore client
@@ -129,7 +129,7 @@ def generate_health_report(_uid, portfolio, total_portfolio_value, total_stock_v
     # Get sector allocation and news data
     for ticker in tickers:
         try:
-            info = yf.Ticker(ticker).info
+            info = get_ticker_info(ticker)
             sector = info.get('sector', 'Other')
             if sector not in sector_data:
                 sector_data[sector] = 0
@@ -149,7 +149,7 @@ def generate_health_report(_uid, portfolio, total_portfolio_value, total_stock_v
     diversification_score = (1 - hhi) * 100
     
     # Risk Concentration
-    df['market_value'] = df.apply(lambda row: row['shares'] * yf.Ticker(row['ticker']).info.get('regularMarketPrice', 0), axis=1)
+    df['market_value'] = df.apply(lambda row: row['shares'] * get_ticker_info(row['ticker']).get('regularMarketPrice', 0), axis=1)
     df['portfolio_weight'] = df['market_value'] / total_portfolio_value
     highest_risk = df.sort_values('portfolio_weight', ascending=False).iloc[0]
     
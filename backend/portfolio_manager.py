@@ -1,7 +1,6 @@
-import yfinance as yf
+import time
 from firebase_admin import firestore
-import pandas as pd
-import streamlit as st
+from .quote_store import quote_store
 
 db = firestore.client()
 
@@ -82,25 +81,52 @@ def remove_from_portfolio(uid, holding_id):
         print(f"Error removing from portfolio: {e}")
         return False
 
-@st.cache_data(ttl=300)  # Cache market prices for 5 minutes to reduce API calls
 def get_live_prices(tickers):
     """
-    Fetch current market prices for a list of stock symbols.
+    Look up current market prices for a list of stock symbols.
+    
+    Prices come from the shared quote store, which refreshes every held symbol
+    in one batched download in the background, so this is a dictionary lookup.
     
     Args:
-        tickers (list): List of stock symbols to fetch prices for
+        tickers (list): List of stock symbols to look up prices for
         
     Returns:
-        dict: Dictionary mapping ticker symbols to their current prices
+        tuple: (dict mapping ticker symbols to their current prices,
+                epoch seconds of the oldest of those prices or None)
     """
     if not tickers:
-        return {}
+        return {}, None
+    return quote_store.get(tickers)
+
+def get_trade_price(ticker, max_age=60):
+    """
+    Look up a price to fill a trade at, fetching it again if the stored one is too old.
     
-    # Download latest price data for all tickers
-    data = yf.download(tickers=' '.join(tickers), period='1d', progress=False)
-    if data.empty:
-        return {}
+    Args:
+        ticker (str): Stock symbol
+        max_age (float): Oldest acceptable price, in seconds
+        
+    Returns:
+        tuple: (price, or None if no price from the last `max_age` seconds is available,
+                epoch seconds the price was fetched at or None)
+    """
+    prices, as_of = quote_store.get([ticker], max_age=max_age)
+    if ticker not in prices or as_of is None or time.time() - as_of > max_age:
+        return None, as_of
+    return prices[ticker], as_of
+
+def describe_price_time(as_of):
+    """
+    Format how fresh the live prices are for display.
     
-    # Extract most recent closing prices
-    prices = data['Close'].iloc[-1].to_dict()
-    return prices
+    Args:
+        as_of (float): Epoch seconds returned by get_live_prices, or None
+        
+    Returns:
+        str: e.g. "Prices as of 14:32:05 (45s ago)"
+    """
+    if as_of is None:
+        return "Live prices are unavailable right now."
+    age = max(0, int(time.time() - as_of))
+    return f"Prices as of {time.strftime('%H:%M:%S', time.localtime(as_of))} ({age}s ago)"
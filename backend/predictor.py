@@ -1,31 +1,309 @@
+import hashlib
+import json
+import os
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
 import pandas as pd
 from prophet import Prophet
+from prophet.serialize import model_to_json, model_from_json
+from .config import cache_path
+from .fast_forecaster import fast_price_forecast
+from .monte_carlo import monte_carlo_forecast
 
-def get_price_prediction(hist_df):
-    """
-    Generates a 30-day price forecast using Facebook's Prophet model.
-    """
-    if hist_df.empty or len(hist_df) < 30: # Prophet needs sufficient data
-        return None
+# Refit from the previous fit's parameters when at most this many bars were appended
+WARM_START_MAX_NEW_BARS = 30
+# Number of forecasts kept in memory for instant repeat requests
+FORECAST_MEMORY_SIZE = 32
+# Calendar days forecast by default (what the Analyser shows); only this horizon is cached on disk
+FORECAST_DAYS = 30
 
+_forecast_memory = OrderedDict()
+_forecast_lock = threading.Lock()
+model_cache_stats = {'memory_hits': 0, 'disk_hits': 0, 'warm_fits': 0, 'cold_fits': 0}
+
+def _training_frame(hist_df):
+    """Converts price history into Prophet's 'ds'/'y' training frame."""
     # Prophet requires columns 'ds' (datestamp) and 'y' (value)
     df_train = hist_df.reset_index()[['Date', 'Close']].rename(columns={'Date': 'ds', 'Close': 'y'})
 
     # --- FIX: Remove timezone information from the 'ds' column ---
-    df_train['ds'] = df_train['ds'].dt.tz_localize(None)
+    if df_train['ds'].dt.tz is not None:
+        df_train['ds'] = df_train['ds'].dt.tz_localize(None)
+    return df_train
 
-    # Initialize and train the model
-    model = Prophet(
+def _data_hash(df_train):
+    """Hashes a training frame so identical histories map to the same cached model."""
+    digest = hashlib.sha256()
+    digest.update(df_train['ds'].values.astype('datetime64[ns]').tobytes())
+    digest.update(df_train['y'].values.astype('float64').tobytes())
+    return digest.hexdigest()[:16]
+
+def _new_model():
+    return Prophet(
         daily_seasonality=True,
         weekly_seasonality=True,
         yearly_seasonality=True
     )
-    model.fit(df_train)
 
-    # Create a future dataframe for the next 30 days
-    future = model.make_future_dataframe(periods=30)
-    
+def _warm_start_params(model):
+    """Extracts fitted parameters in the form Prophet.fit accepts as `init`."""
+    params = {name: model.params[name][0][0] for name in ['k', 'm', 'sigma_obs']}
+    params.update({name: model.params[name][0] for name in ['delta', 'beta']})
+    return params
+
+def _model_path(ticker):
+    return cache_path('models', f"{ticker.upper()}.json")
+
+def _forecast_path(ticker, data_hash):
+    return cache_path('models', f"{ticker.upper()}_{data_hash}.parquet")
+
+def _load_cached_model(ticker):
+    """Returns the last fitted model record for a ticker, or None."""
+    model_path = _model_path(ticker)
+    if not os.path.exists(model_path):
+        return None
+    try:
+        with open(model_path) as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Discarding unreadable model cache for {ticker}: {e}")
+        return None
+
+def _remember_forecast(key, forecast):
+    # Keep a private copy so callers can modify the forecast they were handed
+    with _forecast_lock:
+        _forecast_memory[key] = forecast.copy()
+        _forecast_memory.move_to_end(key)
+        while len(_forecast_memory) > FORECAST_MEMORY_SIZE:
+            _forecast_memory.popitem(last=False)
+
+def _cached_forecast(ticker, data_hash, periods=FORECAST_DAYS):
+    """
+    Looks up a forecast for this exact training data and horizon in memory, then on disk.
+
+    Returns:
+        tuple: (forecast or None, the ticker's cached model record or None)
+    """
+    memory_key = (ticker.upper() if ticker else None, data_hash, periods)
+    with _forecast_lock:
+        if memory_key in _forecast_memory:
+            model_cache_stats['memory_hits'] += 1
+            _forecast_memory.move_to_end(memory_key)
+            return _forecast_memory[memory_key].copy(), None
+
+    cached = _load_cached_model(ticker) if ticker else None
+    if cached and cached['data_hash'] == data_hash and periods == FORECAST_DAYS:
+        try:
+            forecast = pd.read_parquet(_forecast_path(ticker, data_hash))
+            model_cache_stats['disk_hits'] += 1
+            _remember_forecast(memory_key, forecast)
+            return forecast, cached
+        except Exception as e:
+            print(f"Could not read cached forecast for {ticker}: {e}")
+    return None, cached
+
+def _extends_history(cached, df_train):
+    """
+    Checks whether a training frame is the cached model's history moved forward by a few bars.
+
+    The Analyser fetches a rolling window, so each new bar usually also drops the
+    oldest one: the frames must share every bar from the later of the two start
+    dates up to the cached last date (same dates and closes), with between 1 and
+    WARM_START_MAX_NEW_BARS bars appended and at most as many dropped.
+    """
+    if 'ds' not in cached or not cached['ds']:
+        return False  # Record written before histories were stored
+    old_ds = np.array(cached['ds'], dtype='int64').astype('datetime64[ns]')
+    old_y = np.array(cached['y'], dtype='float64')
+    new_ds = df_train['ds'].values.astype('datetime64[ns]')
+    new_y = df_train['y'].values.astype('float64')
+
+    appended = int(np.sum(new_ds > old_ds[-1]))
+    shared_old = old_ds >= new_ds[0]
+    shared_new = new_ds <= old_ds[-1]
+    dropped = len(old_ds) - int(shared_old.sum())
+    if not (0 < appended <= WARM_START_MAX_NEW_BARS and dropped <= WARM_START_MAX_NEW_BARS):
+        return False
+    if shared_old.sum() != shared_new.sum():
+        return False
+    return bool(np.array_equal(old_ds[shared_old], new_ds[shared_new])
+                and np.allclose(old_y[shared_old], new_y[shared_new], rtol=1e-9, atol=0))
+
+def get_price_prediction(hist_df, ticker=None, engine="prophet", periods=FORECAST_DAYS):
+    """
+    Generates a price forecast (30 calendar days by default) with the selected engine.
+
+    - "prophet": Facebook's Prophet model, the slowest but seasonality-aware
+    - "fast": damped-Holt exponential smoothing (fast_forecaster), in milliseconds
+    - "monte_carlo": median and percentile bands of simulated price paths (monte_carlo)
+
+    Prophet fits are cached per ticker together with a hash of their training
+    data: an identical history returns the stored forecast, and a history that
+    moves the cached window forward by a few bars (appending new ones and
+    possibly dropping the oldest) is refit starting from the previous parameters.
+    The other engines are fast enough to run on every call.
+
+    Args:
+        hist_df (pd.DataFrame): Historical prices indexed by Date with a Close column
+        ticker (str): Stock symbol; enables the on-disk model cache and warm starts (Prophet only)
+        engine (str): "prophet", "fast" or "monte_carlo"
+        periods (int): Calendar days to forecast
+
+    Returns:
+        pd.DataFrame: Forecast with ds, yhat, yhat_lower and yhat_upper (plus Prophet's
+            components for "prophet"), or None
+    """
+    if hist_df.empty or len(hist_df) < 30: # Every engine needs sufficient data
+        return None
+    if engine == "fast":
+        return fast_price_forecast(hist_df, periods)
+    if engine == "monte_carlo":
+        return monte_carlo_forecast(hist_df, periods)
+
+    df_train = _training_frame(hist_df)
+    data_hash = _data_hash(df_train)
+    memory_key = (ticker.upper() if ticker else None, data_hash, periods)
+    forecast, cached = _cached_forecast(ticker, data_hash, periods)
+    if forecast is not None:
+        return forecast
+
+    # Warm-start when the new history overlaps the cached one and only a few bars changed
+    init = None
+    if cached and _extends_history(cached, df_train):
+        init = _warm_start_params(model_from_json(cached['model']))
+
+    # Initialize and train the model
+    model = _new_model()
+    if init:
+        model.fit(df_train, init=init)
+    else:
+        model.fit(df_train)
+    model_cache_stats['warm_fits' if init else 'cold_fits'] += 1
+
+    # Create a future dataframe for the next `periods` days
+    future = model.make_future_dataframe(periods=periods)
+
     # Generate the forecast
     forecast = model.predict(future)
-    
+
+    if ticker and periods == FORECAST_DAYS:
+        try:
+            forecast.to_parquet(_forecast_path(ticker, data_hash))
+            with open(_model_path(ticker), 'w') as f:
+                json.dump({
+                    'data_hash': data_hash,
+                    'rows': len(df_train),
+                    'ds': df_train['ds'].values.astype('datetime64[ns]').astype('int64').tolist(),
+                    'y': df_train['y'].astype('float64').tolist(),
+                    'model': model_to_json(model),
+                }, f)
+            if cached and cached['data_hash'] != data_hash and os.path.exists(_forecast_path(ticker, cached['data_hash'])):
+                os.remove(_forecast_path(ticker, cached['data_hash']))
+        except Exception as e:
+            print(f"Could not cache model for {ticker}: {e}")
+    _remember_forecast(memory_key, forecast)
     return forecast
+
+def _predict_worker(ticker, hist_df):
+    """Process-pool entry point; runs in a worker process."""
+    return get_price_prediction(hist_df, ticker)
+
+def _stop_workers(executor):
+    """Shuts the pool down without waiting and kills workers still running timed-out fits."""
+    # ProcessPoolExecutor has no public way to stop a running task before Python 3.14
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+def get_batch_predictions(hist_by_ticker, max_workers=None, timeout=120, cancel_event=None, progress_callback=None, engine="prophet"):
+    """
+    Fits and forecasts many tickers in parallel on a process pool.
+
+    Forecasts already in the model cache are returned without starting a fit.
+    Each remaining ticker gets `timeout` seconds from the moment a worker picks
+    it up; tickers that exceed it, or are still pending when `cancel_event` is
+    set, are reported as errors and their workers are stopped.
+
+    Args:
+        hist_by_ticker (dict): Ticker -> historical price DataFrame
+        max_workers (int): Worker processes (defaults to the CPU count)
+        timeout (float): Per-ticker time limit in seconds
+        cancel_event (threading.Event): Optional event that aborts the batch when set
+        progress_callback (callable): Optional fn(done, total) called as tickers finish
+        engine (str): "prophet"; "fast" and "monte_carlo" run inline without a process pool
+
+    Returns:
+        tuple: (forecasts (dict ticker -> DataFrame), errors (dict ticker -> message))
+    """
+    forecasts, errors, pending = {}, {}, {}
+    for ticker, hist_df in hist_by_ticker.items():
+        if hist_df is None or hist_df.empty or len(hist_df) < 30:
+            errors[ticker] = "Not enough historical data."
+            continue
+        if engine != "prophet":
+            forecasts[ticker] = get_price_prediction(hist_df, ticker, engine=engine)
+            continue
+        forecast, _ = _cached_forecast(ticker, _data_hash(_training_frame(hist_df)))
+        if forecast is not None:
+            forecasts[ticker] = forecast
+        else:
+            pending[ticker] = hist_df
+
+    total = len(forecasts) + len(pending)
+    reported = len(forecasts)
+    if progress_callback:
+        progress_callback(reported, total)
+    if not pending:
+        return forecasts, errors
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pending))
+    # Spawned (not forked) workers are safe to start from Streamlit's threaded server
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    futures = {executor.submit(_predict_worker, ticker, hist_df): ticker for ticker, hist_df in pending.items()}
+    started_at = {}
+    must_kill = False
+    try:
+        while futures:
+            done, _ = wait(futures, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker = futures.pop(future)
+                try:
+                    forecast = future.result()
+                except Exception as e:
+                    errors[ticker] = f"Forecast failed: {e}"
+                    continue
+                if forecast is None:
+                    errors[ticker] = "Not enough historical data."
+                    continue
+                forecasts[ticker] = forecast
+                _remember_forecast((ticker.upper(), _data_hash(_training_frame(pending[ticker]))), forecast)
+
+            now = time.monotonic()
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            for future, ticker in list(futures.items()):
+                if future.running():
+                    started_at.setdefault(future, now)
+                if cancelled:
+                    errors[ticker] = "Forecast cancelled."
+                elif future in started_at and now - started_at[future] > timeout:
+                    errors[ticker] = f"Forecast timed out after {timeout}s."
+                else:
+                    continue
+                if not future.cancel():
+                    must_kill = True
+                del futures[future]
+            if progress_callback and total - len(futures) != reported:
+                reported = total - len(futures)
+                progress_callback(reported, total)
+    finally:
+        if must_kill or futures:
+            _stop_workers(executor)
+        else:
+            executor.shutdown(wait=True)
+    return forecasts, errors
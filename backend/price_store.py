@@ -0,0 +1,215 @@
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from .config import cache_path
+
+def yfinance_provider(ticker, start, end):
+    """Default history provider: fetches daily OHLCV bars from yFinance (end is exclusive)."""
+    return yf.Ticker(ticker).history(start=start, end=end)
+
+class FakePriceProvider:
+    """
+    Local stand-in for yFinance that generates deterministic business-day bars.
+
+    Every call is recorded in `calls` so the store's gap-filling can be checked
+    without touching the network.
+    """
+
+    def __init__(self, seed=0, tz="America/New_York"):
+        self.seed = seed
+        self.tz = tz
+        self.calls = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, pd.Timestamp(start), pd.Timestamp(end)))
+        dates = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        if len(dates) == 0:
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        # Price depends only on the date so overlapping fetches agree with each other
+        day_numbers = (dates - pd.Timestamp("2000-01-01")).days.values
+        rng = np.random.default_rng(self.seed + sum(map(ord, ticker)))
+        phase = rng.uniform(0, 2 * np.pi)
+        close = 100 + 10 * np.sin(day_numbers / 30 + phase) + day_numbers * 0.01
+        index = pd.DatetimeIndex(dates, name='Date').tz_localize(self.tz)
+        return pd.DataFrame({
+            'Open': close * 0.995,
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': (1e6 + 1e4 * (day_numbers % 50)).astype('int64'),
+        }, index=index)
+
+def _to_day(value):
+    """Normalizes a date, datetime or string to a naive midnight Timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+def _naive_index(df):
+    """Returns the frame's index as naive local timestamps for date comparisons."""
+    index = pd.DatetimeIndex(df.index)
+    return index.tz_localize(None) if index.tz is not None else index
+
+def _merge_ranges(ranges):
+    """Merges overlapping or touching [start, end) ranges."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+class PriceStore:
+    """
+    On-disk OHLCV store (one Parquet file per ticker) that sits in front of yFinance.
+
+    Alongside each file the store keeps the date ranges it has already asked the
+    provider for, so a request only fetches the days it has never seen before.
+    A range only counts as covered once the provider returned bars for it (or
+    it holds no weekdays at all), so an empty answer caused by a rate limit is
+    retried on the next request.
+    Ranges reaching today are never marked as covered, so the latest bar is
+    always refreshed.
+    """
+
+    def __init__(self, provider=None, cache_dir=None):
+        self.provider = provider or yfinance_provider
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _path(self, ticker, ext):
+        filename = f"{ticker.upper()}.{ext}"
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            return os.path.join(self.cache_dir, filename)
+        return cache_path('prices', filename)
+
+    def _lock_for(self, ticker):
+        with self._locks_guard:
+            return self._locks.setdefault(ticker.upper(), threading.Lock())
+
+    def _load(self, ticker):
+        """Returns (bars, covered_ranges) for a ticker, or an empty frame if nothing is stored."""
+        data_path, meta_path = self._path(ticker, 'parquet'), self._path(ticker, 'json')
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return pd.DataFrame(), []
+        try:
+            with open(meta_path) as f:
+                ranges = [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in json.load(f)['ranges']]
+            return pd.read_parquet(data_path), ranges
+        except Exception as e:
+            print(f"Discarding unreadable price cache for {ticker}: {e}")
+            return pd.DataFrame(), []
+
+    def _save(self, ticker, bars, ranges):
+        bars.to_parquet(self._path(ticker, 'parquet'))
+        with open(self._path(ticker, 'json'), 'w') as f:
+            json.dump({'ranges': [[s.isoformat(), e.isoformat()] for s, e in ranges]}, f)
+
+    def missing_ranges(self, ticker, start_date, end_date):
+        """
+        Works out which parts of [start_date, end_date) have not been fetched yet.
+
+        Returns:
+            list: (start, end) Timestamp pairs, end exclusive
+        """
+        _, ranges = self._load(ticker)
+        return self._gaps(ranges, _to_day(start_date), _to_day(end_date))
+
+    @staticmethod
+    def _gaps(ranges, start, end):
+        gaps, cursor = [], start
+        for covered_start, covered_end in ranges:
+            if covered_end <= cursor or covered_start >= end:
+                continue
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def get_history(self, ticker, start_date, end_date):
+        """
+        Returns daily bars for [start_date, end_date), fetching only the missing ranges.
+
+        Args:
+            ticker (str): Stock symbol
+            start_date: First day to include
+            end_date: Day after the last one to include (matches yFinance's `end`)
+
+        Returns:
+            pd.DataFrame: OHLCV bars indexed by date
+        """
+        start, end = _to_day(start_date), _to_day(end_date)
+        with self._lock_for(ticker):
+            bars, ranges = self._load(ticker)
+            gaps = self._gaps(ranges, start, end)
+            if gaps:
+                self._count('misses')
+                today = _to_day(pd.Timestamp.today())
+                fetched = [bars] if not bars.empty else []
+                for gap_start, gap_end in gaps:
+                    self._count('fetches')
+                    new_bars = self.provider(ticker, gap_start.date(), gap_end.date())
+                    got_bars = new_bars is not None and not new_bars.empty
+                    if got_bars:
+                        fetched.append(new_bars)
+                    # yFinance answers rate limits and transient errors with an empty frame, so
+                    # an empty gap only counts as covered if it has no trading days at all
+                    if not got_bars and len(pd.bdate_range(gap_start, gap_end - pd.Timedelta(days=1))):
+                        continue
+                    # Only completed days count as covered; today's bar is still moving
+                    if gap_start < min(gap_end, today):
+                        ranges.append((gap_start, min(gap_end, today)))
+                if fetched:
+                    bars = pd.concat(fetched)
+                    bars = bars[~bars.index.duplicated(keep='last')].sort_index()
+                self._save(ticker, bars, _merge_ranges(ranges))
+            else:
+                self._count('hits')
+
+        if bars.empty:
+            return bars
+        days = _naive_index(bars)
+        return bars[(days >= start) & (days < end)]
+
+    def read_cached(self, ticker):
+        """Returns every bar stored for a ticker without contacting the provider."""
+        with self._lock_for(ticker):
+            bars, _ = self._load(ticker)
+        return bars
+
+    def stats(self):
+        """Returns hit/miss counters for the store."""
+        with self._stats_lock:
+            hits, misses, fetches = self.hits, self.misses, self.fetches
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'provider_fetches': fetches,
+            'hit_rate': hits / total if total else 0.0,
+        }
+
+    def clear(self, ticker):
+        """Removes everything stored for a ticker."""
+        with self._lock_for(ticker):
+            for ext in ('parquet', 'json'):
+                path = self._path(ticker, ext)
+                if os.path.exists(path):
+                    os.remove(path)
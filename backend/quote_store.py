@@ -0,0 +1,168 @@
+import random
+import threading
+import time
+import pandas as pd
+import yfinance as yf
+
+def yfinance_quote_fetcher(symbols):
+    """Default quote fetcher: latest close for every symbol from one batched yFinance download."""
+    data = yf.download(tickers=' '.join(symbols), period='1d', progress=False)
+    if data.empty:
+        return {}
+    close = data['Close']
+    if isinstance(close, pd.Series):
+        close = close.to_frame(symbols[0])
+    return close.ffill().iloc[-1].dropna().to_dict()
+
+class FakeQuoteFetcher:
+    """
+    Local stand-in for a batched yFinance download with injectable latency.
+
+    Every call is recorded in `calls` (one list of symbols per batch) so the
+    store's batching can be checked without touching the network. Symbols in
+    `unknown` get no price, like delisted tickers.
+    """
+
+    def __init__(self, latency=0.0, unknown=(), seed=0):
+        self.latency = latency
+        self.unknown = set(unknown)
+        self.seed = seed
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, symbols):
+        with self._lock:
+            self.calls.append(list(symbols))
+            batch = len(self.calls)
+        time.sleep(self.latency)
+        return {
+            symbol: round(random.Random(f"{self.seed}-{symbol}").uniform(10, 500) * (1 + 0.001 * batch), 2)
+            for symbol in symbols if symbol not in self.unknown
+        }
+
+class QuoteStore:
+    """
+    Process-wide per-symbol store of latest prices, shared by every session.
+
+    Lookups are dictionary reads. Symbols seen for the first time are fetched
+    on the caller's thread (all of a request's new symbols in one batch); after
+    that a daemon thread refreshes every symbol requested within the last
+    `idle_after` seconds in a single batched download every `interval`
+    seconds. Failed refreshes keep serving the previous prices, which is why
+    every lookup also reports how old its prices are.
+    """
+
+    def __init__(self, fetcher=None, interval=60, idle_after=900):
+        self.fetcher = fetcher or yfinance_quote_fetcher
+        self.interval = interval
+        self.idle_after = idle_after
+        self._quotes = {}  # symbol -> (price or None if the last fetch had none, fetched_at)
+        self._active = {}  # symbol -> last time a session asked for it
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # One download at a time
+        self._thread = None
+        self._stats = {'lookups': 0, 'cold_symbols': 0, 'batches': 0, 'batched_symbols': 0, 'fetch_errors': 0}
+        self.last_error = None
+
+    def get(self, symbols, max_age=None):
+        """
+        Looks up the latest prices for a list of symbols.
+
+        Args:
+            symbols (list): Stock symbols
+            max_age (float): If set, prices older than this many seconds are fetched
+                again before returning, e.g. to fill a trade
+
+        Returns:
+            tuple: (dict of symbol -> price, epoch seconds of the oldest returned price or None)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        now = time.time()
+        with self._lock:
+            self._stats['lookups'] += 1
+            for symbol in symbols:
+                self._active[symbol] = now
+            missing = [symbol for symbol in symbols if self._needs_fetch(symbol, max_age)]
+        if missing:
+            with self._fetch_lock:
+                with self._lock:
+                    # Another session may have fetched them while we waited
+                    missing = [symbol for symbol in missing if self._needs_fetch(symbol, max_age)]
+                    self._stats['cold_symbols'] += len(missing)
+                if missing:
+                    self._fetch(missing)
+        self.start_background_refresh()
+
+        prices, as_of = {}, None
+        with self._lock:
+            for symbol in symbols:
+                price, fetched_at = self._quotes.get(symbol, (None, None))
+                if price is not None:
+                    prices[symbol] = price
+                    as_of = fetched_at if as_of is None else min(as_of, fetched_at)
+        return prices, as_of
+
+    def _needs_fetch(self, symbol, max_age):
+        if symbol not in self._quotes:
+            return True
+        return max_age is not None and time.time() - self._quotes[symbol][1] > max_age
+
+    def _fetch(self, symbols):
+        """Downloads one batch and stores its prices; on failure the previous prices stay in place."""
+        try:
+            prices = self.fetcher(symbols)
+        except Exception as e:
+            with self._lock:
+                self._stats['fetch_errors'] += 1
+            self.last_error = str(e)
+            print(f"Error fetching live prices for {len(symbols)} symbols: {e}")
+            return
+        fetched_at = time.time()
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['batched_symbols'] += len(symbols)
+            for symbol in symbols:
+                if symbol in prices:
+                    self._quotes[symbol] = (float(prices[symbol]), fetched_at)
+                elif symbol not in self._quotes:
+                    self._quotes[symbol] = (None, fetched_at)  # Remember it so lookups do not refetch it
+        self.last_error = None
+
+    def refresh(self):
+        """Refreshes every actively held symbol in one batch; idle symbols are dropped from the rotation."""
+        cutoff = time.time() - self.idle_after
+        with self._lock:
+            for symbol in [s for s, seen in self._active.items() if seen < cutoff]:
+                del self._active[symbol]
+            symbols = list(self._active)
+        if symbols:
+            with self._fetch_lock:
+                self._fetch(symbols)
+
+    def start_background_refresh(self):
+        """Starts (once) the daemon thread that refreshes active symbols every `interval` seconds."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            def run():
+                while True:
+                    time.sleep(self.interval)
+                    self.refresh()
+            self._thread = threading.Thread(target=run, name="quote-refresh", daemon=True)
+            self._thread.start()
+
+    def stats(self):
+        """Returns lookup, batching and freshness statistics."""
+        now = time.time()
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_symbols'] = len(self._quotes)
+            stats['active_symbols'] = len(self._active)
+            fetched = [fetched_at for _, fetched_at in self._quotes.values()]
+        stats['avg_batch_size'] = stats['batched_symbols'] / stats['batches'] if stats['batches'] else 0.0
+        stats['max_age_seconds'] = now - min(fetched) if fetched else None
+        stats['last_error'] = self.last_error
+        return stats
+
+# Shared by every page and session in this process
+quote_store = QuoteStore()
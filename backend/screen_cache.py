@@ -0,0 +1,95 @@
+import re
+import threading
+from collections import OrderedDict
+
+# Word and letter suffixes for large numbers ("100B", "2.5 trillion", "500k")
+NUMBER_SUFFIXES = {
+    'k': 1e3, 'thousand': 1e3,
+    'm': 1e6, 'mm': 1e6, 'mn': 1e6, 'million': 1e6,
+    'b': 1e9, 'bn': 1e9, 'billion': 1e9,
+    't': 1e12, 'tn': 1e12, 'trillion': 1e12,
+}
+_NUMBER = re.compile(
+    r"\$?(\d+(?:,\d{3})*(?:\.\d+)?|\.\d+)"
+    r"(?:\s*(" + "|".join(sorted(NUMBER_SUFFIXES, key=len, reverse=True)) + r")\b)?"
+    r"(?:\s*(%|percent\b))?"
+)
+
+def _format_number(match):
+    value = float(match.group(1).replace(',', ''))
+    if match.group(2):
+        value *= NUMBER_SUFFIXES[match.group(2)]
+    text = f"{value:.10g}"
+    if 'e' in text:
+        text = f"{value:.0f}"
+    return text + ("%" if match.group(3) else "")
+
+def normalize_prompt(prompt):
+    """
+    Canonical form of a screening prompt used as its cache key.
+
+    Lower-cases, collapses whitespace, drops trailing punctuation and rewrites
+    numbers in one format, so "P/E below 25.0", "p/e  below 25" and
+    "P/E below 25!" share a key, as do "$100B", "100 billion" and "100,000,000,000".
+    """
+    text = " ".join((prompt or "").lower().split())
+    text = _NUMBER.sub(_format_number, text)
+    return text.rstrip(" .!?")
+
+class ScreenResultCache:
+    """
+    LRU cache of screener results keyed by normalized prompt and snapshot version.
+
+    A hit needs the same normalized prompt (see normalize_prompt) and skips both
+    the LLM and the filter. Results are tied to a snapshot version, so a new
+    snapshot never serves results computed from older data.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (version, normalized prompt) -> (spec, results)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, prompt, version):
+        """
+        Looks up a result for a prompt against a snapshot version.
+
+        Returns:
+            tuple: (spec, results) of the cached screen, or None on a miss
+        """
+        with self._lock:
+            key = (version, normalize_prompt(prompt))
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return self._entries[key]
+            self._stats['misses'] += 1
+            return None
+
+    def set(self, prompt, version, spec, results):
+        """Stores a result, evicting the least recently used entries beyond max_entries."""
+        with self._lock:
+            key = (version, normalize_prompt(prompt))
+            self._entries[key] = (spec, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        """Returns hit and miss counts, evictions and the hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drops every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+# Shared by every screener session in this process
+screen_cache = ScreenResultCache()
@@ -0,0 +1,173 @@
+import json
+import re
+import numpy as np
+import pandas as pd
+
+# Screenable get_key_stats columns and how the LLM should read them
+# Unknown values are missing (NaN) and never match a numeric condition
+NUMERIC_SCREEN_COLUMNS = {
+    'Market Cap': "market capitalisation in USD (100B = 100000000000)",
+    'P/E Ratio': "trailing price/earnings ratio (missing for negative earnings)",
+    'Debt/Equity': "debt to equity in percent (150 means 1.5x)",
+    'Profit Margin': "profit margin as a fraction (0.2 means 20%)",
+    'Revenue Growth': "year-over-year revenue growth as a fraction (0.1 means 10%)",
+}
+TEXT_SCREEN_COLUMNS = {
+    'Symbol': "ticker symbol",
+    'Name': "company name",
+    'Sector': "GICS sector",
+    'Industry': "industry name",
+}
+# Sector names offered to the LLM when no snapshot is available to list them
+GICS_SECTORS = [
+    "Basic Materials", "Communication Services", "Consumer Cyclical", "Consumer Defensive", "Energy",
+    "Financial Services", "Healthcare", "Industrials", "Real Estate", "Technology", "Utilities",
+]
+NUMERIC_OPERATORS = {'<', '<=', '>', '>=', '==', '!=', 'between'}
+TEXT_OPERATORS = {'==', '!=', 'in', 'contains'}
+MAX_FILTERS = 10
+MAX_LIMIT = 500
+
+def describe_screen_columns():
+    """Column descriptions for the LLM prompt; their size does not depend on the universe."""
+    lines = [f"- {name} (number): {meaning}" for name, meaning in NUMERIC_SCREEN_COLUMNS.items()]
+    lines += [f"- {name} (text): {meaning}" for name, meaning in TEXT_SCREEN_COLUMNS.items()]
+    return "\n".join(lines)
+
+def _number(value, column):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value):
+        raise ValueError(f"{column} needs a numeric value, got {value!r}")
+    return float(value)
+
+def validate_screen_spec(spec):
+    """
+    Checks a screen spec and returns a normalized copy.
+
+    A spec is a dict such as:
+        {"filters": [{"column": "P/E Ratio", "op": "<", "value": 25},
+                     {"column": "Sector", "op": "==", "value": "Technology"}],
+         "sort": {"column": "Revenue Growth", "descending": true},
+         "limit": 20}
+
+    Raises:
+        ValueError: If the spec uses unknown columns, operators or badly typed values
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("The screen must be a JSON object")
+    filters = spec.get('filters') or []
+    if not isinstance(filters, list) or len(filters) > MAX_FILTERS:
+        raise ValueError(f"'filters' must be a list of at most {MAX_FILTERS} conditions")
+
+    normalized = []
+    for condition in filters:
+        if not isinstance(condition, dict):
+            raise ValueError(f"Invalid condition: {condition!r}")
+        column, op, value = condition.get('column'), condition.get('op'), condition.get('value')
+        if column in NUMERIC_SCREEN_COLUMNS:
+            if op not in NUMERIC_OPERATORS:
+                raise ValueError(f"Operator {op!r} cannot be used on {column}")
+            if op == 'between':
+                if not isinstance(value, list) or len(value) != 2:
+                    raise ValueError(f"'between' on {column} needs [low, high]")
+                value = sorted(_number(v, column) for v in value)
+            else:
+                value = _number(value, column)
+        elif column in TEXT_SCREEN_COLUMNS:
+            if op not in TEXT_OPERATORS:
+                raise ValueError(f"Operator {op!r} cannot be used on {column}")
+            if op == 'in':
+                if not isinstance(value, list) or not value or not all(isinstance(v, str) for v in value):
+                    raise ValueError(f"'in' on {column} needs a list of strings")
+            elif not isinstance(value, str):
+                raise ValueError(f"{column} needs a text value, got {value!r}")
+        else:
+            raise ValueError(f"Unknown column {column!r}")
+        normalized.append({'column': column, 'op': op, 'value': value})
+
+    sort = spec.get('sort')
+    if sort is not None:
+        if not isinstance(sort, dict) or sort.get('column') not in {**NUMERIC_SCREEN_COLUMNS, **TEXT_SCREEN_COLUMNS}:
+            raise ValueError(f"Invalid sort: {sort!r}")
+        sort = {'column': sort['column'], 'descending': bool(sort.get('descending', False))}
+
+    limit = spec.get('limit')
+    if limit is not None:
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 0 < limit <= MAX_LIMIT:
+            raise ValueError(f"'limit' must be an integer between 1 and {MAX_LIMIT}")
+
+    return {'filters': normalized, 'sort': sort, 'limit': limit}
+
+def parse_screen_spec(text):
+    """
+    Extracts and validates the JSON screen spec from an LLM completion.
+
+    Raises:
+        ValueError: If no valid spec can be found
+    """
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        raise ValueError("The model did not return a JSON screen")
+    try:
+        spec = json.loads(match.group(0))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"The model returned malformed JSON: {e}")
+    return validate_screen_spec(spec)
+
+def apply_screen_spec(df, spec):
+    """
+    Runs a validated spec over a key-stats table with vectorized masks.
+
+    Missing numeric values never satisfy a numeric condition (not even '!=').
+
+    Returns:
+        pd.DataFrame: Matching rows, sorted and limited as the spec asks
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for condition in spec['filters']:
+        column, op, value = condition['column'], condition['op'], condition['value']
+        if column in NUMERIC_SCREEN_COLUMNS:
+            values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype='float64')
+            with np.errstate(invalid='ignore'):
+                if op == 'between':
+                    mask &= (values >= value[0]) & (values <= value[1])
+                else:
+                    mask &= {
+                        '<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal,
+                        '==': np.equal, '!=': np.not_equal,
+                    }[op](values, value)
+            # NaN != value is True in NumPy, but an unknown value matches no condition
+            mask &= ~np.isnan(values)
+        else:
+            values = df[column].astype(str).str.lower()
+            if op == 'contains':
+                mask &= values.str.contains(value.lower(), regex=False).to_numpy()
+            elif op == 'in':
+                mask &= values.isin([v.lower() for v in value]).to_numpy()
+            else:
+                equal = (values == value.lower()).to_numpy()
+                mask &= equal if op == '==' else ~equal
+
+    result = df[mask]
+    if spec['sort']:
+        result = result.sort_values(spec['sort']['column'], ascending=not spec['sort']['descending'], kind='stable')
+    if spec['limit']:
+        result = result.head(spec['limit'])
+    return result
+
+def describe_screen_spec(spec):
+    """Renders a spec as readable text, e.g. "P/E Ratio < 25 and Sector == 'Technology', highest Revenue Growth first, top 20"."""
+    parts = []
+    for condition in spec['filters']:
+        value = condition['value']
+        if condition['op'] == 'between':
+            parts.append(f"{condition['column']} between {value[0]:g} and {value[1]:g}")
+        else:
+            shown = f"{value:g}" if isinstance(value, float) else repr(value)
+            parts.append(f"{condition['column']} {condition['op']} {shown}")
+    text = " and ".join(parts) or "all stocks"
+    if spec['sort']:
+        direction = "highest" if spec['sort']['descending'] else "lowest"
+        text += f", {direction} {spec['sort']['column']} first"
+    if spec['limit']:
+        text += f", top {spec['limit']}"
+    return text
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from .key_stats import KEY_STATS_COLUMNS, fetch_key_stats
+from .screen_query import apply_screen_spec
+
+def live_chunk_loader(info_fn=None, max_workers=8):
+    """Chunk loader fetching key stats from `.info` for each chunk (see key_stats.fetch_key_stats)."""
+    def load(symbols):
+        df, _ = fetch_key_stats(symbols, info_fn=info_fn, max_workers=max_workers)
+        return df
+    return load
+
+def stream_screen(spec, symbols, load_chunk, chunk_size=25, max_workers=4):
+    """
+    Evaluates a screen chunk by chunk and yields matches as each chunk finishes.
+
+    Up to `max_workers` chunks are loaded and filtered at once; chunks are
+    yielded in completion order, so the first matches arrive after one chunk
+    rather than after the whole universe. Sorting and limits only make sense
+    over every match, so apply them with `finalize_screen` at the end.
+
+    Only worth it when loading a chunk is slow (live `.info` fetches): a local
+    fundamentals snapshot is screened in one step by FundamentalsIndex, where
+    chunking would only add overhead.
+
+    Args:
+        spec (dict): Validated screen spec
+        symbols (list): Universe to screen
+        load_chunk (callable): list of symbols -> key-stats DataFrame
+        chunk_size (int): Symbols per chunk
+        max_workers (int): Chunks processed concurrently
+
+    Yields:
+        tuple: (DataFrame of matching rows in the chunk, symbols screened so far, total symbols)
+    """
+    filters_only = {**spec, 'sort': None, 'limit': None}
+    chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+    done = 0
+
+    def evaluate(chunk):
+        return apply_screen_spec(load_chunk(chunk), filters_only)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screen-chunk") as executor:
+        futures = {executor.submit(evaluate, chunk): chunk for chunk in chunks}
+        try:
+            for future in as_completed(futures):
+                done += len(futures[future])
+                try:
+                    matches = future.result()
+                except Exception as e:
+                    print(f"Screening chunk failed: {e}")
+                    matches = pd.DataFrame(columns=KEY_STATS_COLUMNS)
+                yield matches, done, len(symbols)
+        finally:
+            # Stop queued chunks if the consumer goes away early
+            for future in futures:
+                future.cancel()
+
+def finalize_screen(matches, spec):
+    """Combines streamed chunk matches and applies the spec's sort and limit."""
+    matches = [df for df in matches if not df.empty]
+    if not matches:
+        return pd.DataFrame(columns=KEY_STATS_COLUMNS)
+    return apply_screen_spec(pd.concat(matches, ignore_index=True), spec)
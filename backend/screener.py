@@ -1,132 +1,247 @@
 import streamlit as st
-import os
-import yfinance as yf
+import time
 import pandas as pd
 import requests
-from langchain_groq import ChatGroq
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
+from .fundamentals_store import FALLBACK_CONSTITUENTS, fetch_sp500_constituents, fundamentals_store
+from .data_handler import price_store
+from .technical_screener import PricePanel, parse_signal_query, screen_signals
+from .screen_query import GICS_SECTORS, describe_screen_columns, describe_screen_spec, parse_screen_spec
+from .screen_stream import finalize_screen, live_chunk_loader, stream_screen
+from .screen_cache import screen_cache
+from .ai_analyzer import run_llm_prompt
 
 # --- Helper function to get the stock list ---
 @st.cache_data(ttl=3600) # Cache the list for 1 hour to avoid refetching
 def get_sp500_tickers():
-    """Fetches the list of S&P 500 tickers."""
+    """Fetches the list of S&P 500 tickers, preferring the local fundamentals snapshot."""
+    snapshot, _ = fundamentals_store.load()
+    if not snapshot.empty:
+        return snapshot['Symbol'].tolist()
     try:
         # Using Wikipedia's S&P 500 list
-        url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
-        tables = pd.read_html(url)
-        df = tables[0]
-        return df['Symbol'].tolist()
+        return fetch_sp500_constituents()
     except Exception as e:
         print(f"Error fetching S&P 500 tickers: {e}")
         # Fallback list in case the API fails
-        return ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA", "META", "BRK-B", "JPM", "JNJ"]
-
-# --- Helper function to get key stats for a list of tickers ---
-@st.cache_data(ttl=600) # Cache data for 10 minutes
-def get_key_stats(tickers):
-    """Fetches key financial statistics for a list of stock tickers."""
-    all_stats = []
-    for ticker_symbol in tickers:
-        try:
-            ticker = yf.Ticker(ticker_symbol)
-            info = ticker.info
-            # Select only the most relevant stats for screening
-            stats = {
-                'Symbol': ticker_symbol,
-                'Name': info.get('longName', 'N/A'),
-                'Sector': info.get('sector', 'N/A'),
-                'Industry': info.get('industry', 'N/A'),
-                'Market Cap': info.get('marketCap', 0),
-                'P/E Ratio': info.get('trailingPE', 0),
-                'Debt/Equity': info.get('debtToEquity', 0),
-                'Profit Margin': info.get('profitMargins', 0),
-                'Revenue Growth': info.get('revenueGrowth', 0)
-            }
-            all_stats.append(stats)
-        except Exception as e:
-            print(f"Could not fetch stats for {ticker_symbol}: {e}")
-            continue
-    return pd.DataFrame(all_stats)
+        return FALLBACK_CONSTITUENTS
+
+def describe_age(seconds):
+    """Formats a snapshot age in seconds as e.g. '5 minutes' or '3 hours'."""
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''}"
+    return "less than a minute"
+
+def get_fundamentals_status():
+    """Returns a one-line description of the local fundamentals snapshot for the UI."""
+    status = fundamentals_store.status()
+    if status['age_seconds'] is None:
+        return "Fundamentals snapshot is being built in the background." if status['refreshing'] else "No fundamentals snapshot yet."
+    message = f"Fundamentals snapshot {status['version']}: {status['symbols']} stocks, {describe_age(status['age_seconds'])} old"
+    return message + " (refreshing...)" if status['refreshing'] else message
+
+def get_fundamentals_progress():
+    """Returns (fraction done, label) while the fundamentals snapshot is being rebuilt, or None."""
+    progress = fundamentals_store.status()['progress']
+    if not progress:
+        return None
+    done, total = progress
+    return done / total if total else 0.0, f"Fetching key statistics for the snapshot: {done}/{total} stocks"
+
+def get_screen_cache_status():
+    """Returns a one-line summary of the AI screener result cache for the UI."""
+    stats = screen_cache.stats()
+    lookups = stats['hits'] + stats['misses']
+    if not lookups:
+        return "No cached screens yet."
+    return f"Screen cache: {stats['hit_rate']:.0%} hit rate over {lookups} requests, {stats['entries']} screens cached"
+
+# --- Technical signals for the whole universe ---
+@st.cache_data(ttl=600) # Cache signals for 10 minutes
+def get_technical_signals(tickers, days=365):
+    """Computes the latest RSI, moving-average and Bollinger signals for every ticker from the local price store."""
+    end_date = pd.Timestamp.today().normalize() + pd.Timedelta(days=1)
+    start_date = end_date - pd.Timedelta(days=days)
+    panel, errors = PricePanel.from_store(tickers, start_date, end_date, price_store)
+    for ticker, error in errors.items():
+        print(f"Could not load prices for {ticker}: {error}")
+    return panel.latest_signals()
+
+def run_technical_screener(query, tickers=None):
+    """
+    Screens the S&P 500 on technical signals, e.g. "RSI_14 < 30 and Close > SMA_50".
+
+    Returns:
+        tuple: (summary message, DataFrame of matching tickers)
+    """
+    if not query:
+        return "Please enter a technical filter.", pd.DataFrame()
+    try:
+        spec = parse_signal_query(query)
+    except ValueError as e:
+        return f"Invalid technical filter: {e}", pd.DataFrame()
+    signals = get_technical_signals(tickers or get_sp500_tickers())
+    if signals.empty:
+        return "Could not retrieve price data for screening.", pd.DataFrame()
+    results_df = screen_signals(signals, spec)
+    return f"Screening complete. Found {len(results_df)} of {len(signals)} stocks matching your filter.", results_df.reset_index()
 
 # --- Main AI Screener Function ---
-def run_ai_screener(prompt):
+SCREENER_TEMPLATE = """
+You are an expert financial analyst who turns stock screening requests into structured filters.
+Translate the user's request into a JSON object over these columns:
+{columns}
+
+Known sectors: {sectors}
+
+The JSON object has the keys:
+- "filters": list of {{"column": ..., "op": ..., "value": ...}} conditions that must all hold.
+  Numeric columns accept the operators <, <=, >, >=, ==, != and "between" (value [low, high]).
+  Text columns accept ==, != and "contains" (text value) or "in" (list of values).
+- "sort": {{"column": ..., "descending": true or false}} or null
+- "limit": maximum number of stocks to return, or null for all matches
+
+Return ONLY the JSON object, with no explanation or other text.
+
+User's Request: "{prompt}"
+"""
+
+def compile_screen(prompt, sectors, llm_fn=None):
     """
-    Takes a natural language prompt, fetches stock data, and uses an LLM to screen for matching stocks.
+    Asks the LLM to translate a screening request into a validated filter spec.
+
+    Only the column descriptions and sector names are sent, so the prompt has the
+    same size however many stocks are screened.
+
+    Args:
+        prompt (str): The user's screening criteria
+        sectors (list): Sector names present in the data
+        llm_fn (callable): (template, variables) -> completion text; defaults to the shared Groq client
+
+    Returns:
+        dict: Validated spec (see screen_query.validate_screen_spec)
+    """
+    llm_fn = llm_fn or run_llm_prompt
+    variables = {
+        "prompt": prompt,
+        "columns": describe_screen_columns(),
+        "sectors": ", ".join(sorted(sectors)),
+    }
+    return parse_screen_spec(llm_fn(SCREENER_TEMPLATE, variables))
+
+def run_ai_screener(prompt, llm_fn=None):
+    """
+    Takes a natural language prompt, compiles it into a filter with an LLM, and runs it over the local fundamentals snapshot.
+
+    The snapshot is refreshed in the background, so this never waits on yFinance or Wikipedia,
+    and the filter itself runs locally over the whole universe.
+
+    Args:
+        prompt (str): The user's screening criteria
+        llm_fn (callable): Optional (template, variables) -> completion text, for running without Groq
     """
     if not prompt:
         return "Please enter a screening criterion.", pd.DataFrame()
 
-    # Step 1: Get the universe of stocks to screen (S&P 500)
-    tickers = get_sp500_tickers()
-    
-    # For demonstration purposes, let's limit to the first 200 stocks to keep it fast
-    tickers_to_scan = tickers[:200] 
-    
-    # Step 2: Get the key financial data for these stocks
-    df_stats = get_key_stats(tickers_to_scan)
+    # Step 1: Read the universe and its key financial data from the local snapshot
+    index, manifest = fundamentals_store.load_index()
+    if manifest is None:
+        fundamentals_store.request_refresh()
+        return "Financial data is still being collected in the background. Please try again in a minute.", pd.DataFrame()
+    df_stats = index.df
     if df_stats.empty:
         return "Could not retrieve financial data for screening.", pd.DataFrame()
-        
-    # Convert the DataFrame to a string format for the AI prompt
-    stats_string = df_stats.to_string()
+    snapshot_age = describe_age(time.time() - manifest['created_at'])
 
-    # Step 3: Use an LLM to perform the screening
-    if 'GROQ_API_KEY' in st.secrets:
-        api_key = st.secrets['GROQ_API_KEY']
-    else:
-        api_key = os.getenv("GROQ_API_KEY")
-
-    if not api_key:
-        return "Error: GROQ_API_KEY not found.", pd.DataFrame()
+    # Repeated requests against the same snapshot skip the LLM and the filter
+    cached = screen_cache.get(prompt, manifest['version'])
+    if cached is not None:
+        spec, results_df = cached
+        return (f"Screening complete. Found {len(results_df)} of {len(df_stats)} stocks matching: "
+                f"{describe_screen_spec(spec)} (financial data from {snapshot_age} ago). Served from cache."), results_df
 
-    llm = ChatGroq(temperature=0, model_name="llama3-70b-8192", api_key=api_key)
+    # Step 2: Use an LLM to translate the request into a structured filter
+    try:
+        spec = compile_screen(prompt, df_stats['Sector'].dropna().unique(), llm_fn)
+    except ValueError as e:
+        return f"The AI could not turn your request into a valid screen: {e}", pd.DataFrame()
+    except Exception as e:
+        return f"An error occurred during AI screening: {e}", pd.DataFrame()
 
-    screener_template = """
-    You are an expert financial analyst with the task of screening stocks.
-    Based on the user's request, you must analyze the following list of stocks and their financial data.
-    Your task is to return ONLY a Python list of the stock symbols that strictly match the user's criteria.
-    Do not provide any explanation or other text, just the Python list of symbols.
+    # Step 3: Run the filter locally on the snapshot's sorted indexes and sector bitmaps
+    results_df = index.query(spec)
+    screen_cache.set(prompt, manifest['version'], spec, results_df)
+    analysis_summary = (f"Screening complete. Found {len(results_df)} of {len(df_stats)} stocks matching: "
+                        f"{describe_screen_spec(spec)} (financial data from {snapshot_age} ago).")
+    return analysis_summary, results_df
 
-    User's Request: "{prompt}"
+def stream_ai_screener(prompt, llm_fn=None, chunk_size=25, max_workers=4):
+    """
+    Streaming version of run_ai_screener that yields matches chunk by chunk.
 
-    Stock Data:
-    {stock_data}
+    When a fundamentals snapshot exists it is screened in one step through its
+    index (a single 'matches' event); otherwise each chunk's key stats are
+    fetched live, several chunks at a time, so the first matches appear long
+    before the whole S&P 500 has been fetched. Snapshot results are cached per
+    snapshot version, so a repeated request yields its results at once.
 
-    Based on the user's request, the Python list of matching stock symbols is:
+    Yields:
+        dict: {'type': 'matches', 'rows': DataFrame, 'done': int, 'total': int} per chunk, then
+              {'type': 'done', 'summary': str, 'results': DataFrame}, or a single
+              {'type': 'error', 'summary': str}
     """
-    
-    prompt_template = PromptTemplate(
-        template=screener_template, 
-        input_variables=["prompt", "stock_data"]
-    )
-    
-    screener_chain = LLMChain(prompt=prompt_template, llm=llm)
+    if not prompt:
+        yield {'type': 'error', 'summary': "Please enter a screening criterion."}
+        return
 
-    try:
-        response = screener_chain.invoke({
-            "prompt": prompt,
-            "stock_data": stats_string
-        })
-        
-        ai_response_text = response.get('text', '[]')
-        
-        # Safely evaluate the string to get a Python list
-        import ast
-        try:
-            screened_tickers = ast.literal_eval(ai_response_text)
-            if not isinstance(screened_tickers, list):
-                screened_tickers = []
-        except:
-            screened_tickers = [] # If AI returns malformed text, return an empty list
-
-        # Filter the original DataFrame to show only the results
-        results_df = df_stats[df_stats['Symbol'].isin(screened_tickers)]
-        
-        analysis_summary = f"Screening complete. Found {len(results_df)} stocks matching your criteria."
-        
-        return analysis_summary, results_df
+    index, manifest = fundamentals_store.load_index()
+    version = None
+    if manifest is not None and not index.df.empty:
+        version, df_stats = manifest['version'], index.df
+        symbols, sectors = df_stats['Symbol'].tolist(), df_stats['Sector'].dropna().unique()
+        load_chunk, source = None, f"financial data from {describe_age(time.time() - manifest['created_at'])} ago"
+        cached = screen_cache.get(prompt, version)
+        if cached is not None:
+            spec, results_df = cached
+            yield {'type': 'matches', 'rows': results_df, 'done': len(symbols), 'total': len(symbols)}
+            yield {
+                'type': 'done',
+                'summary': (f"Screening complete. Found {len(results_df)} of {len(symbols)} stocks matching: "
+                            f"{describe_screen_spec(spec)} ({source}). Served from cache."),
+                'results': results_df,
+            }
+            return
+    else:
+        # Live results are not cached: they are not tied to a snapshot version
+        fundamentals_store.request_refresh()
+        symbols, sectors = get_sp500_tickers(), GICS_SECTORS
+        load_chunk, source = live_chunk_loader(), "live financial data"
 
+    try:
+        spec = compile_screen(prompt, sectors, llm_fn)
+    except ValueError as e:
+        yield {'type': 'error', 'summary': f"The AI could not turn your request into a valid screen: {e}"}
+        return
     except Exception as e:
-        return f"An error occurred during AI screening: {e}", pd.DataFrame()
+        yield {'type': 'error', 'summary': f"An error occurred during AI screening: {e}"}
+        return
 
+    if load_chunk is None:
+        # The indexed snapshot answers the whole screen in milliseconds; there is nothing to stream
+        results_df = index.query(spec)
+        yield {'type': 'matches', 'rows': results_df, 'done': len(symbols), 'total': len(symbols)}
+    else:
+        matches = []
+        for rows, done, total in stream_screen(spec, symbols, load_chunk, chunk_size, max_workers):
+            matches.append(rows)
+            yield {'type': 'matches', 'rows': rows, 'done': done, 'total': total}
+        results_df = finalize_screen(matches, spec)
+    if version is not None:
+        screen_cache.set(prompt, version, spec, results_df)
+    yield {
+        'type': 'done',
+        'summary': (f"Screening complete. Found {len(results_df)} of {len(symbols)} stocks matching: "
+                    f"{describe_screen_spec(spec)} ({source})."),
+        'results': results_df,
+    }
@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import Future
+
+# Every SingleFlight group created in this process, by name, for reporting
+_groups = {}
+_groups_lock = threading.Lock()
+
+def _copy(result):
+    # Objects with a copy() method (DataFrame, Series, dict, list, set) are mutable; the rest are shared as is
+    copy = getattr(result, 'copy', None)
+    return copy() if callable(copy) else result
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one upstream request.
+
+    The first caller for a key runs the function; callers arriving with the same
+    key while it is still running wait on the same future and receive its result
+    (or exception). The caller that ran the function gets the result object
+    itself; every coalesced caller gets its own `.copy()` of it (DataFrames,
+    dicts, lists), so callers may modify what they receive. Once the call
+    finishes the key is forgotten, so this adds no caching of its own.
+
+    Named groups are listed by `single_flight_stats`. A group created with a
+    name already in use replaces the earlier one there (as happens when
+    Streamlit re-imports an edited module); unnamed groups are not listed.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        if name is not None:
+            with _groups_lock:
+                _groups[name] = self
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) unless an identical call (same key) is already in flight.
+
+        Args:
+            key: Hashable identifier for the call
+            fn (callable): Function performing the expensive request
+
+        Returns:
+            The function's result (a copy of it for coalesced callers)
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        if not is_leader:
+            return _copy(future.result())
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def in_flight(self, key):
+        """Returns True if a call for this key is currently running."""
+        with self._lock:
+            return key in self._in_flight
+
+    def stats(self):
+        """Returns call, execution and coalesced counts for this group."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'coalesced_rate': self.coalesced / self.calls if self.calls else 0.0,
+            }
+
+def single_flight_stats():
+    """Returns stats for every SingleFlight group, keyed by group name."""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
@@ -1,18 +1,148 @@
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
+from . import indicator_kernels
 
-def add_technical_indicators(df):
+# Indicator label (as shown in the Analyser multiselect) -> spec:
+#   inputs:  price columns the indicator reads
+#   params:  keyword arguments passed to its compute function
+#   columns: columns it writes into the frame
+#   compute: function(df, intermediates, **params) that writes those columns
+INDICATOR_REGISTRY = {}
+
+def register_indicator(label, columns, inputs=('Close',), **params):
+    """Decorator adding an indicator compute function to INDICATOR_REGISTRY."""
+    def decorator(compute):
+        INDICATOR_REGISTRY[label] = {'inputs': tuple(inputs), 'params': params, 'columns': list(columns), 'compute': compute}
+        return compute
+    return decorator
+
+class Intermediates:
+    """
+    Per-call memo of series shared between indicators.
+
+    SMA 20 and the Bollinger middle band use the same `sma(20)`, and MACD reuses
+    whichever EMAs were already built, so each intermediate is computed once
+    however many selected indicators need it.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.close = df['Close']
+        self._memo = {}
+
+    def _get(self, key, build):
+        if key not in self._memo:
+            self._memo[key] = build()
+        return self._memo[key]
+
+    def sma(self, length):
+        return self._get(('sma', length), lambda: ta.sma(self.close, length=length))
+
+    def ema(self, length):
+        return self._get(('ema', length), lambda: ta.ema(self.close, length=length))
+
+    def stdev(self, length):
+        # Population standard deviation, the Bollinger Bands convention
+        return self._get(('stdev', length), lambda: self.close.rolling(length).std(ddof=0))
+
+    def rsi(self, length):
+        return ta.rsi(self.close, length=length)
+
+    def signal(self, line, length, start):
+        """EMA of an indicator line, starting at its first valid bar like pandas_ta's MACD signal."""
+        first_valid = line.first_valid_index()
+        if first_valid is None:
+            return line * np.nan
+        return ta.ema(line.loc[first_valid:], length=length).reindex(line.index)
+
+    def obv(self):
+        # Computed directly: pandas_ta 0.4 leaves the first bar empty where 0.3 starts from +volume
+        direction = np.sign(self.close.diff()).fillna(1)
+        return (direction * self.df['Volume']).cumsum()
+
+class NumpyIntermediates(Intermediates):
+    """Intermediates computed by the NumPy kernels on a contiguous (optionally float32) close array."""
+
+    def __init__(self, df, dtype=np.float64):
+        super().__init__(df)
+        self.close = indicator_kernels.as_array(df['Close'].to_numpy(), dtype)
+
+    def sma(self, length):
+        return self._get(('sma', length), lambda: indicator_kernels.sma(self.close, length))
+
+    def ema(self, length):
+        return self._get(('ema', length), lambda: indicator_kernels.ema(self.close, length))
+
+    def stdev(self, length):
+        return self._get(('stdev', length), lambda: indicator_kernels.rolling_std(self.close, length))
+
+    def rsi(self, length):
+        return indicator_kernels.rsi(self.close, length)
+
+    def signal(self, line, length, start):
+        signal_line = np.full(line.shape, np.nan, dtype=line.dtype)
+        signal_line[start:] = indicator_kernels.ema(line[start:], length)
+        return signal_line
+
+    def obv(self):
+        return indicator_kernels.obv(self.close, self.df['Volume'].to_numpy())
+
+@register_indicator("SMA 50", ['SMA_50'], length=50)
+@register_indicator("SMA 20", ['SMA_20'], length=20)
+def _simple_moving_average(df, intermediates, length):
+    df[f'SMA_{length}'] = intermediates.sma(length)
+
+@register_indicator("EMA 20", ['EMA_20'], length=20)
+def _exponential_moving_average(df, intermediates, length):
+    df[f'EMA_{length}'] = intermediates.ema(length)
+
+@register_indicator("Bollinger Bands", ['BBL_20_2.0', 'BBM_20_2.0', 'BBU_20_2.0', 'BBB_20_2.0', 'BBP_20_2.0'], length=20, std=2.0)
+def _bollinger_bands(df, intermediates, length, std):
+    mid = intermediates.sma(length)
+    deviation = std * intermediates.stdev(length)
+    lower, upper = mid - deviation, mid + deviation
+    suffix = f"{length}_{std}"
+    df[f'BBL_{suffix}'] = lower
+    df[f'BBM_{suffix}'] = mid
+    df[f'BBU_{suffix}'] = upper
+    df[f'BBB_{suffix}'] = 100 * (upper - lower) / mid
+    df[f'BBP_{suffix}'] = (intermediates.close - lower) / (upper - lower)
+
+@register_indicator("RSI", ['RSI_14'], length=14)
+def _relative_strength_index(df, intermediates, length):
+    df[f'RSI_{length}'] = intermediates.rsi(length)
+
+@register_indicator("MACD", ['MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9'], fast=12, slow=26, signal=9)
+def _macd(df, intermediates, fast, slow, signal):
+    macd = intermediates.ema(fast) - intermediates.ema(slow)
+    signal_line = intermediates.signal(macd, signal, start=slow - 1)
+    suffix = f"{fast}_{slow}_{signal}"
+    df[f'MACD_{suffix}'] = macd
+    df[f'MACDh_{suffix}'] = macd - signal_line
+    df[f'MACDs_{suffix}'] = signal_line
+
+@register_indicator("OBV", ['OBV'], inputs=('Close', 'Volume'))
+def _on_balance_volume(df, intermediates):
+    df['OBV'] = intermediates.obv()
+
+def add_technical_indicators(df, selected=None, kernels="pandas_ta", dtype=np.float64):
     """
     Calculate and add technical indicators to stock price data.
-    
-    This function adds several popular technical indicators to the DataFrame:
+
+    Indicators come from INDICATOR_REGISTRY:
     - Simple Moving Averages (20 and 50 periods)
     - Exponential Moving Average (20 periods)
     - Bollinger Bands (20 periods, 2 standard deviations)
     - Relative Strength Index (14 periods)
     - MACD (12, 26, 9)
     - On-Balance Volume
-    
+
+    Only the selected indicators are computed, intermediates they share are
+    computed once, and columns are written into `df` in place. With
+    kernels="numpy" the indicators run on contiguous NumPy arrays instead of
+    pandas_ta Series, optionally in float32 to halve memory on long histories.
+
     Args:
         df (pd.DataFrame): Historical price data with columns:
             - Open: Opening prices
@@ -20,32 +150,27 @@ def add_technical_indicators(df):
             - Low: Lowest prices
             - Close: Closing prices
             - Volume: Trading volume
-        
+        selected (list): Indicator labels to compute (e.g. ["SMA 20", "RSI"]); None computes all
+        kernels (str): "pandas_ta" or "numpy"
+        dtype: Float dtype for the NumPy kernels (np.float64 or np.float32)
+
     Returns:
-        pd.DataFrame: Original DataFrame with additional indicator columns
+        pd.DataFrame: The same DataFrame with the indicator columns added
     """
     if df.empty:
         return df
-        
-    # Calculate trend-following indicators
-    df['SMA_20'] = ta.sma(df['Close'], length=20)
-    df['SMA_50'] = ta.sma(df['Close'], length=50)
-    df['EMA_20'] = ta.ema(df['Close'], length=20)
-    
-    # Calculate volatility indicators
-    bollinger = ta.bbands(df['Close'], length=20)
-    if bollinger is not None and not bollinger.empty:
-        df = df.join(bollinger)
-
-    # Calculate momentum indicators
-    df['RSI_14'] = ta.rsi(df['Close'], length=14)
-    
-    # Calculate trend and momentum crossover indicator
-    macd = ta.macd(df['Close'])
-    if macd is not None and not macd.empty:
-        df = df.join(macd)
-
-    # Calculate volume-based indicator
-    df['OBV'] = ta.obv(df['Close'], df['Volume'])
-    
+
+    labels = INDICATOR_REGISTRY if selected is None else selected
+    intermediates = NumpyIntermediates(df, dtype) if kernels == "numpy" else Intermediates(df)
+    for label in labels:
+        spec = INDICATOR_REGISTRY.get(label)
+        if spec is None:
+            print(f"Unknown technical indicator: {label}")
+            continue
+        missing = [column for column in spec['inputs'] if column not in df.columns]
+        if missing:
+            print(f"Skipping {label}: missing columns {missing}")
+            continue
+        spec['compute'](df, intermediates, **spec['params'])
+
     return df
@@ -0,0 +1,295 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from . import indicator_kernels
+
+# Bars an indicator needs before its value is reported for a ticker
+REQUIRED_BARS = {'SMA_20': 20, 'SMA_50': 50, 'EMA_20': 20, 'RSI_14': 15, 'BB_Position': 20}
+# How many recent bars count when flagging a moving-average crossover
+CROSSOVER_LOOKBACK = 5
+# Columns of latest_signals that technical filters may reference
+NUMERIC_SIGNAL_COLUMNS = ['Close', 'Volume', 'SMA_20', 'SMA_50', 'EMA_20', 'RSI_14', 'BB_Position']
+FLAG_SIGNAL_COLUMNS = ['Above_SMA_50', 'Golden_Cross', 'Death_Cross']
+SIGNAL_COLUMNS = NUMERIC_SIGNAL_COLUMNS + FLAG_SIGNAL_COLUMNS
+MAX_SIGNAL_CONDITIONS = 20
+MAX_SIGNAL_QUERY_LENGTH = 500
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<compare><=|>=|==|!=|<|>|=)
+  | (?P<symbol>[()&|~])
+""", re.VERBOSE)
+_COMPARISONS = {
+    '<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal,
+    '==': np.equal, '!=': np.not_equal,
+}
+# Operator to use when a comparison is written number-first ("30 > RSI_14")
+_MIRRORED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+
+class PricePanel:
+    """
+    Closes and volumes for many tickers aligned on one date index as 2-D arrays.
+
+    Rows are trading days and columns are tickers, so every indicator kernel
+    runs once over the whole universe instead of once per ticker DataFrame.
+    Gaps inside a ticker's history are forward-filled; days before its first
+    bar are backfilled and its signals are withheld until enough real bars exist.
+    """
+
+    def __init__(self, tickers, dates, close, volume, valid_bars):
+        self.tickers = list(tickers)
+        self.dates = dates
+        self.close = close
+        self.volume = volume
+        self.valid_bars = valid_bars
+
+    @classmethod
+    def from_histories(cls, histories, dtype=np.float64):
+        """
+        Builds a panel from per-ticker OHLCV frames.
+
+        Args:
+            histories (dict): Ticker -> DataFrame with Close and Volume columns, indexed by date
+            dtype: np.float64, or np.float32 to halve memory
+
+        Returns:
+            PricePanel
+        """
+        closes, volumes = {}, {}
+        for ticker, df in histories.items():
+            if df is None or df.empty:
+                continue
+            index = pd.DatetimeIndex(df.index)
+            index = (index.tz_localize(None) if index.tz is not None else index).normalize()
+            closes[ticker] = pd.Series(df['Close'].to_numpy(), index=index)
+            volumes[ticker] = pd.Series(df['Volume'].to_numpy(), index=index)
+
+        close = pd.DataFrame(closes).sort_index()
+        volume = pd.DataFrame(volumes).reindex(close.index)
+        valid_bars = close.notna().sum().to_numpy()
+        close = close.ffill().bfill()
+        return cls(
+            close.columns,
+            close.index,
+            indicator_kernels.as_array(close.to_numpy(), dtype),
+            indicator_kernels.as_array(volume.fillna(0).to_numpy(), dtype),
+            valid_bars,
+        )
+
+    @classmethod
+    def from_store(cls, tickers, start_date, end_date, store, max_workers=16, dtype=np.float64):
+        """
+        Builds a panel from a PriceStore, fetching histories concurrently.
+
+        Returns:
+            tuple: (PricePanel, dict of ticker -> error message for tickers that failed)
+        """
+        def fetch(ticker):
+            try:
+                return ticker, store.get_history(ticker, start_date, end_date), None
+            except Exception as e:
+                return ticker, None, str(e)
+
+        histories, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for ticker, hist, error in executor.map(fetch, tickers):
+                if error:
+                    errors[ticker] = error
+                elif hist is not None and not hist.empty:
+                    histories[ticker] = hist
+                else:
+                    errors[ticker] = "No price history"
+        return cls.from_histories(histories, dtype), errors
+
+    def latest_signals(self, lookback=CROSSOVER_LOOKBACK):
+        """
+        Computes the latest technical signals for every ticker in one pass.
+
+        Returns:
+            pd.DataFrame: Indexed by Symbol with Close, Volume, SMA_20, SMA_50, EMA_20,
+                RSI_14, BB_Position (0 = lower band, 1 = upper band), Above_SMA_50,
+                Golden_Cross and Death_Cross (SMA 20 crossing SMA 50 within `lookback` bars)
+        """
+        if not self.tickers or len(self.dates) == 0:
+            return pd.DataFrame()
+        close = self.close
+        sma_20 = indicator_kernels.sma(close, 20)
+        sma_50 = indicator_kernels.sma(close, 50)
+        _, _, _, _, bb_position = indicator_kernels.bollinger_bands(close, 20, 2.0)
+
+        # Sign of SMA 20 - SMA 50 over the last lookback + 1 bars shows any crossover
+        spread_sign = np.sign(sma_20[-(lookback + 1):] - sma_50[-(lookback + 1):])
+        crossed_up = ((spread_sign[1:] > 0) & (spread_sign[:-1] <= 0)).any(axis=0)
+        crossed_down = ((spread_sign[1:] < 0) & (spread_sign[:-1] >= 0)).any(axis=0)
+
+        signals = pd.DataFrame({
+            'Close': close[-1],
+            'Volume': self.volume[-1],
+            'SMA_20': sma_20[-1],
+            'SMA_50': sma_50[-1],
+            'EMA_20': indicator_kernels.ema(close, 20)[-1],
+            'RSI_14': indicator_kernels.rsi(close, 14)[-1],
+            'BB_Position': bb_position[-1],
+        }, index=pd.Index(self.tickers, name='Symbol'))
+        for column, bars in REQUIRED_BARS.items():
+            signals.loc[self.valid_bars < bars, column] = np.nan
+        enough_history = self.valid_bars >= 50 + lookback
+        signals['Above_SMA_50'] = signals['Close'] > signals['SMA_50']
+        signals['Golden_Cross'] = crossed_up & enough_history
+        signals['Death_Cross'] = crossed_down & enough_history
+        return signals
+
+def _tokenize(query):
+    tokens, position = [], 0
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            raise ValueError(f"Unexpected text at {query[position:position + 10]!r}")
+        position = match.end()
+        if match.lastgroup != 'space':
+            tokens.append((match.lastgroup, match.group()))
+    return tokens
+
+class _QueryParser:
+    """Recursive-descent parser for the technical filter language (see parse_signal_query)."""
+
+    def __init__(self, query):
+        self.tokens = _tokenize(query)
+        self.position = 0
+        self.conditions = 0
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self):
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _keyword(self, *words):
+        kind, text = self._peek()
+        if kind in ('word', 'symbol') and text.lower() in words:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("The filter is empty")
+        node = self._or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected {self._peek()[1]!r}")
+        return node
+
+    def _or(self):
+        args = [self._and()]
+        while self._keyword('or', '|'):
+            args.append(self._and())
+        return args[0] if len(args) == 1 else {'op': 'or', 'args': args}
+
+    def _and(self):
+        args = [self._not()]
+        while self._keyword('and', '&'):
+            args.append(self._not())
+        return args[0] if len(args) == 1 else {'op': 'and', 'args': args}
+
+    def _not(self):
+        if self._keyword('not', '~'):
+            return {'op': 'not', 'arg': self._not()}
+        if self._keyword('('):
+            node = self._or()
+            if not self._keyword(')'):
+                raise ValueError("Missing ')'")
+            return node
+        return self._condition()
+
+    def _operand(self):
+        kind, text = self._take()
+        if kind == 'number':
+            return float(text)
+        if kind == 'word' and text.lower() in ('true', 'false'):
+            return text.lower() == 'true'
+        if kind == 'word' and text in SIGNAL_COLUMNS:
+            return {'column': text}
+        if kind == 'word':
+            raise ValueError(f"Unknown column {text!r}; use one of {', '.join(SIGNAL_COLUMNS)}")
+        raise ValueError(f"Expected a column or number, got {text!r}" if text else "The filter ends too early")
+
+    def _condition(self):
+        self.conditions += 1
+        if self.conditions > MAX_SIGNAL_CONDITIONS:
+            raise ValueError(f"A filter can have at most {MAX_SIGNAL_CONDITIONS} conditions")
+        left = self._operand()
+        kind, op = self._peek()
+        if kind != 'compare':
+            if isinstance(left, dict) and left['column'] in FLAG_SIGNAL_COLUMNS:
+                return {'column': left['column'], 'op': '==', 'value': True}
+            raise ValueError(f"{left['column'] if isinstance(left, dict) else left!r} needs a comparison such as '< 30'")
+        self.position += 1
+        op = '==' if op == '=' else op
+        right = self._operand()
+        if not isinstance(left, dict):
+            if not isinstance(right, dict):
+                raise ValueError("A comparison needs at least one column")
+            left, right, op = right, left, _MIRRORED[op]
+        column = left['column']
+        if column in FLAG_SIGNAL_COLUMNS:
+            if op not in ('==', '!=') or not isinstance(right, bool):
+                raise ValueError(f"{column} can only be compared with == or != against true/false")
+        elif isinstance(right, bool) or (isinstance(right, dict) and right['column'] in FLAG_SIGNAL_COLUMNS):
+            raise ValueError(f"{column} is numeric and cannot be compared with true/false")
+        return {'column': column, 'op': op, 'value': right}
+
+def parse_signal_query(query):
+    """
+    Parses a technical filter into a validated condition tree.
+
+    The language only allows signal columns, numbers, true/false, the
+    comparisons <, <=, >, >=, ==, != and and/or/not (or &, |, ~) with
+    parentheses, e.g. "RSI_14 < 30 and Close > SMA_50" or
+    "Golden_Cross and not (BB_Position > 0.8)". Flag columns may stand alone.
+    Nothing in the text is ever evaluated as Python.
+
+    Raises:
+        ValueError: If the filter uses anything else
+    """
+    if not isinstance(query, str) or len(query) > MAX_SIGNAL_QUERY_LENGTH:
+        raise ValueError(f"The filter must be text of at most {MAX_SIGNAL_QUERY_LENGTH} characters")
+    return _QueryParser(query).parse()
+
+def _signal_mask(signals, node):
+    if node.get('op') in ('and', 'or'):
+        masks = [_signal_mask(signals, arg) for arg in node['args']]
+        return np.logical_and.reduce(masks) if node['op'] == 'and' else np.logical_or.reduce(masks)
+    if node.get('op') == 'not':
+        return ~_signal_mask(signals, node['arg'])
+    column, op, value = node['column'], node['op'], node['value']
+    if column in FLAG_SIGNAL_COLUMNS:
+        equal = signals[column].to_numpy(dtype=bool) == value
+        return equal if op == '==' else ~equal
+    left = signals[column].to_numpy(dtype='float64')
+    right = signals[value['column']].to_numpy(dtype='float64') if isinstance(value, dict) else value
+    with np.errstate(invalid='ignore'):
+        return _COMPARISONS[op](left, right)
+
+def screen_signals(signals, query):
+    """
+    Filters a latest_signals frame with a technical filter (see parse_signal_query).
+
+    Args:
+        signals (pd.DataFrame): Output of PricePanel.latest_signals
+        query (str or dict): e.g. "RSI_14 < 30 and Close > SMA_50", or an already parsed filter
+
+    Returns:
+        pd.DataFrame: Matching rows
+
+    Raises:
+        ValueError: If the filter is not valid
+    """
+    spec = parse_signal_query(query) if isinstance(query, str) else query
+    if signals.empty:
+        return signals
+    return signals[_signal_mask(signals, spec)]
@@ -0,0 +1,52 @@
+"""
+Wall-clock time of batch Prophet forecasting on a process pool versus a serial loop.
+
+Uses synthetic price series and a throwaway cache directory, so every ticker is
+a cold fit. Run from the project root:
+    python benchmarks/bench_batch_forecast.py [--sizes 1 5 10 25 50] [--workers N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QUANTVIEW_CACHE_DIR", tempfile.mkdtemp(prefix="qv_bench_"))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import logging
+from backend.price_store import FakePriceProvider
+from backend import predictor
+
+def synthetic_histories(n, run_id):
+    provider = FakePriceProvider(seed=run_id)
+    return {f"SYN{run_id}X{i}": provider(f"SYN{i}", "2023-01-01", "2025-01-01") for i in range(n)}
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--serial", action="store_true", help="also time a serial loop (slow)")
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+
+    print(f"{'tickers':>8} {'batch s':>9} {'s/ticker':>9}" + (f" {'serial s':>9} {'speedup':>8}" if args.serial else ""))
+    for run_id, n in enumerate(args.sizes):
+        histories = synthetic_histories(n, run_id)
+        started = time.perf_counter()
+        forecasts, errors = predictor.get_batch_predictions(histories, max_workers=args.workers)
+        batch = time.perf_counter() - started
+        assert len(forecasts) == n, errors
+        line = f"{n:>8} {batch:>9.2f} {batch / n:>9.3f}"
+        if args.serial:
+            histories = synthetic_histories(n, run_id + 1000)
+            started = time.perf_counter()
+            for ticker, hist in histories.items():
+                predictor.get_price_prediction(hist, ticker)
+            serial = time.perf_counter() - started
+            line += f" {serial:>9.2f} {serial / batch:>7.1f}x"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Accuracy versus latency of the Prophet and fast (exponential smoothing) forecast engines.
+
+Each synthetic series is a geometric random walk with drift and a weekly/yearly
+cycle; the last 30 trading days are held out and compared with each engine's
+forecast. Run from the project root:
+    python benchmarks/bench_forecast_engines.py [--series 20]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QUANTVIEW_CACHE_DIR", tempfile.mkdtemp(prefix="qv_bench_"))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from backend.backtester import synthetic_price_series
+from backend.predictor import get_price_prediction
+
+HOLDOUT = 30
+
+def evaluate(engine, series):
+    mape, coverage, seconds = [], [], []
+    for i, df in enumerate(series):
+        train, test = df.iloc[:-HOLDOUT], df.iloc[-HOLDOUT:]
+        started = time.perf_counter()
+        # Unique ticker names keep the model cache from short-circuiting repeat runs
+        forecast = get_price_prediction(train, ticker=f"BENCH{engine}{i}", engine=engine)
+        seconds.append(time.perf_counter() - started)
+        merged = forecast.set_index('ds').join(test, how='inner')
+        mape.append(np.mean(np.abs(merged['yhat'] / merged['Close'] - 1)) * 100)
+        coverage.append(np.mean((merged['Close'] >= merged['yhat_lower']) & (merged['Close'] <= merged['yhat_upper'])) * 100)
+    return np.mean(mape), np.mean(coverage), np.median(seconds) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--series", type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+
+    series = [synthetic_price_series(seed) for seed in range(args.series)]
+    print(f"{args.series} series, {HOLDOUT}-day holdout")
+    print(f"{'engine':>8} {'MAPE %':>8} {'coverage %':>11} {'median ms':>10}")
+    for engine in ("prophet", "fast"):
+        mape, coverage, ms = evaluate(engine, series)
+        print(f"{engine:>8} {mape:>8.2f} {coverage:>11.1f} {ms:>10.1f}")
+
+if __name__ == "__main__":
+    main()
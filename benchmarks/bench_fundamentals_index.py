@@ -0,0 +1,72 @@
+"""
+Indexed fundamentals screens against a plain DataFrame scan.
+
+Builds a synthetic key-stats table, then times typical range, top-k and
+sector queries through FundamentalsIndex.query and screen_query.apply_screen_spec,
+checking that both return the same rows. Run from the project root:
+    python benchmarks/bench_fundamentals_index.py [--symbols 500 10000] [--repeats 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from backend.fundamentals_index import FundamentalsIndex
+from backend.screen_query import apply_screen_spec, describe_screen_spec, validate_screen_spec
+
+QUERIES = [
+    {'filters': [{'column': 'Market Cap', 'op': '>', 'value': 100e9}]},
+    {'filters': [], 'sort': {'column': 'Revenue Growth', 'descending': True}, 'limit': 20},
+    {'filters': [{'column': 'Debt/Equity', 'op': '<', 'value': 50}]},
+    {'filters': [{'column': 'Sector', 'op': '==', 'value': 'Technology'}, {'column': 'P/E Ratio', 'op': 'between', 'value': [10, 25]}],
+     'sort': {'column': 'Profit Margin', 'descending': True}, 'limit': 10},
+    {'filters': [{'column': 'Sector', 'op': 'in', 'value': ['Energy', 'Utilities']}, {'column': 'Revenue Growth', 'op': '>', 'value': 0.1}]},
+]
+SECTORS = ["Technology", "Healthcare", "Financial Services", "Energy", "Industrials", "Utilities", "Real Estate",
+           "Consumer Cyclical", "Consumer Defensive", "Communication Services", "Basic Materials"]
+
+def synthetic_stats(n, seed=0):
+    """Key-stats table shaped like a fundamentals snapshot."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Symbol': [f"S{i:05d}" for i in range(n)],
+        'Name': [f"Company {i}" for i in range(n)],
+        'Sector': rng.choice(SECTORS, n),
+        'Industry': rng.choice([f"Industry {i}" for i in range(60)], n),
+        'Market Cap': np.round(rng.lognormal(23, 1.5, n), -6),
+        'P/E Ratio': np.round(rng.uniform(0, 60, n), 2),
+        'Debt/Equity': np.round(rng.uniform(0, 250, n), 1),
+        'Profit Margin': np.round(rng.uniform(-0.1, 0.4, n), 3),
+        'Revenue Growth': np.round(rng.uniform(-0.2, 0.5, n), 3),
+    })
+
+def timed(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[500, 10000])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    specs = [validate_screen_spec(query) for query in QUERIES]
+    for n in args.symbols:
+        df = synthetic_stats(n)
+        build_seconds, index = timed(lambda: FundamentalsIndex(df), 5)
+        print(f"\n{n} symbols (index built in {build_seconds * 1e3:.2f} ms)")
+        for spec in specs:
+            scan_seconds, expected = timed(lambda: apply_screen_spec(df, spec), args.repeats)
+            index_seconds, result = timed(lambda: index.query(spec), args.repeats)
+            assert result.index.equals(expected.index), describe_screen_spec(spec)
+            print(f"  {describe_screen_spec(spec)[:70]:<70} scan {scan_seconds * 1e3:7.3f} ms  "
+                  f"index {index_seconds * 1e3:7.3f} ms  ({scan_seconds / index_seconds:5.1f}x, {len(result)} rows)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Cost of computing technical indicators per Analyser selection.
+
+Compares the registry path, which computes only the selected indicators in
+place, with the previous behaviour of computing every indicator and joining
+the Bollinger and MACD frames into copies. Needs pandas_ta; run from the
+project root:
+    python benchmarks/bench_indicator_selection.py [--bars 2500] [--repeats 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from backend.technical_analyzer import INDICATOR_REGISTRY, add_technical_indicators
+
+def synthetic_ohlcv(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, bars)))
+    return pd.DataFrame({
+        'Open': close * 0.995, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+        'Volume': rng.integers(100_000, 5_000_000, bars).astype('float64'),
+    }, index=pd.bdate_range("2015-01-02", periods=bars, name="Date"))
+
+def compute_everything(df):
+    """The previous add_technical_indicators: all indicators, two joins."""
+    df['SMA_20'] = ta.sma(df['Close'], length=20)
+    df['SMA_50'] = ta.sma(df['Close'], length=50)
+    df['EMA_20'] = ta.ema(df['Close'], length=20)
+    df = df.join(ta.bbands(df['Close'], length=20))
+    df['RSI_14'] = ta.rsi(df['Close'], length=14)
+    df = df.join(ta.macd(df['Close']))
+    df['OBV'] = ta.obv(df['Close'], df['Volume'])
+    return df
+
+def time_call(fn, df, repeats):
+    timings = []
+    for _ in range(repeats):
+        frame = df.copy()
+        started = time.perf_counter()
+        fn(frame)
+        timings.append(time.perf_counter() - started)
+    return np.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=2500)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    df = synthetic_ohlcv(args.bars)
+    baseline = time_call(compute_everything, df, args.repeats)
+    selections = [[label] for label in INDICATOR_REGISTRY]
+    selections += [["SMA 20", "SMA 50"], ["SMA 20", "Bollinger Bands"], ["EMA 20", "MACD"], list(INDICATOR_REGISTRY)]
+
+    print(f"{args.bars} bars, median of {args.repeats} runs")
+    print(f"{'selection':<48}{'ms':>8}{'vs all':>9}")
+    print(f"{'(previous: everything + joins)':<48}{baseline * 1e3:>8.2f}{1:>8.1f}x")
+    for selection in selections:
+        seconds = time_call(lambda frame: add_technical_indicators(frame, selection), df, args.repeats)
+        print(f"{', '.join(selection)[:47]:<48}{seconds * 1e3:>8.2f}{baseline / seconds:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Concurrent key-statistics fetch for a full S&P 500 sized universe, offline.
+
+A FakeInfoProvider stands in for yFinance with per-call latency, a few
+transient failures and one hung call. It sits behind a TickerInfoCache, as in
+production, so the bounded worker pool, timeouts and retries (which must not
+join the hung, coalesced call) are exercised without the network. Run from the
+project root:
+    python benchmarks/bench_key_stats.py [--tickers 500] [--latency 0.3] [--workers 16]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.key_stats import FakeInfoProvider, fetch_key_stats
+from backend.metadata_cache import TickerInfoCache
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds per .info call")
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    tickers = [f"SYM{i:03d}" for i in range(args.tickers)]
+    provider = FakeInfoProvider(latency=args.latency, jitter=args.latency / 2,
+                                failures={tickers[1]: 1, tickers[2]: 2}, hangs=[tickers[3]], hang_seconds=5 * args.latency)
+    cache = TickerInfoCache(fetcher=provider)
+
+    def report(done, total, symbol):
+        if done % 50 == 0 or done == total:
+            print(f"  {done}/{total} done")
+
+    started = time.perf_counter()
+    df, errors = fetch_key_stats(tickers, info_fn=cache.get, retry_fn=cache.refresh, max_workers=args.workers,
+                                 timeout=3 * args.latency, retries=2, backoff=0.1, progress_callback=report)
+    elapsed = time.perf_counter() - started
+
+    serial = args.tickers * (args.latency * 1.25)
+    print(f"\n{len(df)} of {args.tickers} tickers in {elapsed:.1f}s with {args.workers} workers "
+          f"(~{serial:.0f}s serially); {len(provider.calls)} provider calls, {len(errors)} errors")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Technical screening across a whole universe with the 2-D price panel.
+
+Builds a panel of synthetic daily bars for N tickers (S&P 500 sized by
+default), computes RSI, moving averages, crossovers and Bollinger position for
+every ticker in one pass, and runs a few screening queries. Run from the
+project root:
+    python benchmarks/bench_panel_screen.py [--tickers 500] [--bars 252]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from backend.technical_screener import PricePanel, screen_signals
+
+QUERIES = [
+    "RSI_14 < 30 and Close > SMA_50",
+    "Golden_Cross",
+    "BB_Position < 0.1 and Volume > 1e6",
+]
+
+def synthetic_histories(tickers, bars, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=bars, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, (bars, tickers)), axis=0))
+    volume = rng.integers(100_000, 5_000_000, (bars, tickers))
+    return {
+        f"T{i:04d}": pd.DataFrame({'Close': close[:, i], 'Volume': volume[:, i]}, index=dates)
+        for i in range(tickers)
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=252)
+    args = parser.parse_args()
+
+    histories = synthetic_histories(args.tickers, args.bars)
+
+    started = time.perf_counter()
+    panel = PricePanel.from_histories(histories)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    signals = panel.latest_signals()
+    signal_seconds = time.perf_counter() - started
+
+    print(f"{args.tickers} tickers x {args.bars} bars")
+    print(f"build panel:      {build_seconds * 1e3:8.1f} ms (once per data refresh)")
+    print(f"compute signals:  {signal_seconds * 1e3:8.1f} ms")
+    for query in QUERIES:
+        started = time.perf_counter()
+        matches = screen_signals(signals, query)
+        print(f"query {query!r:<40} {(time.perf_counter() - started) * 1e3:6.1f} ms  {len(matches)} matches")
+
+if __name__ == "__main__":
+    main()
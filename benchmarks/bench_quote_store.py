@@ -0,0 +1,60 @@
+"""
+Downloads needed to serve live prices to many portfolio sessions.
+
+Simulates sessions whose holdings overlap (random subsets of a small universe)
+reloading their portfolio pages. The old approach makes one download per
+distinct ticker list per cache period; the shared QuoteStore fetches each new
+symbol once and then refreshes every held symbol in one batch per interval.
+Downloads go to a FakeQuoteFetcher with per-call latency. Run from the project root:
+    python benchmarks/bench_quote_store.py [--sessions 200] [--universe 60] [--latency 0.2]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.quote_store import FakeQuoteFetcher, QuoteStore
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--universe", type=int, default=60)
+    parser.add_argument("--holdings", type=int, default=8, help="symbols held per session")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per download")
+    parser.add_argument("--refreshes", type=int, default=5, help="refresh intervals simulated")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    universe = [f"S{i:03d}" for i in range(args.universe)]
+    portfolios = [rng.sample(universe, args.holdings) for _ in range(args.sessions)]
+    for portfolio in portfolios:
+        rng.shuffle(portfolio)
+
+    # Old behaviour: every distinct ticker list is its own cache entry, downloaded once per period
+    distinct_lists = len({tuple(portfolio) for portfolio in portfolios})
+    old_downloads = distinct_lists * args.refreshes
+    print(f"{args.sessions} sessions, {args.holdings} of {args.universe} symbols each, {args.refreshes} refresh periods")
+    print(f"  per-list cache : {old_downloads:5d} downloads ({old_downloads * args.latency:7.1f}s of download time)")
+
+    fetcher = FakeQuoteFetcher(latency=args.latency)
+    store = QuoteStore(fetcher=fetcher, interval=3600)  # Refreshes are driven explicitly below
+    cold, warm = [], []
+    for period in range(args.refreshes):
+        if period:
+            store.refresh()
+        for portfolio in portfolios:
+            start = time.perf_counter()
+            prices, as_of = store.get(portfolio)
+            (warm if period else cold).append(time.perf_counter() - start)
+            assert len(prices) == len(portfolio) and as_of is not None
+    stats = store.stats()
+    print(f"  shared store   : {stats['batches']:5d} downloads ({stats['batches'] * args.latency:7.1f}s of download time), "
+          f"{stats['avg_batch_size']:.1f} symbols per batch")
+    print(f"  lookup latency : first period {sum(cold) / len(cold) * 1e3:.2f} ms avg, "
+          f"later periods {sum(warm) / max(len(warm), 1) * 1e6:.1f} us avg")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Hit rate and latency of the AI screener result cache on a repetitive workload.
+
+A stream of screening requests is replayed in which most requests repeat an
+earlier one with different casing, spacing, number formatting or a filler
+word. Each miss pays a simulated LLM call and a local screen; hits are served
+from the cache. Run from the project root:
+    python benchmarks/bench_screen_cache.py [--requests 2000] [--llm-latency 0.01]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+from backend.key_stats import FakeInfoProvider, extract_key_stats
+from backend.screen_cache import ScreenResultCache
+from backend.screen_query import apply_screen_spec, validate_screen_spec
+
+BASE_PROMPTS = [
+    ("tech stocks with P/E below {n}", lambda n: [{'column': 'Sector', 'op': '==', 'value': 'Technology'},
+                                                  {'column': 'P/E Ratio', 'op': '<', 'value': n}]),
+    ("healthcare companies with profit margin above {n} percent", lambda n: [
+        {'column': 'Sector', 'op': '==', 'value': 'Healthcare'}, {'column': 'Profit Margin', 'op': '>', 'value': n / 100}]),
+    ("stocks with market cap over {n} billion", lambda n: [{'column': 'Market Cap', 'op': '>', 'value': n * 1e9}]),
+    ("energy stocks with debt/equity under {n}", lambda n: [{'column': 'Sector', 'op': '==', 'value': 'Energy'},
+                                                           {'column': 'Debt/Equity', 'op': '<', 'value': n}]),
+]
+NUMBERS = [10, 15, 20, 25, 30, 50, 100]
+
+def variant(text, n, rng):
+    """Rewrites a prompt the way different users type the same request."""
+    number = rng.choice([str(n), f"{n}.0", f"{n:.2f}"])
+    text = text.replace("{n}", number)
+    text = rng.choice([text, text.upper(), text.capitalize(), "  ".join(text.split())])
+    text = rng.choice([text, text + ".", text + "?", "show me " + text, "find " + text])
+    return text
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--llm-latency", type=float, default=0.01, help="seconds per simulated LLM call")
+    args = parser.parse_args()
+
+    info = FakeInfoProvider(latency=0.0)
+    df_stats = pd.DataFrame([extract_key_stats(f"S{i:04d}", info(f"S{i:04d}")) for i in range(args.symbols)])
+    rng = random.Random(0)
+    workload = []
+    for _ in range(args.requests):
+        template, filters = rng.choice(BASE_PROMPTS)
+        n = rng.choice(NUMBERS)
+        workload.append((variant(template, n, rng), filters(n)))
+
+    print(f"{args.requests} requests over {len(BASE_PROMPTS) * len(NUMBERS)} distinct screens, {args.symbols} symbols")
+    for label, cache in (("no cache", None), ("cache", ScreenResultCache())):
+        wrong = 0
+        start = time.perf_counter()
+        for prompt, filters in workload:
+            spec = validate_screen_spec({'filters': filters})
+            if cache is not None:
+                cached = cache.get(prompt, 1)
+                if cached is not None:
+                    wrong += cached[0] != spec
+                    continue
+            time.sleep(args.llm_latency)  # The LLM compiling the prompt
+            results = apply_screen_spec(df_stats, spec)
+            if cache is not None:
+                cache.set(prompt, 1, spec, results)
+        elapsed = time.perf_counter() - start
+        line = f"{label:>10}: {elapsed:7.2f}s total, {elapsed / len(workload) * 1e3:6.2f} ms/request"
+        if cache is not None:
+            stats = cache.stats()
+            line += f", hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits), {wrong} wrong results"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Per-article cost of sentiment scoring, before and after the shared VADER analyzer + memo.
+
+Run from the project root:
+    python benchmarks/bench_sentiment.py [--articles 3000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from backend import ai_analyzer
+
+SUBJECTS = ["Apple", "Microsoft", "Nvidia", "Tesla", "Amazon", "Alphabet", "Meta", "Netflix"]
+VERBS = ["surges", "plunges", "beats estimates", "misses estimates", "rallies", "slides", "holds steady", "soars"]
+REASONS = ["after strong earnings", "on weak guidance", "amid regulatory fears", "as demand booms",
+           "following a downgrade", "on record revenue", "despite supply issues", "after CEO comments"]
+
+def make_corpus(n, seed=42):
+    """Builds n synthetic news articles in NewsAPI's shape."""
+    rng = random.Random(seed)
+    return [{
+        'title': f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(REASONS)} ({i})",
+        'description': f"Shares {rng.choice(VERBS)} {rng.choice(REASONS)}; analysts remain {rng.choice(['bullish', 'cautious', 'worried', 'upbeat'])}.",
+    } for i in range(n)]
+
+def baseline_analyze_sentiment(articles):
+    """The previous implementation: a fresh analyzer (and lexicon load) on every call."""
+    analyzer = SentimentIntensityAnalyzer()
+    scores = [analyzer.polarity_scores(a['title'] + ". " + a['description'])['compound'] for a in articles]
+    return sum(scores) / len(scores) if scores else 0.0
+
+def per_article_us(func, batches):
+    started = time.perf_counter()
+    for batch in batches:
+        func(batch)
+    return (time.perf_counter() - started) / sum(len(b) for b in batches) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=3000)
+    parser.add_argument("--batch-size", type=int, default=20, help="articles per call (NewsAPI page size)")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.articles)
+    batches = [corpus[i:i + args.batch_size] for i in range(0, len(corpus), args.batch_size)]
+
+    before = per_article_us(baseline_analyze_sentiment, batches)
+    cold = per_article_us(ai_analyzer.analyze_sentiment, batches)
+    warm = per_article_us(ai_analyzer.analyze_sentiment, batches)
+    batch = per_article_us(ai_analyzer.score_articles, [corpus])
+
+    print(f"{args.articles} articles, {args.batch_size} per call")
+    print(f"  before (new analyzer per call): {before:8.1f} us/article")
+    print(f"  after, cold memo:               {cold:8.1f} us/article")
+    print(f"  after, warm memo:               {warm:8.1f} us/article")
+    print(f"  score_articles, one batch:      {batch:8.1f} us/article (warm)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Parity and latency of the streaming indicator engine against the pandas_ta batch path.
+
+The engine is seeded with most of a synthetic series, the remaining bars are fed
+one at a time, and every value is compared with
+technical_analyzer.add_technical_indicators (both kernel choices) run over the
+whole series. Exits 1 if any column differs by more than TOLERANCE or has NaNs
+on different bars.
+Latency compares one O(1) update with recomputing all indicators for the grown
+frame, which is what a live refresh did before. Needs pandas_ta; run from the
+project root:
+    python benchmarks/check_indicator_parity.py [--bars 2000] [--live 250]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from backend.technical_analyzer import add_technical_indicators
+from backend.indicator_stream import INDICATOR_COLUMNS, StreamingIndicators
+
+TOLERANCE = 1e-8
+
+def synthetic_bars(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, bars)))
+    # Repeat a few closes so flat days (zero RSI/OBV contribution) are exercised
+    for i in np.sort(rng.choice(np.arange(1, bars), bars // 50, replace=False)):
+        close[i] = close[i - 1]
+    volume = rng.integers(100_000, 5_000_000, bars).astype('float64')
+    return pd.DataFrame({'Close': close, 'Volume': volume}, index=pd.bdate_range("2015-01-02", periods=bars, name="Date"))
+
+def compare(streamed, expected):
+    """Compares every engine column with the batch output; returns the columns that differ."""
+    differences = []
+    print(f"{'column':<16}{'max rel diff':>14}  NaNs match")
+    for column in INDICATOR_COLUMNS:
+        got, want = streamed[column].to_numpy(), expected[column].to_numpy(dtype='float64')
+        nans_match = bool((np.isnan(got) == np.isnan(want)).all())
+        both = ~np.isnan(got) & ~np.isnan(want)
+        rel = np.abs(got[both] - want[both]) / np.maximum(1.0, np.abs(want[both]))
+        diff = rel.max() if len(rel) else 0.0
+        if not nans_match or diff >= TOLERANCE:
+            differences.append(column)
+        print(f"{column:<16}{diff:>14.2e}  {nans_match}")
+    return differences
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--live", type=int, default=250, help="bars fed one at a time after seeding")
+    args = parser.parse_args()
+
+    df = synthetic_bars(args.bars)
+    seed_df, live_df = df.iloc[:-args.live], df.iloc[-args.live:]
+
+    engine, seeded = StreamingIndicators.from_history(seed_df)
+    update_seconds = []
+    rows = []
+    for close, volume in zip(live_df['Close'], live_df['Volume']):
+        started = time.perf_counter()
+        rows.append(engine.update(close, volume))
+        update_seconds.append(time.perf_counter() - started)
+    streamed = pd.concat([seeded, pd.DataFrame(rows, index=live_df.index, columns=INDICATOR_COLUMNS)])
+
+    failed = False
+    for kernels in ("pandas_ta", "numpy"):
+        print(f"\nbatch path: kernels={kernels!r} (pandas_ta {ta.version})")
+        differences = compare(streamed, add_technical_indicators(df.copy(), kernels=kernels))
+        print("parity: " + (f"FAILED for {', '.join(differences)}" if differences else "all columns match"))
+        failed = failed or bool(differences)
+
+    started = time.perf_counter()
+    for end in range(len(df) - 20, len(df)):
+        add_technical_indicators(df.iloc[:end].copy())
+    recompute = (time.perf_counter() - started) / 20
+    per_update = np.median(update_seconds)
+    print(f"\nstreaming update: {per_update * 1e6:8.1f} us/bar")
+    print(f"batch recompute:  {recompute * 1e6:8.1f} us/bar over {len(df)} bars ({recompute / per_update:.0f}x)")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
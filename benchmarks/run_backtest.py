@@ -0,0 +1,52 @@
+"""
+Walk-forward backtest of the forecast engines, fully offline.
+
+Uses a ticker's history from the local price store when --ticker is given,
+otherwise a synthetic series. Run from the project root:
+    python benchmarks/run_backtest.py [--ticker AAPL] [--engines prophet fast] [--window 500 --step 30]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.backtester import synthetic_price_series, walk_forward_backtest, summarize_backtest
+from backend.price_store import PriceStore
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticker", help="read this ticker from the local price store instead of a synthetic series")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=int, default=1000)
+    parser.add_argument("--engines", nargs="+", default=["prophet", "fast"])
+    parser.add_argument("--window", type=int, default=500)
+    parser.add_argument("--step", type=int, default=30)
+    parser.add_argument("--horizon", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+
+    if args.ticker:
+        hist = PriceStore().read_cached(args.ticker)
+        if hist.empty:
+            sys.exit(f"No cached history for {args.ticker}; open it in the Analyser first.")
+    else:
+        hist = synthetic_price_series(args.seed, days=args.days)
+
+    print(f"{len(hist)} bars, window {args.window}, step {args.step}, horizon {args.horizon}")
+    print(f"{'engine':>8} {'windows':>8} {'bars':>6} {'MAPE %':>8} {'coverage %':>11} {'fit s':>8} {'wall s':>8}")
+    for engine in args.engines:
+        started = time.perf_counter()
+        results = walk_forward_backtest(hist, engine=engine, train_window=args.window, step=args.step,
+                                        horizon=args.horizon, max_workers=args.workers)
+        wall = time.perf_counter() - started
+        summary = summarize_backtest(results)
+        print(f"{engine:>8} {summary['windows']:>8} {summary['scored_bars']:>6} {summary['mean_mape']:>8.2f} {summary['mean_coverage']:>11.1f} "
+              f"{summary['mean_fit_seconds']:>8.3f} {wall:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,12 @@ if not st.session_state.get("logged_in", False):
 # Add parent directory to path for backend imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from backend.data_handler import get_stock_data, get_financial_news, get_watchlist, add_to_watchlist, remove_from_watchlist
-from backend.ai_analyzer import analyze_sentiment, get_ai_summary, get_ai_comparison
-from backend.predictor import get_price_prediction
+from backend.data_handler import get_analysis_data, get_watchlist, add_to_watchlist, remove_from_watchlist
+from backend.ai_analyzer import stream_ai_summary, stream_ai_comparison
+from backend.predictor import get_price_prediction, get_batch_predictions
 from backend.technical_analyzer import add_technical_indicators
 from backend.portfolio_manager import add_to_portfolio
+from backend.metadata_cache import get_ticker_info
 
 # Configure page layout
 st.set_page_config(page_title="QuantView AI Analyser", page_icon="📈", layout="wide")
@@ -46,9 +47,10 @@ def display_stock_details(container, ticker_data):
     uid = st.session_state.get('uid')
     ticker = ticker_data['ticker']
     is_in_watchlist = ticker in st.session_state.get('watchlist', [])
+    info = get_ticker_info(ticker)
 
     col1_header, col2_header = container.columns([3, 1])
-    col1_header.header(f"{ticker_data['info'].info.get('longName', ticker)}")
+    col1_header.header(f"{info.get('longName', ticker)}")
 
     if is_in_watchlist:
         col2_header.button("⭐ In Watchlist", key=f"remove_{ticker}", on_click=handle_remove, args=(uid, ticker), use_container_width=True)
@@ -62,7 +64,7 @@ def display_stock_details(container, ticker_data):
         else:
             c1, c2 = st.columns(2)
             c1.metric("Last Close", f"${ticker_data['hist']['Close'].iloc[-1]:,.2f}")
-            c2.metric("Market Cap", f"${ticker_data['info'].info.get('marketCap', 0) / 1e9:,.2f}B")
+            c2.metric("Market Cap", f"${info.get('marketCap', 0) / 1e9:,.2f}B")
         st.divider()
 
         st.subheader("Add to Portfolio")
@@ -113,6 +115,10 @@ with st.sidebar:
         indicator_options = ["SMA 20", "SMA 50", "EMA 20", "Bollinger Bands", "RSI", "MACD", "OBV"]
         selected_indicators = st.multiselect("Select technical indicators:", indicator_options, default=["SMA 20", "SMA 50"])
 
+    st.header("Forecast Engine")
+    forecast_engines = {"Prophet": "prophet", "Fast": "fast", "Monte Carlo": "monte_carlo"}
+    forecast_engine = st.radio("Price prediction model:", list(forecast_engines), horizontal=True, help="Fast uses exponential smoothing and returns in milliseconds; Monte Carlo shows the 10th-90th percentile of 10,000 simulated price paths; Prophet is slower but models seasonality.")
+
     st.header("Date Range")
     today = date.today()
     start_date = st.date_input("Start Date", today - timedelta(days=730))
@@ -139,20 +145,10 @@ if analyze_button:
             st.warning("Please enter at least one valid stock ticker.")
             st.session_state['analysis_data'] = []
         else:
-            all_data = []
             with st.spinner(f"Fetching and analysing {', '.join(tickers)}..."):
-                for ticker in tickers:
-                    stock_info, stock_hist = get_stock_data(ticker, start_date, end_date)
-                    if stock_info:
-                        news = get_financial_news(ticker)
-                        all_data.append({
-                            "ticker": ticker, "info": stock_info, 
-                            "hist": stock_hist,
-                            "news": news, 
-                            "sentiment": analyze_sentiment(news)
-                        })
-                    else:
-                        st.error(f"Could not retrieve data for {ticker}.")
+                all_data, fetch_errors = get_analysis_data(tickers, start_date, end_date)
+            for error in fetch_errors.values():
+                st.error(error)
             
             st.session_state['analysis_data'] = all_data
 
@@ -168,7 +164,7 @@ if st.session_state.get('analysis_data') and len(st.session_state['analysis_data
             st.header(f"Advanced Chart for {all_data[0]['ticker']}")
             stock_df = all_data[0]['hist'].copy()
             if not stock_df.empty:
-                stock_df = add_technical_indicators(stock_df)
+                stock_df = add_technical_indicators(stock_df, selected_indicators)
                 fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.6, 0.2, 0.2])
                 fig.add_trace(go.Candlestick(x=stock_df.index, open=stock_df['Open'], high=stock_df['High'],low=stock_df['Low'], close=stock_df['Close'], name='Price'), row=1, col=1)
 
@@ -213,11 +209,9 @@ if st.session_state.get('analysis_data') and len(st.session_state['analysis_data
     with main_tabs[1]:
         if len(all_data) > 1:
             st.info("AI Insights below compare the first two selected stocks.")
-            ai_comp = get_ai_comparison(all_data[0], all_data[1], investor_level)
-            st.markdown(ai_comp)
+            st.write_stream(stream_ai_comparison(all_data[0], all_data[1], investor_level))
         else:
-            ai_sum = get_ai_summary(all_data[0]['news'], all_data[0]['ticker'], investor_level)
-            st.markdown(ai_sum)
+            st.write_stream(stream_ai_summary(all_data[0]['news'], all_data[0]['ticker'], investor_level))
 
     with main_tabs[2]:
         if len(all_data) == 1:
@@ -228,18 +222,27 @@ if st.session_state.get('analysis_data') and len(st.session_state['analysis_data
             if len(all_data) > 1: display_stock_details(col2, all_data[1])
             
     with main_tabs[3]:
-        st.header(f"30-Day Price Forecast for {all_data[0]['ticker']}")
-        if len(all_data) > 1:
-            st.warning("Price prediction is only available when analysing a single stock.")
+        forecast_data = [data for data in all_data if not data['hist'].empty]
+        if len(forecast_data) == 1:
+            ticker = forecast_data[0]['ticker']
+            with st.spinner("Generating price forecast..."): forecasts = {ticker: get_price_prediction(forecast_data[0]['hist'], ticker, engine=forecast_engines[forecast_engine])}
+            forecast_errors = {}
         else:
-            with st.spinner("Generating price forecast..."): forecast = get_price_prediction(all_data[0]['hist'])
+            with st.spinner(f"Generating price forecasts for {len(forecast_data)} stocks..."):
+                forecasts, forecast_errors = get_batch_predictions({data['ticker']: data['hist'] for data in forecast_data}, engine=forecast_engines[forecast_engine])
+
+        for data in all_data:
+            st.header(f"30-Day Price Forecast for {data['ticker']}")
+            forecast = forecasts.get(data['ticker'])
             if forecast is not None:
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(x=forecast['ds'], y=forecast['yhat'], mode='lines', name='Forecast', line=dict(color='royalblue', dash='dash')))
                 fig.add_trace(go.Scatter(x=forecast['ds'], y=forecast['yhat_upper'], fill=None, mode='lines', line=dict(color='lightgray'), showlegend=False))
                 fig.add_trace(go.Scatter(x=forecast['ds'], y=forecast['yhat_lower'], fill='tonexty', mode='lines', line=dict(color='lightgray'), name='Uncertainty'))
-                fig.add_trace(go.Scatter(x=all_data[0]['hist'].index, y=all_data[0]['hist']['Close'], mode='lines', name='Actual Price', line=dict(color='black')))
-                fig.update_layout(title='Price Forecast with Uncertainty Interval', yaxis_title='Price (USD)'); st.plotly_chart(fig, use_container_width=True)
+                fig.add_trace(go.Scatter(x=data['hist'].index, y=data['hist']['Close'], mode='lines', name='Actual Price', line=dict(color='black')))
+                fig.update_layout(title='Price Forecast with Uncertainty Interval', yaxis_title='Price (USD)'); st.plotly_chart(fig, use_container_width=True, key=f"forecast_{data['ticker']}")
+            elif data['ticker'] in forecast_errors and "historical data" not in forecast_errors[data['ticker']]:
+                st.warning(f"Could not generate a forecast: {forecast_errors[data['ticker']]}")
             else: st.warning("Could not generate a forecast. Not enough historical data.")
 else:
     st.info("Enter stock(s) and click 'Analyse' to begin.")
\ No newline at end of file
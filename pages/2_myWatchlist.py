@@ -10,6 +10,7 @@ if not st.session_state.get("logged_in", False):
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from backend.data_handler import get_watchlist, get_stock_data, remove_from_watchlist
+from backend.metadata_cache import get_ticker_info
 
 # --- Page Configuration ---
 st.set_page_config(page_title="My Watchlist", page_icon="⭐", layout="wide")
@@ -59,7 +60,7 @@ else:
                 stock_info, stock_hist = get_stock_data(ticker, start_date=(today - timedelta(days=5)), end_date=today)
                 if stock_info and not stock_hist.empty:
                     st.session_state.watchlist_data[ticker] = {
-                        'info': stock_info.info,
+                        'info': get_ticker_info(ticker),
                         'price': stock_hist['Close'].iloc[-1]
                     }
 
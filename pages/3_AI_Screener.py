@@ -9,7 +9,11 @@ if not st.session_state.get("logged_in", False):
     st.stop()
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from backend.screener import run_ai_screener
+from backend.fundamentals_store import fundamentals_store
+from backend.screener import get_fundamentals_progress, get_fundamentals_status, get_screen_cache_status, run_technical_screener, stream_ai_screener
+
+# Keep the on-disk fundamentals snapshot fresh without blocking the page
+fundamentals_store.start_background_refresh()
 
 # --- Page Configuration ---
 st.set_page_config(page_title="AI Stock Screener", page_icon="🤖", layout="wide")
@@ -23,6 +27,11 @@ with st.sidebar:
 
 st.markdown(f" # AI Stock Screener")
 st.caption("Use plain simple english to find stocks based on fundamental criteria!")
+st.caption(get_fundamentals_status())
+snapshot_progress = get_fundamentals_progress()
+if snapshot_progress:
+    st.progress(*snapshot_progress)
+st.caption(get_screen_cache_status())
 st.divider()
 
 # --- Screener UI ---
@@ -35,14 +44,51 @@ prompt = st.text_input(
 
 if st.button("Screen Stocks", type="primary"):
     if prompt:
-        with st.spinner("Running AI screener... This may take a moment as it processes data for multiple stocks."):
-            summary, results_df = run_ai_screener(prompt)
-        
+        progress_bar = st.progress(0.0, text="Compiling your request...")
+        results_table = st.empty()
+        live_rows = []
+        for event in stream_ai_screener(prompt):
+            if event['type'] == 'matches':
+                # Show matches as each chunk of the universe is screened
+                progress_bar.progress(event['done'] / event['total'], text=f"Screened {event['done']}/{event['total']} stocks...")
+                if not event['rows'].empty:
+                    live_rows.append(event['rows'])
+                    results_table.dataframe(pd.concat(live_rows, ignore_index=True), use_container_width=True)
+            elif event['type'] == 'done':
+                progress_bar.empty()
+                st.success(event['summary'])
+                if not event['results'].empty:
+                    results_table.dataframe(event['results'], use_container_width=True)
+                else:
+                    results_table.empty()
+                    st.warning("No stocks in the S&P 500 matched your criteria.")
+            else:
+                progress_bar.empty()
+                st.error(event['summary'])
+    else:
+        st.warning("Please enter your criteria in the text box above.")
+
+st.divider()
+
+# --- Technical Screener UI ---
+st.subheader("Technical Screener")
+st.caption("Filter the whole S&P 500 on price signals. Columns: Close, Volume, SMA_20, SMA_50, EMA_20, RSI_14, BB_Position, Above_SMA_50, Golden_Cross, Death_Cross")
+
+technical_query = st.text_input(
+    "Enter a technical filter:",
+    placeholder="e.g., RSI_14 < 30 and Close > SMA_50"
+)
+
+if st.button("Run Technical Screen"):
+    if technical_query:
+        with st.spinner("Computing technical signals across the S&P 500..."):
+            summary, results_df = run_technical_screener(technical_query)
+
         st.success(summary)
-        
+
         if not results_df.empty:
             st.dataframe(results_df, use_container_width=True)
         else:
-            st.warning("No stocks in the S&P 500 sample matched your criteria.")
+            st.warning("No stocks in the S&P 500 matched your filter.")
     else:
-        st.warning("Please enter your criteria in the text box above.")
\ No newline at end of file
+        st.warning("Please enter a filter in the text box above.")
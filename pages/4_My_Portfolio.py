@@ -9,7 +9,7 @@ if not st.session_state.get("logged_in", False):
     st.stop()
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from backend.portfolio_manager import get_portfolio, get_live_prices, remove_from_portfolio
+from backend.portfolio_manager import get_portfolio, get_live_prices, describe_price_time, remove_from_portfolio
 
 # --- Page Configuration ---
 st.set_page_config(page_title="My Portfolio", page_icon="💼", layout="wide")
@@ -36,7 +36,7 @@ else:
     df = pd.DataFrame(portfolio_holdings)
     unique_tickers = df['ticker'].unique().tolist()
     with st.spinner("Fetching live market prices..."):
-        live_prices = get_live_prices(unique_tickers)
+        live_prices, prices_as_of = get_live_prices(unique_tickers)
 
     df['Current Price'] = df['ticker'].map(live_prices).fillna(0)
     df['Cost Basis'] = df['shares'] * df['purchase_price']
@@ -48,6 +48,7 @@ else:
     total_pl = df['P/L'].sum()
     
     st.header("Portfolio Summary")
+    st.caption(describe_price_time(prices_as_of))
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Market Value", f"${total_market_value:,.2f}")
     col2.metric("Total Cost Basis", f"${total_cost_basis:,.2f}")
@@ -1,7 +1,6 @@
 import streamlit as st
 import sys
 import os
-import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -13,7 +12,8 @@ if not st.session_state.get("logged_in", False):
 # Add parent directory to path for backend imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from backend.playground_handler import get_playground_portfolio, execute_trade, generate_health_report
-from backend.portfolio_manager import get_live_prices
+from backend.portfolio_manager import get_live_prices, get_trade_price, describe_price_time
+from backend.metadata_cache import get_ticker_info
 
 # Configure page layout
 st.set_page_config(page_title="Stock Simulator", page_icon="🎮", layout="wide")
@@ -48,8 +48,9 @@ if playground_portfolio is None:
 
 # Calculate portfolio metrics
 holdings_df = pd.DataFrame(playground_portfolio['holdings'])
+prices_as_of = None
 if not holdings_df.empty:
-    live_prices = get_live_prices(holdings_df['ticker'].unique().tolist())
+    live_prices, prices_as_of = get_live_prices(holdings_df['ticker'].unique().tolist())
     holdings_df['current_price'] = holdings_df['ticker'].map(live_prices).fillna(holdings_df['purchase_price'])
     holdings_df['market_value'] = holdings_df['shares'] * holdings_df['current_price']
     holdings_df['gain_loss'] = holdings_df['market_value'] - (holdings_df['shares'] * holdings_df['purchase_price'])
@@ -63,6 +64,8 @@ total_gain_loss = holdings_df['gain_loss'].sum() if not holdings_df.empty else 0
 # Display page header
 st.markdown(" # Stock Simulator")
 st.caption("Learn to invest with a $100,000 virtual portfolio. No real money involved!")
+if not holdings_df.empty:
+    st.caption(describe_price_time(prices_as_of))
 st.divider()
 
 # Portfolio metrics dashboard
@@ -85,14 +88,20 @@ with main_col1:
 
         if ticker_input:
             try:
-                stock_info = yf.Ticker(ticker_input).info
+                # Name and logo may come from the cached info; the trade price is always fetched fresh
+                stock_info = get_ticker_info(ticker_input)
                 company_name = stock_info.get('longName', 'N/A')
-                current_price = stock_info.get('regularMarketPrice', 0)
+                current_price, price_as_of = get_trade_price(ticker_input)
                 with trade_assistant.container(border=True):
                     logo_col, name_col = st.columns([1, 4])
                     if 'logo_url' in stock_info: logo_col.image(stock_info['logo_url'], width=50)
                     name_col.markdown(f"**{company_name}**")
-                    name_col.markdown(f"**Current Price:** `${current_price:,.2f}`")
+                    if current_price is None:
+                        name_col.warning("Could not get a current price for this symbol.")
+                        current_price = 0
+                    else:
+                        name_col.markdown(f"**Current Price:** `${current_price:,.2f}`")
+                        name_col.caption(describe_price_time(price_as_of))
             except Exception:
                 trade_assistant.warning("Could not fetch info for this symbol.")
                 current_price = 0
@@ -112,6 +121,7 @@ with main_col1:
             if submit_trade:
                 if not ticker_input: st.error("Please enter a stock symbol.")
                 elif quantity <= 0: st.error("Please enter a valid quantity.")
+                elif current_price <= 0: st.error("No current price is available for this symbol.")
                 else:
                     with st.spinner("Placing trade..."):
                         success, message = execute_trade(uid, ticker_input, quantity, current_price, action.lower())